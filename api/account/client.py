@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import httpx
@@ -9,10 +10,11 @@ from api.account.dtos import (
     GetAccountResponse,
     GetAccountsResponse,
 )
+from api.shared.concurrency import get_batches, run_concurrently
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable
     from typing import Self
 
     from wlss.account.types import AccountLogin
@@ -33,7 +35,7 @@ class Account:
         response = await self._client.post("/accounts", json=request_data.model_dump())
         response.raise_for_status()
         assert response.status_code == httpx.codes.CREATED
-        return CreateAccountResponse.model_validate(response.json())
+        return CreateAccountResponse.model_validate_json(response.content)
 
     async def get_account(
         self: Self,
@@ -43,7 +45,7 @@ class Account:
         response = await self._client.get(f"/accounts/{account_id.value}", headers={"Authorization": f"Bearer {token}"})
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetAccountResponse.model_validate(response.json())
+        return GetAccountResponse.model_validate_json(response.content)
 
     async def get_accounts(
         self: Self,
@@ -63,7 +65,22 @@ class Account:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetAccountsResponse.model_validate(response.json())
+        return GetAccountsResponse.model_validate_json(response.content)
+
+    async def get_many_accounts(
+        self: Self,
+        account_ids: Iterable[Id],
+        token: str,
+        batch_size: int = 100,
+        concurrency: int = 10,
+    ) -> AsyncIterator[GetAccountsResponse]:
+        """Get many accounts with a request per `batch_size` accounts, responses are yielded as they come."""
+        calls = [
+            functools.partial(self.get_accounts, token=token, account_ids=batch)
+            for batch in get_batches(account_ids, batch_size)
+        ]
+        async for response in run_concurrently(calls, concurrency):
+            yield response
 
     async def match_account_login(self: Self, request_data: MatchAccountLoginRequest) -> bool:
         response = await self._client.post(
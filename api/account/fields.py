@@ -2,23 +2,24 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
-from pydantic.json_schema import GenerateJsonSchema
+from pydantic import PlainSerializer, PlainValidator
 from pydantic_core.core_schema import str_schema
 from wlss.account.types import AccountEmail, AccountLogin, AccountPassword
 
+from api.shared.fields import LazyJsonSchema
+
 
 AccountEmailField = Annotated[
     AccountEmail,
     PlainValidator(AccountEmail),
     PlainSerializer(lambda v: v.value, return_type=str),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         str_schema(
             max_length=AccountEmail.LENGTH_MAX.value,
             min_length=AccountEmail.LENGTH_MIN.value,
             pattern=AccountEmail.REGEXP.pattern,
         ),
-    )),
+    ),
 ]
 
 
@@ -26,13 +27,13 @@ AccountLoginField = Annotated[
     AccountLogin,
     PlainValidator(AccountLogin),
     PlainSerializer(lambda v: v.value, return_type=str),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         str_schema(
             max_length=AccountLogin.LENGTH_MAX.value,
             min_length=AccountLogin.LENGTH_MIN.value,
             pattern=AccountLogin.REGEXP.pattern,
         ),
-    )),
+    ),
 ]
 
 
@@ -40,10 +41,10 @@ AccountPasswordField = Annotated[
     AccountPassword,
     PlainValidator(AccountPassword),
     PlainSerializer(lambda v: v.value, return_type=str),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         str_schema(
             max_length=AccountPassword.LENGTH_MAX.value,
             min_length=AccountPassword.LENGTH_MIN.value,
         ),
-    )),
+    ),
 ]
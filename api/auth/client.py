@@ -24,7 +24,7 @@ class Auth:
         response = await self._client.post("/sessions", json=request_data.model_dump())
         response.raise_for_status()
         assert response.status_code == httpx.codes.CREATED
-        return CreateSessionResponse.model_validate(response.json())
+        return CreateSessionResponse.model_validate_json(response.content)
 
     async def refresh_tokens(self: Self, account_id: Id, session_id: UUID, token: str) -> RefreshTokensResponse:
         response = await self._client.post(
@@ -33,7 +33,7 @@ class Auth:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.CREATED
-        return RefreshTokensResponse.model_validate(response.json())
+        return RefreshTokensResponse.model_validate_json(response.content)
 
     async def delete_session(self: Self, account_id: Id, session_id: UUID, token: str) -> None:
         response = await self._client.delete(
@@ -10,6 +10,7 @@ from api.file.client import File
 from api.friendship.client import Friendship
 from api.health.client import Health
 from api.profile.client import Profile
+from api.shared.transport import RetryTransport
 from api.wish.client import Wish
 
 
@@ -19,13 +20,35 @@ if TYPE_CHECKING:
 
 
 class Api:
-    def __init__(
+    """Client of the app.
+
+    Connection pool of the client is configured with `limits`, HTTP/2 is used if `http2` is set and "h2" package is
+    installed (for example with `pip install httpx[http2]`). Both are ignored if `app` or `transport` is passed.
+    Idempotent requests which failed because of network errors or overloaded server are sent again up to `retries`
+    times with exponential backoff, which starts from `backoff` seconds.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
         self: Self,
         app: Callable[..., Any] | None = None,
         base_url: str = "",
         timeout: httpx.Timeout = httpx.Timeout(30),  # noqa: B008
+        transport: httpx.AsyncBaseTransport | None = None,
+        *,
+        backoff: float = 0.5,
+        http2: bool = False,
+        limits: httpx.Limits = httpx.Limits(max_connections=100, max_keepalive_connections=20),  # noqa: B008
+        retries: int = 0,
     ) -> None:
-        self._client = httpx.AsyncClient(app=app, base_url=base_url, timeout=timeout)
+        if transport is None:
+            transport = (
+                httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+                if app is None
+                else httpx.ASGITransport(app=app)
+            )
+        if retries > 0:
+            transport = RetryTransport(transport, retries=retries, backoff=backoff)
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=timeout, transport=transport)
 
     async def __aenter__(self: Self) -> Client:
         return Client(await self._client.__aenter__())
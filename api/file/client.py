@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import httpx
 
 from api.file.constants import MEGABYTE
 from api.file.dtos import CreateFileResponse, GetFileResponse
+from api.shared.concurrency import run_concurrently
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
     from pathlib import Path
     from typing import Self
     from uuid import UUID
@@ -31,10 +34,26 @@ class File:
 
         response.raise_for_status()
         assert response.status_code == httpx.codes.CREATED
-        return CreateFileResponse.model_validate(response.json())
+        return CreateFileResponse.model_validate_json(response.content)
 
-    async def get_file(self: Self, file_id: UUID, tmp_file_path: Path) -> GetFileResponse:
-        async with self._client.stream("GET", f"/files/{file_id}") as response:
+    async def upload_many(
+        self: Self,
+        requests_data: Iterable[CreateFileRequest],
+        token: str,
+        concurrency: int = 10,
+    ) -> AsyncIterator[tuple[CreateFileRequest, CreateFileResponse]]:
+        """Upload many files with a request per file, responses are yielded as they come."""
+
+        async def upload(request_data: CreateFileRequest) -> tuple[CreateFileRequest, CreateFileResponse]:
+            return request_data, await self.create_file(request_data, token)
+
+        calls = [functools.partial(upload, request_data) for request_data in requests_data]
+        async for result in run_concurrently(calls, concurrency):
+            yield result
+
+    async def get_file(self: Self, file_id: UUID, tmp_file_path: Path, size: int | None = None) -> GetFileResponse:
+        params = {} if size is None else {"size": size}
+        async with self._client.stream("GET", f"/files/{file_id}", params=params) as response:
             if response.is_error:
                 await response.aread()
                 response.raise_for_status()
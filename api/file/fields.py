@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from typing import Annotated, TYPE_CHECKING
 
-from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
-from pydantic.json_schema import GenerateJsonSchema
+from pydantic import PlainSerializer, PlainValidator
 from pydantic_core.core_schema import int_schema, str_schema
 from wlss.file.types import FileName, FileSize
 
+from api.shared.fields import LazyJsonSchema
+
 
 if TYPE_CHECKING:
     from typing import Any
@@ -16,12 +17,12 @@ FileNameField = Annotated[
     FileName,
     PlainValidator(FileName),
     PlainSerializer(lambda v: v.value, return_type=str),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         str_schema(
             max_length=FileName.LENGTH_MAX.value,
             min_length=FileName.LENGTH_MIN.value,
         ),
-    )),
+    ),
 ]
 
 
@@ -35,10 +36,10 @@ FileSizeField = Annotated[
     FileSize,
     PlainValidator(_validate_file_size),
     PlainSerializer(lambda v: v.value, return_type=int),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         int_schema(
             ge=FileSize.VALUE_MIN.value,
             le=FileSize.VALUE_MAX.value,
         ),
-    )),
+    ),
 ]
@@ -7,8 +7,11 @@ import httpx
 from api.friendship.dtos import (
     AcceptFriendshipRequestResponse,
     CreateFriendshipRequestResponse,
+    FriendshipRequestsBatchResponse,
     GetAccountFriendshipsResponse,
     GetFriendshipRequestsResponse,
+    GetFriendshipSuggestionsResponse,
+    GetMutualFriendsResponse,
     RejectFriendshipRequestResponse,
 )
 
@@ -32,7 +35,7 @@ class Friendship:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetAccountFriendshipsResponse.model_validate(response.json())
+        return GetAccountFriendshipsResponse.model_validate_json(response.content)
 
     async def create_friendship_request(
         self: Self,
@@ -46,7 +49,7 @@ class Friendship:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.CREATED
-        return CreateFriendshipRequestResponse.model_validate(response.json())
+        return CreateFriendshipRequestResponse.model_validate_json(response.content)
 
     async def cancel_friendship_request(self: Self, request_id: Id, token: str) -> None:
         response = await self._client.delete(
@@ -62,7 +65,7 @@ class Friendship:
             headers={"Authorization": f"Bearer {token}"},
         )
         response.raise_for_status()
-        return AcceptFriendshipRequestResponse.model_validate(response.json())
+        return AcceptFriendshipRequestResponse.model_validate_json(response.content)
 
     async def reject_friendship_request(self: Self, request_id: Id, token: str) -> RejectFriendshipRequestResponse:
         response = await self._client.put(
@@ -71,7 +74,49 @@ class Friendship:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return RejectFriendshipRequestResponse.model_validate(response.json())
+        return RejectFriendshipRequestResponse.model_validate_json(response.content)
+
+    async def cancel_friendship_requests(
+        self: Self,
+        request_ids: list[Id],
+        token: str,
+    ) -> FriendshipRequestsBatchResponse:
+        response = await self._client.delete(
+            "/friendships/requests",
+            params={"request_id": [request_id.value for request_id in request_ids]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response.raise_for_status()
+        assert response.status_code == httpx.codes.OK
+        return FriendshipRequestsBatchResponse.model_validate_json(response.content)
+
+    async def accept_friendship_requests(
+        self: Self,
+        request_ids: list[Id],
+        token: str,
+    ) -> FriendshipRequestsBatchResponse:
+        response = await self._client.put(
+            "/friendships/requests/accepted",
+            params={"request_id": [request_id.value for request_id in request_ids]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response.raise_for_status()
+        assert response.status_code == httpx.codes.OK
+        return FriendshipRequestsBatchResponse.model_validate_json(response.content)
+
+    async def reject_friendship_requests(
+        self: Self,
+        request_ids: list[Id],
+        token: str,
+    ) -> FriendshipRequestsBatchResponse:
+        response = await self._client.put(
+            "/friendships/requests/rejected",
+            params={"request_id": [request_id.value for request_id in request_ids]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response.raise_for_status()
+        assert response.status_code == httpx.codes.OK
+        return FriendshipRequestsBatchResponse.model_validate_json(response.content)
 
     async def get_friendship_requests(self: Self, account_id: Id, token: str) -> GetFriendshipRequestsResponse:
         response = await self._client.get(
@@ -80,7 +125,40 @@ class Friendship:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetFriendshipRequestsResponse.model_validate(response.json())
+        return GetFriendshipRequestsResponse.model_validate_json(response.content)
+
+    async def get_friendship_suggestions(
+        self: Self,
+        account_id: Id,
+        token: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> GetFriendshipSuggestionsResponse:
+        response = await self._client.get(
+            f"/accounts/{account_id.value}/friendships/suggestions",
+            params={"limit": limit, "offset": offset},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response.raise_for_status()
+        assert response.status_code == httpx.codes.OK
+        return GetFriendshipSuggestionsResponse.model_validate_json(response.content)
+
+    async def get_mutual_friends(  # pylint: disable=too-many-arguments
+        self: Self,
+        account_id: Id,
+        other_id: Id,
+        token: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> GetMutualFriendsResponse:
+        response = await self._client.get(
+            f"/accounts/{account_id.value}/friendships/mutual/{other_id.value}",
+            params={"limit": limit, "offset": offset},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response.raise_for_status()
+        assert response.status_code == httpx.codes.OK
+        return GetMutualFriendsResponse.model_validate_json(response.content)
 
     async def delete_friendships(self: Self, account_id: Id, friend_id: Id, token: str) -> None:
         response = await self._client.delete(
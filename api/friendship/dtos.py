@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pydantic import Field
 
-from api.friendship.enums import FriendshipRequestStatus
+from api.friendship.enums import BatchResult, FriendshipRequestStatus
 from api.shared.fields import IdField, UtcDatetimeField
 from api.shared.schemas import Schema
 
@@ -52,3 +52,22 @@ class GetFriendshipRequestsResponse(Schema):
         receiver_id: IdField = Field(..., example=42)
         sender_id: IdField = Field(..., example=18)
         status: FriendshipRequestStatus = Field(..., example="PENDING")
+
+
+class GetFriendshipSuggestionsResponse(Schema):
+    suggestions: list[_FriendshipSuggestion]
+    class _FriendshipSuggestion(Schema):  # noqa: E301
+        account_id: IdField = Field(..., example=42)
+        mutual_friends: int = Field(..., example=3)
+
+
+class GetMutualFriendsResponse(Schema):
+    account_ids: list[IdField] = Field(..., example=[18, 23])
+    count: int = Field(..., example=7)
+
+
+class FriendshipRequestsBatchResponse(Schema):
+    results: list[_Result]
+    class _Result(Schema):  # noqa: E301
+        request_id: IdField = Field(..., example=7)
+        result: BatchResult = Field(..., example="DONE")
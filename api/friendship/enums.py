@@ -3,7 +3,15 @@ from __future__ import annotations
 from api.shared.enum import Enum, types
 
 
+@types(str)
+class BatchResult(Enum):
+    DONE = "DONE"
+    NOT_ALLOWED = "NOT_ALLOWED"
+    NOT_FOUND = "NOT_FOUND"
+
+
 @types(str)
 class FriendshipRequestStatus(Enum):
+    ACCEPTED = "ACCEPTED"  # request is accepted and deleted, it can be only returned right after creation
     PENDING = "PENDING"
     REJECTED = "REJECTED"
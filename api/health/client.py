@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from typing import Self
 
 
-class Health:  # pylint: disable=too-few-public-methods
+class Health:
     def __init__(self: Self, client: httpx.AsyncClient) -> None:
         self._client = client
 
@@ -19,4 +19,10 @@ class Health:  # pylint: disable=too-few-public-methods
         response = await self._client.get("/health")
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return HealthResponse.model_validate(response.json())
+        return HealthResponse.model_validate_json(response.content)
+
+    async def get_metrics(self: Self) -> str:
+        response = await self._client.get("/metrics")
+        response.raise_for_status()
+        assert response.status_code == httpx.codes.OK
+        return response.text
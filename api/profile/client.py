@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import httpx
 
 from api.profile.dtos import GetProfileResponse, GetProfilesResponse, SearchProfilesResponse, UpdateProfileResponse
+from api.shared.concurrency import get_batches, run_concurrently
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
     from typing import Self
 
     from wlss.shared.types import Id
@@ -26,7 +29,7 @@ class Profile:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetProfileResponse.model_validate(response.json())
+        return GetProfileResponse.model_validate_json(response.content)
 
     async def update_profile(
         self: Self,
@@ -41,7 +44,7 @@ class Profile:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return UpdateProfileResponse.model_validate(response.json())
+        return UpdateProfileResponse.model_validate_json(response.content)
 
     async def get_profiles(self: Self, account_ids: list[Id], token: str) -> GetProfilesResponse:
         response = await self._client.get(
@@ -51,10 +54,25 @@ class Profile:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetProfilesResponse.model_validate(response.json())
+        return GetProfilesResponse.model_validate_json(response.content)
+
+    async def get_many_profiles(
+        self: Self,
+        account_ids: Iterable[Id],
+        token: str,
+        batch_size: int = 100,
+        concurrency: int = 10,
+    ) -> AsyncIterator[GetProfilesResponse]:
+        """Get profiles with a request per `batch_size` accounts, responses are yielded as they come."""
+        calls = [
+            functools.partial(self.get_profiles, account_ids=batch, token=token)
+            for batch in get_batches(account_ids, batch_size)
+        ]
+        async for response in run_concurrently(calls, concurrency):
+            yield response
 
     async def search_profiles(self: Self, token: str) -> SearchProfilesResponse:
         response = await self._client.post("/profiles/search", headers={"Authorization": f"Bearer {token}"})
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return SearchProfilesResponse.model_validate(response.json())
+        return SearchProfilesResponse.model_validate_json(response.content)
@@ -2,23 +2,24 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
-from pydantic.json_schema import GenerateJsonSchema
+from pydantic import PlainSerializer, PlainValidator
 from pydantic_core.core_schema import str_schema
 from wlss.profile.types import ProfileDescription, ProfileName
 
+from api.shared.fields import LazyJsonSchema
+
 
 ProfileDescriptionField = Annotated[
     ProfileDescription,
     PlainValidator(ProfileDescription),
     PlainSerializer(lambda v: v.value, return_type=str),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         str_schema(
             max_length=ProfileDescription.LENGTH_MAX.value,
             min_length=ProfileDescription.LENGTH_MIN.value,
             pattern=ProfileDescription.REGEXP.pattern,
         ),
-    )),
+    ),
 ]
 
 
@@ -26,11 +27,11 @@ ProfileNameField = Annotated[
     ProfileName,
     PlainValidator(ProfileName),
     PlainSerializer(lambda v: v.value, return_type=str),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         str_schema(
             max_length=ProfileName.LENGTH_MAX.value,
             min_length=ProfileName.LENGTH_MIN.value,
             pattern=ProfileName.REGEXP.pattern,
         ),
-    )),
+    ),
 ]
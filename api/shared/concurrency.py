@@ -0,0 +1,55 @@
+"""Concurrent sending of many requests by the client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+    from typing import Any
+
+
+T = TypeVar("T")
+
+
+async def run_concurrently(calls: Iterable[Callable[[], Awaitable[T]]], concurrency: int) -> AsyncIterator[T]:
+    """Run calls with at most `concurrency` of them at once and yield results in order of completion.
+
+    Calls are run by a fixed number of workers which take the next call from the iterable once the previous one is
+    completed, and results wait for the consumer in a queue of the same size. So memory used doesn't depend on the
+    number of calls, and the iterable may be a generator which makes calls lazily. The first exception is raised as is,
+    then the workers are cancelled and awaited, so no call is still running once iteration is stopped.
+    """
+    iterator = iter(calls)
+    # each item is a result or an exception of the call, or None once the worker has no calls to run
+    results: asyncio.Queue[tuple[Any, Exception | None] | None] = asyncio.Queue(concurrency)
+
+    async def work() -> None:
+        try:
+            for call in iterator:
+                await results.put((await call(), None))
+        except Exception as e:  # noqa: BLE001  # re-raised to the consumer
+            await results.put((None, e))
+        else:
+            await results.put(None)
+
+    workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+    try:
+        for _ in workers:
+            while (item := await results.get()) is not None:
+                result, error = item
+                if error is not None:
+                    raise error
+                yield result
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def get_batches(values: Iterable[T], size: int) -> list[list[T]]:
+    """Split values into batches of the given size, order of values is kept."""
+    items = list(values)
+    return [items[start:start + size] for start in range(0, len(items), size)]
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Annotated, TYPE_CHECKING
 from uuid import UUID
 
-from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
+from pydantic import PlainSerializer, PlainValidator
 from pydantic.json_schema import GenerateJsonSchema
 from pydantic_core.core_schema import datetime_schema, int_schema, uuid_schema
 from wlss.shared.types import Id, UtcDatetime
@@ -13,7 +13,27 @@ from api.shared.datetime import DATETIME_FORMAT
 
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Self
+
+    from pydantic import GetJsonSchemaHandler
+    from pydantic.json_schema import JsonSchemaValue
+    from pydantic_core.core_schema import CoreSchema
+
+
+class LazyJsonSchema:
+    """The same as `pydantic.WithJsonSchema`, but JSON schema is generated when it's requested for the first time.
+
+    JSON schema of fields is needed only to build OpenAPI schema, so there is no need to generate it on import.
+    """
+
+    def __init__(self: Self, core_schema: CoreSchema) -> None:
+        self.core_schema = core_schema
+        self._json_schema: JsonSchemaValue | None = None
+
+    def __get_pydantic_json_schema__(self: Self, _: CoreSchema, __: GetJsonSchemaHandler) -> JsonSchemaValue:
+        if self._json_schema is None:
+            self._json_schema = GenerateJsonSchema().generate(self.core_schema)
+        return self._json_schema
 
 
 def _validate_id(value: Any) -> Id:  # noqa: ANN401
@@ -28,11 +48,11 @@ IdField = Annotated[
     Id,
     PlainValidator(_validate_id),
     PlainSerializer(lambda v: v.value, return_type=int),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         int_schema(
             ge=Id.VALUE_MIN.value,
         ),
-    )),
+    ),
 ]
 
 
@@ -46,11 +66,11 @@ UtcDatetimeField = Annotated[
     UtcDatetime,
     PlainValidator(_validate_utcdatetime),  # noqa: SC200
     PlainSerializer(lambda v: v.value.strftime(DATETIME_FORMAT), return_type=str),
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         datetime_schema(
             tz_constraint="aware",
         ),
-    )),
+    ),
 ]
 
 
@@ -64,9 +84,9 @@ UuidField = Annotated[
     UUID,
     PlainValidator(_uuid_validator),
     PlainSerializer(lambda v: str(v), return_type=str),  # pylint: disable=unnecessary-lambda
-    WithJsonSchema(GenerateJsonSchema().generate(
+    LazyJsonSchema(
         uuid_schema(
             version=4,
         ),
-    )),
+    ),
 ]
@@ -0,0 +1,85 @@
+"""HTTP transport of the client which retries idempotent requests."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import TYPE_CHECKING
+
+import httpx
+
+
+if TYPE_CHECKING:
+    from typing import Final, Self
+
+
+# methods which can be sent again without changing the result, see RFC 9110, section 9.2.2
+IDEMPOTENT_METHODS: Final = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT"})
+
+# responses which mean that the server is overloaded or restarted, so the request is likely to succeed later
+RETRY_STATUS_CODES: Final = frozenset({
+    httpx.codes.TOO_MANY_REQUESTS,
+    httpx.codes.BAD_GATEWAY,
+    httpx.codes.SERVICE_UNAVAILABLE,
+    httpx.codes.GATEWAY_TIMEOUT,
+})
+
+# errors which happen before the request is handled or when connection is lost, other errors are not retried
+_RETRY_ERRORS: Final = (httpx.NetworkError, httpx.RemoteProtocolError, httpx.TimeoutException)
+# the timeout is not retried, since connection pool is exhausted by the client itself and retry only adds up load
+_NOT_RETRIED_ERRORS: Final = (httpx.PoolTimeout,)
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """HTTP transport which retries idempotent requests with exponential backoff.
+
+    Delay before the n-th retry is random between zero and `backoff * 2 ** (n - 1)` seconds, so clients which failed
+    at the same moment don't retry at the same moment too, but not longer than `max_delay` seconds. If server sends
+    "Retry-After" with number of seconds, then the delay is not shorter than that, and if it's longer than `max_delay`,
+    then the response is returned without retry. Response of the last attempt is returned as is.
+    """
+
+    def __init__(
+        self: Self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int,
+        backoff: float = 0.5,
+        max_delay: float = 30,
+    ) -> None:
+        self._transport = transport
+        self._retries = retries
+        self._backoff = backoff
+        self._max_delay = max_delay
+
+    async def handle_async_request(self: Self, request: httpx.Request) -> httpx.Response:
+        if request.method not in IDEMPOTENT_METHODS:
+            return await self._transport.handle_async_request(request)
+
+        for attempt in range(self._retries):
+            try:
+                response = await self._transport.handle_async_request(request)
+            except _NOT_RETRIED_ERRORS:
+                raise
+            except _RETRY_ERRORS:
+                await asyncio.sleep(self._get_delay(attempt))
+                continue
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            retry_after = _get_retry_after(response)
+            if retry_after > self._max_delay:  # server is not going to handle the request soon enough
+                return response
+            await response.aclose()
+            await asyncio.sleep(max(self._get_delay(attempt), retry_after))
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self: Self) -> None:
+        await self._transport.aclose()
+
+    def _get_delay(self: Self, attempt: int) -> float:
+        return random.uniform(0, min(self._backoff * 2 ** attempt, self._max_delay))  # noqa: S311
+
+
+def _get_retry_after(response: httpx.Response) -> float:
+    """Get delay requested by the server, date form of "Retry-After" is not used by the app, so it's ignored."""
+    value = response.headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else 0
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import httpx
 
+from api.shared.concurrency import run_concurrently
 from api.wish.dtos import (
     CreateWishBookingResponse,
     CreateWishResponse,
@@ -14,6 +16,7 @@ from api.wish.dtos import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
     from typing import Self
 
     from wlss.shared.types import Id
@@ -38,7 +41,7 @@ class Wish:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.CREATED
-        return CreateWishResponse.model_validate(response.json())
+        return CreateWishResponse.model_validate_json(response.content)
 
     async def update_wish(
         self: Self,
@@ -54,7 +57,7 @@ class Wish:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return UpdateWishResponse.model_validate(response.json())
+        return UpdateWishResponse.model_validate_json(response.content)
 
     async def delete_wish(self: Self, account_id: Id, wish_id: Id, token: str) -> None:
         response = await self._client.delete(
@@ -71,7 +74,22 @@ class Wish:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetAccountWishesResponse.model_validate(response.json())
+        return GetAccountWishesResponse.model_validate_json(response.content)
+
+    async def get_many_wishes(
+        self: Self,
+        account_ids: Iterable[Id],
+        token: str,
+        concurrency: int = 10,
+    ) -> AsyncIterator[tuple[Id, GetAccountWishesResponse]]:
+        """Get wishes of many accounts with a request per account, responses are yielded as they come."""
+
+        async def get_wishes(account_id: Id) -> tuple[Id, GetAccountWishesResponse]:
+            return account_id, await self.get_account_wishes(account_id, token)
+
+        calls = [functools.partial(get_wishes, account_id) for account_id in account_ids]
+        async for result in run_concurrently(calls, concurrency):
+            yield result
 
     async def create_wish_booking(
         self: Self,
@@ -87,7 +105,7 @@ class Wish:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.CREATED
-        return CreateWishBookingResponse.model_validate(response.json())
+        return CreateWishBookingResponse.model_validate_json(response.content)
 
     async def get_wish_bookings(self: Self, account_id: Id, token: str) -> GetWishBookingsResponse:
         response = await self._client.get(
@@ -96,7 +114,7 @@ class Wish:
         )
         response.raise_for_status()
         assert response.status_code == httpx.codes.OK
-        return GetWishBookingsResponse.model_validate(response.json())
+        return GetWishBookingsResponse.model_validate_json(response.content)
 
     async def delete_wish_booking(self: Self, account_id: Id, wish_id: Id, booking_id: Id, token: str) -> None:
         response = await self._client.delete(
@@ -0,0 +1,130 @@
+"""Measure friendship suggestions query on a synthetic graph of random friendships.
+
+Accounts and friendships are inserted in a transaction which is rolled back at the end, so database is left as is.
+Each friendship is stored as two rows (one for each direction), so the graph has about `--friendships` rows.
+
+Usage example:
+
+    WLSS_ENV=local/dev python -m benchmarks.friendship --accounts=50000 --friendships=1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from wlss.shared.types import Id
+
+from benchmarks.load.recording import get_percentile
+from src.account.models import Account
+from src.shared.database import POSTGRES_CONNECTION_URL
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+_INSERT_ACCOUNTS: Final = text("""
+    INSERT INTO account (id, created_at, email, login, updated_at)
+    SELECT id, now(), 'benchmark.' || id || '@mail.com', 'benchmark_' || id, now()
+    FROM generate_series(:first_id, :first_id + :accounts - 1) AS id
+    ;
+""")
+
+# pairs of random accounts, duplicates and self-friendships are skipped
+_INSERT_FRIENDSHIPS: Final = text("""
+    WITH pairs AS (
+        SELECT DISTINCT LEAST(account_id, friend_id) AS account_id, GREATEST(account_id, friend_id) AS friend_id
+        FROM (
+            SELECT
+                :first_id + floor(random() * :accounts)::int AS account_id,
+                :first_id + floor(random() * :accounts)::int AS friend_id
+            FROM generate_series(1, :pairs)
+        ) AS random_pairs
+        WHERE account_id != friend_id
+    )
+    INSERT INTO friendship (account_id, friend_id, created_at, updated_at)
+    SELECT account_id, friend_id, now(), now() FROM pairs
+    UNION ALL
+    SELECT friend_id, account_id, now(), now() FROM pairs
+    ;
+""")
+
+
+def _parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.friendship",
+        description="Measure friendship suggestions query on a synthetic graph.",
+    )
+    parser.add_argument("--accounts", type=int, default=50000, help="number of accounts (default: 50000)")
+    parser.add_argument(
+        "--friendships",
+        type=int,
+        default=1000000,
+        help="number of friendship rows, two rows per friendship (default: 1000000)",
+    )
+    parser.add_argument("--queries", type=int, default=100, help="number of measured queries (default: 100)")
+    parser.add_argument("--limit", type=int, default=20, help="number of suggestions per query (default: 20)")
+    parser.add_argument("--seed", type=float, default=0.5, help="seed of random graph, from -1 to 1 (default: 0.5)")
+    return parser.parse_args(args)
+
+
+async def _create_graph(connection: AsyncConnection, accounts: int, friendships: int, seed: float) -> int:
+    """Create graph of random friendships and return id of its first account."""
+    first_id = (await connection.execute(text("SELECT coalesce(max(id), 0) + 1 FROM account;"))).scalar_one()
+    await connection.execute(text("SELECT setseed(:seed);"), {"seed": seed})
+    await connection.execute(_INSERT_ACCOUNTS, {"first_id": first_id, "accounts": accounts})
+    await connection.execute(
+        _INSERT_FRIENDSHIPS,
+        {"first_id": first_id, "accounts": accounts, "pairs": friendships // 2},
+    )
+    await connection.execute(text("ANALYZE account, friendship;"))
+    return int(first_id)
+
+
+async def _run(arguments: argparse.Namespace) -> None:
+    engine = create_async_engine(POSTGRES_CONNECTION_URL)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            started_at = time.perf_counter()
+            first_id = await _create_graph(connection, arguments.accounts, arguments.friendships, arguments.seed)
+            print(f"graph is created in {time.perf_counter() - started_at:.1f} s")  # noqa: T201
+
+            session = AsyncSession(bind=connection)
+            rng = random.Random(arguments.seed)  # noqa: S311
+            latencies: list[float] = []  # seconds
+            suggestions: list[int] = []  # number of suggestions returned by each query
+            for _ in range(arguments.queries):
+                account = Account(id=Id(first_id + rng.randrange(arguments.accounts)))
+                started_at = time.perf_counter()
+                page = await account.get_friendship_suggestions(session, arguments.limit, 0)
+                latencies.append(time.perf_counter() - started_at)
+                suggestions.append(len(page))
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+    latencies.sort()
+    print(  # noqa: T201
+        f"queries: {len(latencies)}, suggestions per query: {statistics.mean(suggestions):.1f}, "
+        f"p50: {get_percentile(latencies, 50) * 1000:.2f} ms, p95: {get_percentile(latencies, 95) * 1000:.2f} ms, "
+        f"max: {latencies[-1] * 1000:.2f} ms",
+    )
+
+
+def main(args: Sequence[str] | None = None) -> None:
+    asyncio.run(_run(_parse_args(args)))
+
+
+if __name__ == "__main__":
+    main()
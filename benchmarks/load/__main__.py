@@ -0,0 +1,81 @@
+"""Generate load on the app and report throughput and latency percentiles per endpoint.
+
+Usage examples:
+
+    # run all scenarios against the app in the current process (database and MinIO of $WLSS_ENV are used)
+    WLSS_ENV=local/dev python -m benchmarks.load --users=20 --duration=60
+
+    # run particular scenarios with weights against remote app and save the report
+    python -m benchmarks.load --base-url=http://localhost:8000 --scenario=sign_in=1 --scenario=create_wishes=5 \
+        --output=report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+from api.client import Api
+from benchmarks.load.recording import Recorder, RecordingTransport
+from benchmarks.load.runner import run_load
+from benchmarks.load.scenarios import SCENARIOS
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _parse_scenario(value: str) -> tuple[str, float]:
+    name, _, weight = value.partition("=")
+    if name not in SCENARIOS:
+        msg = f"Unknown scenario {name!r}, choose from: {', '.join(SCENARIOS)}."
+        raise argparse.ArgumentTypeError(msg)
+    return name, float(weight or 1)
+
+
+def _parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="Generate load on the app.")
+    parser.add_argument("--base-url", help="URL of the app, if it's omitted then app is run in the current process")
+    parser.add_argument("--users", type=int, default=10, help="number of concurrent virtual users (default: 10)")
+    parser.add_argument("--duration", type=float, default=30, help="duration of the load in seconds (default: 30)")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        type=_parse_scenario,
+        dest="scenarios",
+        help="scenario name with optional weight, for example: sign_in=2 (default: all scenarios with weight 1)",
+    )
+    parser.add_argument("--output", type=Path, help="path to the file where JSON report will be written to")
+    return parser.parse_args(args)
+
+
+def _create_transport(base_url: str | None, users: int) -> httpx.AsyncBaseTransport:
+    if base_url is not None:
+        return httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=users, max_keepalive_connections=users))
+    from src.app import app  # pylint: disable=import-outside-toplevel  # app is imported only if it's needed
+
+    return httpx.ASGITransport(app=app)
+
+
+async def main(args: Sequence[str] | None = None) -> None:
+    arguments = _parse_args(args)
+    recorder = Recorder()
+    transport = RecordingTransport(_create_transport(arguments.base_url, arguments.users), recorder)
+    scenarios = dict(arguments.scenarios or [(name, 1.0) for name in SCENARIOS])
+
+    async with Api(base_url=arguments.base_url or "http://app", transport=transport) as api:
+        report = await run_load(api, recorder, scenarios, arguments.users, arguments.duration)
+
+    print(report.format())  # noqa: T201
+    if arguments.output is not None:
+        arguments.output.write_text(json.dumps(dataclasses.asdict(report), indent=4))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""Recording of latency of HTTP requests sent through `api.client.Api`."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import math
+import re
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from typing import Final, Self
+
+
+# numeric and UUID path parameters are replaced with placeholder, so requests are grouped by endpoint
+_PATH_PARAMETER_PATTERN: Final = re.compile(r"/(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})(?=/|$)")
+
+PERCENTILES: Final = (50, 90, 95, 99)
+
+
+def get_endpoint(method: str, path: str) -> str:
+    """Get endpoint name of the request, for example "GET /accounts/{id}/wishes"."""
+    return f"{method} {_PATH_PARAMETER_PATTERN.sub('/{id}', path)}"
+
+
+def get_percentile(sorted_values: list[float], percentile: float) -> float:
+    """Get percentile of sorted values with nearest-rank method."""
+    rank = math.ceil(percentile / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+@dataclasses.dataclass
+class EndpointStatistics:
+    latencies: list[float] = dataclasses.field(default_factory=list)  # seconds
+    errors: int = 0
+
+    def summarize(self: Self, endpoint: str, duration: float) -> EndpointSummary:
+        latencies = sorted(self.latencies)
+        return EndpointSummary(
+            endpoint=endpoint,
+            requests=len(latencies),
+            errors=self.errors,
+            throughput=len(latencies) / duration,
+            percentiles={percentile: get_percentile(latencies, percentile) for percentile in PERCENTILES},
+            max_latency=latencies[-1],
+        )
+
+
+@dataclasses.dataclass
+class EndpointSummary:
+    endpoint: str
+    requests: int
+    errors: int
+    throughput: float  # requests per second
+    percentiles: dict[int, float]  # percentile -> latency in seconds
+    max_latency: float  # seconds
+
+
+class Recorder:
+    """Collect latency of each request grouped by endpoint."""
+
+    def __init__(self: Self) -> None:
+        self.statistics: collections.defaultdict[str, EndpointStatistics] = collections.defaultdict(
+            EndpointStatistics,
+        )
+
+    def record(self: Self, endpoint: str, latency: float, *, error: bool) -> None:
+        statistics = self.statistics[endpoint]
+        statistics.latencies.append(latency)
+        statistics.errors += error
+
+    def summarize(self: Self, duration: float) -> list[EndpointSummary]:
+        """Summarize recorded requests, `duration` of the load in seconds is used to calculate throughput."""
+        return [
+            statistics.summarize(endpoint, duration)
+            for endpoint, statistics in sorted(self.statistics.items())
+        ]
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """HTTP transport which records latency of each request to the recorder.
+
+    Latency is measured from sending the request till the response body is completely read,
+    so downloads of large files are measured correctly too.
+    """
+
+    def __init__(self: Self, transport: httpx.AsyncBaseTransport, recorder: Recorder) -> None:
+        self._transport = transport
+        self._recorder = recorder
+
+    async def handle_async_request(self: Self, request: httpx.Request) -> httpx.Response:
+        endpoint = get_endpoint(request.method, request.url.path)
+        started_at = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            self._recorder.record(endpoint, time.perf_counter() - started_at, error=True)
+            raise
+
+        def record() -> None:
+            self._recorder.record(endpoint, time.perf_counter() - started_at, error=response.is_error)
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_RecordingStream(response.stream, on_close=record),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self: Self) -> None:
+        await self._transport.aclose()
+
+
+class _RecordingStream(httpx.AsyncByteStream):
+    def __init__(self: Self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self: Self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self: Self) -> None:
+        await self._stream.aclose()
+        self._on_close()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+from benchmarks.load.scenarios import Population, SCENARIOS, sign_up
+
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from api.client import Client
+    from benchmarks.load.recording import EndpointSummary, Recorder
+    from benchmarks.load.scenarios import VirtualUser
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class LoadReport:
+    duration: float  # seconds
+    iterations: int
+    failed_iterations: int
+    endpoints: list[EndpointSummary]
+
+    def format(self: Self) -> str:  # noqa: A003
+        lines = [
+            f"Duration: {self.duration:.1f}s, scenario iterations: {self.iterations}, failed: {self.failed_iterations}",
+            "",
+            f"{'endpoint':<60} {'requests':>9} {'errors':>7} {'rps':>8} "
+            f"{'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8}",
+        ]
+        for endpoint in self.endpoints:
+            latencies_ms = [*endpoint.percentiles.values(), endpoint.max_latency]
+            lines.append(
+                f"{endpoint.endpoint:<60} {endpoint.requests:>9} {endpoint.errors:>7} {endpoint.throughput:>8.1f} "
+                + " ".join(f"{latency * 1000:>8.1f}" for latency in latencies_ms),
+            )
+        lines.append("")
+        lines.append("Latencies are in milliseconds.")
+        return "\n".join(lines)
+
+
+async def run_load(
+    api: Client,
+    recorder: Recorder,
+    scenarios: dict[str, float],
+    users: int,
+    duration: float,
+) -> LoadReport:
+    """Run scenarios by concurrent virtual users and collect latency of each request.
+
+    :param api: client which sends requests, its transport should record requests to the `recorder`
+    :param recorder: recorder of the requests latency
+    :param scenarios: scenario name -> weight, scenario for the next iteration is chosen randomly according to weight
+    :param users: number of concurrent virtual users, each of them signs up before the load starts
+    :param duration: duration of the load in seconds
+    """
+    population = Population()
+    virtual_users = await asyncio.gather(*(sign_up(api, population) for _ in range(users)))
+    recorder.statistics.clear()  # sign up of virtual users is a preparation, so it's not included in the report
+
+    counters = {"iterations": 0, "failed_iterations": 0}
+    started_at = time.perf_counter()
+    deadline = started_at + duration
+    await asyncio.gather(*(
+        _run_virtual_user(api, population, user, scenarios, deadline, counters) for user in virtual_users
+    ))
+    actual_duration = time.perf_counter() - started_at
+
+    return LoadReport(
+        duration=actual_duration,
+        iterations=counters["iterations"],
+        failed_iterations=counters["failed_iterations"],
+        endpoints=recorder.summarize(actual_duration),
+    )
+
+
+async def _run_virtual_user(  # pylint: disable=too-many-arguments
+    api: Client,
+    population: Population,
+    user: VirtualUser,
+    scenarios: dict[str, float],
+    deadline: float,
+    counters: dict[str, int],
+) -> None:
+    names, weights = list(scenarios), list(scenarios.values())
+    while time.perf_counter() < deadline:  # pylint: disable=while-used
+        name = random.choices(names, weights)[0]  # noqa: S311
+        counters["iterations"] += 1
+        try:
+            await SCENARIOS[name](api, population, user)
+        except (httpx.HTTPError, AssertionError):
+            # failed requests are already recorded, so virtual user just continues with the next iteration
+            counters["failed_iterations"] += 1
+            logger.debug("Scenario %s failed.", name, exc_info=True)
@@ -0,0 +1,174 @@
+"""Scenarios of virtual users behaviour. Each scenario is a single iteration of some user activity."""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import random
+import secrets
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeAlias
+
+from api.account.dtos import CreateAccountRequest
+from api.auth.dtos import CreateSessionRequest
+from api.file.dtos import CreateFileRequest
+from api.friendship.dtos import CreateFriendshipRequestRequest
+from api.profile.dtos import UpdateProfileRequest
+from api.wish.dtos import CreateWishRequest
+
+
+if TYPE_CHECKING:
+    from typing import Final, Self
+    from uuid import UUID
+
+    from wlss.shared.types import Id
+
+    from api.client import Client
+
+
+_PASSWORD: Final = "qwerty123"
+
+# the smallest valid PNG image: 1x1 transparent pixel
+_AVATAR: Final = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==",
+)
+
+
+@dataclasses.dataclass
+class VirtualUser:
+    account_id: Id
+    login: str
+    name: str
+    access_token: str
+    avatar_id: UUID | None = None
+
+
+class Population:
+    """All virtual users created during the load. Used to find other users to interact with."""
+
+    def __init__(self: Self) -> None:
+        self.users: list[VirtualUser] = []
+        self._related_pairs: set[frozenset[int]] = set()  # pairs of accounts which already sent friendship requests
+
+    def reserve_friend(self: Self, user: VirtualUser) -> VirtualUser | None:
+        """Find random user who has no friendship and friendship requests with the `user` yet."""
+        candidates = [
+            other for other in self.users
+            if other is not user and self._pair(user, other) not in self._related_pairs
+        ]
+        if not candidates:
+            return None
+        friend = random.choice(candidates)  # noqa: S311
+        self._related_pairs.add(self._pair(user, friend))
+        return friend
+
+    @staticmethod
+    def _pair(user: VirtualUser, other: VirtualUser) -> frozenset[int]:
+        return frozenset((user.account_id.value, other.account_id.value))
+
+
+Scenario: TypeAlias = Callable[["Client", Population, VirtualUser], Awaitable[None]]
+
+
+async def sign_up(api: Client, population: Population) -> VirtualUser:
+    """Create new account and add it to the population."""
+    login = f"load_{secrets.token_hex(6)}"
+    name = f"Load {login}"
+    response = await api.account.create_account(CreateAccountRequest.model_validate({
+        "account": {"email": f"{login}@load.test", "login": login, "password": _PASSWORD},
+        "profile": {"name": name, "description": None},
+    }))
+    session = await api.auth.create_session(CreateSessionRequest.model_validate({
+        "login": login,
+        "password": _PASSWORD,
+    }))
+    user = VirtualUser(
+        account_id=response.account.id,
+        login=login,
+        name=name,
+        access_token=session.tokens.access_token,
+    )
+    population.users.append(user)
+    return user
+
+
+async def sign_up_scenario(api: Client, population: Population, _: VirtualUser) -> None:
+    await sign_up(api, population)
+
+
+async def sign_in_scenario(api: Client, _: Population, user: VirtualUser) -> None:
+    session = await api.auth.create_session(CreateSessionRequest.model_validate({
+        "login": user.login,
+        "password": _PASSWORD,
+    }))
+    user.access_token = session.tokens.access_token
+
+
+async def create_wishes_scenario(api: Client, _: Population, user: VirtualUser) -> None:
+    await api.wish.create_wish(
+        user.account_id,
+        CreateWishRequest.model_validate({
+            "avatar_id": None,
+            "description": "I'm gonna take my horse to the old town road.",
+            "title": f"Horse #{secrets.randbelow(1000)}",
+        }),
+        user.access_token,
+    )
+    await api.wish.get_account_wishes(user.account_id, user.access_token)
+
+
+async def make_friends_scenario(api: Client, population: Population, user: VirtualUser) -> None:
+    friend = population.reserve_friend(user)
+    if friend is None:
+        return
+    request = await api.friendship.create_friendship_request(
+        CreateFriendshipRequestRequest.model_validate({"sender_id": user.account_id, "receiver_id": friend.account_id}),
+        user.access_token,
+    )
+    await api.friendship.get_friendship_requests(friend.account_id, friend.access_token)
+    await api.friendship.accept_friendship_request(request.id, friend.access_token)
+
+
+async def browse_friends_wishes_scenario(api: Client, _: Population, user: VirtualUser) -> None:
+    friendships = (await api.friendship.get_account_friendships(user.account_id, user.access_token)).friendships
+    if not friendships:
+        return
+    friend_ids = [friendship.friend_id for friendship in friendships]
+    await api.profile.get_profiles(friend_ids, user.access_token)
+    friend_id = random.choice(friend_ids)  # noqa: S311
+    await api.wish.get_account_wishes(friend_id, user.access_token)
+
+
+async def upload_avatar_scenario(api: Client, _: Population, user: VirtualUser) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_file_path = Path(tmp_dir) / "avatar.png"
+        tmp_file_path.write_bytes(_AVATAR)
+        file = await api.file.create_file(
+            CreateFileRequest.model_validate({
+                "extension": "png",
+                "name": "avatar.png",
+                "mime_type": "image/png",
+                "size": len(_AVATAR),
+                "tmp_file_path": tmp_file_path,
+            }),
+            user.access_token,
+        )
+        await api.profile.update_profile(
+            user.account_id,
+            UpdateProfileRequest.model_validate({"avatar_id": file.id, "description": None, "name": user.name}),
+            user.access_token,
+        )
+        user.avatar_id = file.id
+        await api.file.get_file(file.id, Path(tmp_dir) / "downloaded.png")
+
+
+SCENARIOS: Final[dict[str, Scenario]] = {
+    "sign_up": sign_up_scenario,
+    "sign_in": sign_in_scenario,
+    "create_wishes": create_wishes_scenario,
+    "make_friends": make_friends_scenario,
+    "browse_friends_wishes": browse_friends_wishes_scenario,
+    "upload_avatar": upload_avatar_scenario,
+}
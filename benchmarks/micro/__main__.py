@@ -0,0 +1,81 @@
+"""Measure hot paths of request handling and compare them with stored baseline.
+
+Usage examples:
+
+    # run all benchmarks and fail if any of them is more than 20% slower than baseline
+    WLSS_ENV=local/dev python -m benchmarks.micro --threshold=0.2
+
+    # measure particular benchmarks and store them as a new baseline
+    WLSS_ENV=local/dev python -m benchmarks.micro --benchmark=access_token_encode --save-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from benchmarks.micro.cases import BENCHMARKS
+from benchmarks.micro.measuring import compare, format_comparisons, load_baseline, measure, save_baseline
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+
+BASELINE_PATH: Final = Path(__file__).parent / "baseline.json"
+
+
+def _parse_benchmark(value: str) -> str:
+    if value not in BENCHMARKS:
+        msg = f"Unknown benchmark {value!r}, choose from: {', '.join(BENCHMARKS)}."
+        raise argparse.ArgumentTypeError(msg)
+    return value
+
+
+def _parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro", description="Measure hot paths of the app.")
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        type=_parse_benchmark,
+        dest="benchmarks",
+        help="name of the benchmark to run (default: all benchmarks)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="path to the JSON file with baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown relative to baseline, for example 0.2 means 20%% (default: 0.2)",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="store measurements as a new baseline")
+    return parser.parse_args(args)
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    arguments = _parse_args(args)
+    names = arguments.benchmarks or list(BENCHMARKS)
+    baseline = load_baseline(arguments.baseline)
+    missing = [name for name in names if name not in baseline]
+    if missing and not arguments.save_baseline:  # otherwise nothing is compared and the command always succeeds
+        print(  # noqa: T201
+            f"There is no baseline of {', '.join(missing)} in {arguments.baseline}, save it with --save-baseline.",
+            file=sys.stderr,
+        )
+        return 2
+
+    measurements = [measure(name, BENCHMARKS[name]) for name in names]
+    comparisons = compare(measurements, baseline, arguments.threshold)
+
+    print(format_comparisons(comparisons))  # noqa: T201
+    if arguments.save_baseline:
+        save_baseline(arguments.baseline, measurements)
+        return 0
+    return int(any(comparison.is_regression for comparison in comparisons))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Benchmarks of the code which is executed on each request by the app or by its client, each is a function."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, TypeAlias
+
+import httpx
+from pydantic import TypeAdapter
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from wlss.account.types import AccountPassword
+from wlss.shared.types import Id
+
+from api.client import Client
+from api.shared.fields import IdField, UtcDatetimeField, UuidField
+from api.wish.dtos import CreateWishRequest, GetAccountWishesResponse
+from src.account.models import PasswordHash
+from src.auth.schemas import _DECODED_ACCESS_TOKENS, AccessTokenPayload  # noqa: PLC2701
+from src.shared.columns import IdColumn, UtcDatetimeColumn
+from src.wish.schemas import NewWish
+
+
+if TYPE_CHECKING:
+    from typing import Final
+
+
+Benchmark: TypeAlias = Callable[[], object]
+
+_DIALECT: Final = PGDialect_asyncpg()
+
+_CREATED_AT: Final = datetime(2023, 6, 17, 11, 47, 2, 823000, tzinfo=timezone.utc)
+
+_ACCESS_TOKEN_PAYLOAD: Final = AccessTokenPayload.model_validate({
+    "account_id": 42,
+    "created_at": _CREATED_AT,
+    "session_id": "0b928aaa-521f-47ec-8be5-396650e2a187",
+})
+_ACCESS_TOKEN: Final = _ACCESS_TOKEN_PAYLOAD.encode()
+# decoded payload of the expired token is not cached, so this one is used by the benchmark of the cached payload
+_FRESH_ACCESS_TOKEN: Final = AccessTokenPayload.model_validate({
+    "account_id": 42,
+    "created_at": datetime.now(tz=timezone.utc) - timedelta(seconds=1),
+    "session_id": "0b928aaa-521f-47ec-8be5-396650e2a187",
+}).encode()
+
+_CREATE_WISH_REQUEST: Final = CreateWishRequest.model_validate({
+    "avatar_id": "0b928aaa-521f-47ec-8be5-396650e2a187",
+    "description": "I'm gonna take my horse to the old town road.",
+    "title": "Horse",
+})
+
+_ID_ADAPTER: Final = TypeAdapter(IdField)
+_UTC_DATETIME_ADAPTER: Final = TypeAdapter(UtcDatetimeField)
+_UUID_ADAPTER: Final = TypeAdapter(UuidField)
+
+_ID_COLUMN: Final = IdColumn()
+_UTC_DATETIME_COLUMN: Final = UtcDatetimeColumn()
+
+# size of the list is close to the number of wishes of a very active user
+_WISHES: Final = [
+    {
+        "id": wish_id,
+        "account_id": 42,
+        "avatar_id": str(uuid.UUID(int=wish_id, version=4)),
+        "created_at": (_CREATED_AT + timedelta(minutes=wish_id)).isoformat(),
+        "description": "I'm gonna take my horse to the old town road.",
+        "title": f"Horse #{wish_id}",
+    }
+    for wish_id in range(1, 1001)
+]
+_WISHES_RESPONSE: Final = GetAccountWishesResponse.model_validate({"wishes": _WISHES})
+_WISHES_JSON: Final = _WISHES_RESPONSE.model_dump_json().encode()
+
+# client sends requests to the transport which responds immediately, so only CPU time of the client is measured
+_CLIENT: Final = Client(
+    httpx.AsyncClient(
+        base_url="http://app",
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(200, content=_WISHES_JSON, headers={"Content-Type": "application/json"}),
+        ),
+    ),
+)
+_CLIENT_LOOP: Final = asyncio.new_event_loop()
+
+_PASSWORD: Final = AccountPassword("qwerty123")
+_PASSWORD_HASH: Final = PasswordHash(
+    value=PasswordHash._generate_hash(_PASSWORD),  # noqa: SLF001 # pylint: disable=protected-access
+)
+
+
+def _decode_access_token() -> None:
+    _DECODED_ACCESS_TOKENS.clear()  # so signature is verified and payload is validated each time
+    AccessTokenPayload.decode(_FRESH_ACCESS_TOKEN)
+
+
+def _check_password() -> None:
+    asyncio.run(_PASSWORD_HASH.check_password(_PASSWORD))
+
+
+def _get_account_wishes() -> None:
+    _CLIENT_LOOP.run_until_complete(_CLIENT.wish.get_account_wishes(Id(42), _ACCESS_TOKEN))
+
+
+BENCHMARKS: Final[dict[str, Benchmark]] = {
+    "access_token_encode": _ACCESS_TOKEN_PAYLOAD.encode,
+    "access_token_decode": _decode_access_token,
+    "access_token_decode_cached": lambda: AccessTokenPayload.decode(_FRESH_ACCESS_TOKEN),
+    "schema_from": lambda: NewWish.from_(_CREATE_WISH_REQUEST),
+    "id_field_validate": lambda: _ID_ADAPTER.validate_python("42"),
+    "utc_datetime_field_validate": lambda: _UTC_DATETIME_ADAPTER.validate_python("2023-06-17T11:47:02.823000+00:00"),
+    "uuid_field_validate": lambda: _UUID_ADAPTER.validate_python("0b928aaa-521f-47ec-8be5-396650e2a187"),
+    "id_column_bind": lambda: _ID_COLUMN.process_bind_param(Id(42), _DIALECT),
+    "utc_datetime_column_result": lambda: _UTC_DATETIME_COLUMN.process_result_value(_CREATED_AT, _DIALECT),
+    "wishes_response_validate_1000": lambda: GetAccountWishesResponse.model_validate({"wishes": _WISHES}),
+    "wishes_response_dump_json_1000": _WISHES_RESPONSE.model_dump_json,
+    "wishes_response_validate_loaded_json_1000": lambda: GetAccountWishesResponse.model_validate(
+        json.loads(_WISHES_JSON),
+    ),
+    "wishes_response_validate_json_1000": lambda: GetAccountWishesResponse.model_validate_json(_WISHES_JSON),
+    "client_get_account_wishes_1000": _get_account_wishes,
+    "password_hash_check": _check_password,
+}
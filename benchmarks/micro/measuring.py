@@ -0,0 +1,100 @@
+"""Measuring of functions execution time and comparing it with stored baseline."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import statistics
+import timeit
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from typing import Self
+
+
+@dataclasses.dataclass
+class Measurement:
+    name: str
+    seconds: float  # median time of a single call
+    calls: int  # total number of calls made during the measurement
+
+
+@dataclasses.dataclass
+class Comparison:
+    name: str
+    seconds: float
+    baseline: float | None  # `None` means there is no baseline for the benchmark yet
+    threshold: float
+
+    @property
+    def ratio(self: Self) -> float | None:
+        return None if self.baseline is None else self.seconds / self.baseline
+
+    @property
+    def is_regression(self: Self) -> bool:
+        return self.ratio is not None and self.ratio > 1 + self.threshold
+
+
+def measure(name: str, function: Callable[[], object], *, rounds: int = 5, min_time: float = 0.2) -> Measurement:
+    """Measure time of a single call of the function.
+
+    Number of calls in each round is chosen so the round takes at least `min_time` seconds,
+    median of the rounds is used, because it's less sensitive to the noise than mean.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, round(number * min_time / 0.2))  # `autorange` stops when round takes at least 0.2 seconds
+    times = timer.repeat(repeat=rounds, number=number)
+    return Measurement(name=name, seconds=statistics.median(times) / number, calls=number * rounds)
+
+
+def compare(measurements: list[Measurement], baseline: dict[str, float], threshold: float) -> list[Comparison]:
+    """Compare measurements with baseline.
+
+    Measurement is a regression if it's slower than baseline by more than `threshold`, for example 0.2 means 20%.
+    """
+    return [
+        Comparison(
+            name=measurement.name,
+            seconds=measurement.seconds,
+            baseline=baseline.get(measurement.name),
+            threshold=threshold,
+        )
+        for measurement in measurements
+    ]
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    baseline: dict[str, float] = json.loads(path.read_text())
+    return baseline
+
+
+def save_baseline(path: Path, measurements: list[Measurement]) -> None:
+    """Save measurements as a new baseline, baseline of benchmarks which were not measured is kept as is."""
+    baseline = load_baseline(path)
+    baseline.update({measurement.name: measurement.seconds for measurement in measurements})
+    path.write_text(json.dumps(dict(sorted(baseline.items())), indent=4) + "\n")
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    lines = [f"{'benchmark':<40} {'time':>12} {'baseline':>12} {'ratio':>8}"]
+    for comparison in comparisons:
+        baseline = "-" if comparison.baseline is None else _format_seconds(comparison.baseline)
+        ratio = "-" if comparison.ratio is None else f"{comparison.ratio:.2f}"
+        mark = "  REGRESSION" if comparison.is_regression else ""
+        lines.append(
+            f"{comparison.name:<40} {_format_seconds(comparison.seconds):>12} {baseline:>12} {ratio:>8}{mark}",
+        )
+    return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, multiplier in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * multiplier >= 1:
+            return f"{seconds * multiplier:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
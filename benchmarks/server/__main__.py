@@ -0,0 +1,108 @@
+"""Compare production server launcher with plain gunicorn config which was used before it.
+
+Each server is started in a subprocess with the same database and MinIO, loaded with all scenarios
+of `benchmarks.load` and then stopped with SIGTERM to measure how long it takes to shut down gracefully.
+
+Usage example:
+
+    WLSS_ENV=local/dev python -m benchmarks.server --users=50 --duration=60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import signal
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+from api.client import Api
+from benchmarks.load.recording import Recorder, RecordingTransport
+from benchmarks.load.runner import run_load
+from benchmarks.load.scenarios import SCENARIOS
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+    from typing import Final
+
+    from benchmarks.load.runner import LoadReport
+
+
+_HOST: Final = "127.0.0.1"
+
+SERVERS: Final = {
+    # configuration used before `src.server` launcher: 4 workers with default event loop and no preload
+    "gunicorn config": [
+        "gunicorn",
+        "src.app:app",
+        "--workers=4",
+        "--worker-class=uvicorn.workers.UvicornWorker",
+        f"--bind={_HOST}:8001",
+    ],
+    "src.server": [sys.executable, "-m", "src.server", f"--bind={_HOST}:8002"],
+}
+
+
+def _parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.server", description="Compare server launchers.")
+    parser.add_argument("--users", type=int, default=50, help="number of concurrent virtual users (default: 50)")
+    parser.add_argument("--duration", type=float, default=30, help="duration of the load in seconds (default: 30)")
+    return parser.parse_args(args)
+
+
+@contextlib.asynccontextmanager
+async def _run_server(command: list[str], base_url: str) -> AsyncIterator[dict[str, float]]:
+    """Run server until it's ready to handle requests, timings of its start and shutdown are yielded."""
+    timings: dict[str, float] = {}
+    started_at = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)  # noqa: S603
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            while True:  # pylint: disable=while-used
+                if process.poll() is not None:
+                    msg = f"Server exited with code {process.returncode} before it was ready."
+                    raise RuntimeError(msg)
+                with contextlib.suppress(httpx.TransportError):
+                    if (await client.get("/health")).is_success:
+                        break
+                await asyncio.sleep(0.05)
+        timings["start"] = time.perf_counter() - started_at
+        yield timings
+    finally:
+        stopped_at = time.perf_counter()
+        process.send_signal(signal.SIGTERM)
+        await asyncio.to_thread(process.wait)
+        timings["shutdown"] = time.perf_counter() - stopped_at
+
+
+async def _benchmark(command: list[str], users: int, duration: float) -> tuple[dict[str, float], LoadReport]:
+    base_url = f"http://{command[-1].removeprefix('--bind=')}"
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    transport = RecordingTransport(httpx.AsyncHTTPTransport(limits=limits), recorder)
+    async with _run_server(command, base_url) as timings, Api(base_url=base_url, transport=transport) as api:
+        report = await run_load(api, recorder, dict.fromkeys(SCENARIOS, 1.0), users, duration)
+    return timings, report
+
+
+async def main(args: Sequence[str] | None = None) -> None:
+    arguments = _parse_args(args)
+    for name, command in SERVERS.items():
+        timings, report = await _benchmark(command, arguments.users, arguments.duration)
+        throughput = sum(endpoint.throughput for endpoint in report.endpoints)
+        print(f"# {name}: {' '.join(command)}")  # noqa: T201
+        print(  # noqa: T201
+            f"Start: {timings['start']:.2f}s, shutdown: {timings['shutdown']:.2f}s, "
+            f"total throughput: {throughput:.1f} requests per second",
+        )
+        print(report.format(), end="\n\n")  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
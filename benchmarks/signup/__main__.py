@@ -0,0 +1,89 @@
+"""Measure throughput of sign up: account, profile and password hash creation by concurrent clients.
+
+Each client uses its own connection and transaction which is rolled back at the end, so database is left as is.
+Password hashing is included, since it's a part of sign up and it competes with queries for CPU.
+
+Usage example:
+
+    WLSS_ENV=local/dev python -m benchmarks.signup --accounts=1000 --concurrency=10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import secrets
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from benchmarks.load.recording import get_percentile
+from src.account.models import Account
+from src.account.schemas import NewAccount
+from src.profile.schemas import NewProfile
+from src.shared.database import POSTGRES_CONNECTION_URL
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+def _parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.signup",
+        description="Measure throughput of sign up by concurrent clients.",
+    )
+    parser.add_argument("--accounts", type=int, default=1000, help="number of created accounts (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=10, help="number of concurrent clients (default: 10)")
+    return parser.parse_args(args)
+
+
+async def _sign_up(engine: AsyncEngine, accounts: int, latencies: list[float]) -> None:
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            session = AsyncSession(bind=connection)
+            for _ in range(accounts):
+                login = f"signup_{secrets.token_hex(6)}"
+                new_account = NewAccount.model_validate({
+                    "email": f"{login}@signup.test",
+                    "login": login,
+                    "password": "qwerty123",
+                })
+                new_profile = NewProfile.model_validate({"name": f"Signup {login}", "description": None})
+                started_at = time.perf_counter()
+                await Account.create(session, new_account, new_profile)
+                latencies.append(time.perf_counter() - started_at)
+        finally:
+            await transaction.rollback()
+
+
+async def _run(arguments: argparse.Namespace) -> None:
+    engine = create_async_engine(POSTGRES_CONNECTION_URL, pool_size=arguments.concurrency)
+    latencies: list[float] = []  # seconds
+    accounts_per_client, remainder = divmod(arguments.accounts, arguments.concurrency)
+    started_at = time.perf_counter()
+    await asyncio.gather(*(
+        _sign_up(engine, accounts_per_client + (client < remainder), latencies)
+        for client in range(arguments.concurrency)
+    ))
+    duration = time.perf_counter() - started_at
+    await engine.dispose()
+
+    latencies.sort()
+    print(  # noqa: T201
+        f"accounts: {len(latencies)}, throughput: {len(latencies) / duration:.1f} accounts/s, "
+        f"p50: {get_percentile(latencies, 50) * 1000:.2f} ms, p95: {get_percentile(latencies, 95) * 1000:.2f} ms, "
+        f"max: {latencies[-1] * 1000:.2f} ms",
+    )
+
+
+def main(args: Sequence[str] | None = None) -> None:
+    asyncio.run(_run(_parse_args(args)))
+
+
+if __name__ == "__main__":
+    main()
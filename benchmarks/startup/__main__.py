@@ -0,0 +1,72 @@
+"""Measure cold boot of a worker: import of the app and getting OpenAPI schema ready to be served.
+
+Each boot is run in a fresh interpreter. OpenAPI schema is either generated (as it's done on the first request
+to the docs if schema is not prebuilt) or loaded from the prebuilt file.
+
+Usage example:
+
+    WLSS_ENV=local/dev python -m benchmarks.startup --runs=10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _parse_args(args: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description="Measure cold boot of a worker.")
+    parser.add_argument("--runs", type=int, default=5, help="number of boots of each kind (default: 5)")
+    return parser.parse_args(args)
+
+
+def _boot(*args: str) -> dict[str, float]:
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "benchmarks.startup.boot", *args],
+        capture_output=True,
+        check=True,
+        # schema shouldn't be loaded on import of the app, because loading of the schema is measured separately
+        env={**os.environ, "OPENAPI_PREBUILT": "false"},
+        text=True,
+    ).stdout
+    timings: dict[str, float] = json.loads(output)
+    return timings
+
+
+def main(args: Sequence[str] | None = None) -> None:
+    arguments = _parse_args(args)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        openapi_file = str(Path(tmp_dir) / "openapi.json")
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-m", "src.shared.openapi"],
+            check=True,
+            env={**os.environ, "OPENAPI_FILE": openapi_file, "OPENAPI_PREBUILT": "false"},
+        )
+        boots = {
+            "generated OpenAPI schema": [_boot() for _ in range(arguments.runs)],
+            "prebuilt OpenAPI schema": [_boot(openapi_file) for _ in range(arguments.runs)],
+        }
+
+    print(f"{'boot':<30} {'import, ms':>12} {'openapi, ms':>12} {'total, ms':>12}")  # noqa: T201
+    for name, timings in boots.items():
+        import_time = statistics.median(timing["import"] for timing in timings)
+        openapi_time = statistics.median(timing["openapi"] for timing in timings)
+        print(  # noqa: T201
+            f"{name:<30} {import_time * 1000:>12.1f} {openapi_time * 1000:>12.1f} "
+            f"{(import_time + openapi_time) * 1000:>12.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
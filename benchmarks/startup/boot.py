@@ -0,0 +1,29 @@
+"""Boot the app the same way as a worker does and print timings of the boot stages as JSON.
+
+It's run in a fresh interpreter by `python -m benchmarks.startup`, so nothing is imported or cached beforehand.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+
+def main(openapi_file: str | None) -> None:
+    started_at = time.perf_counter()
+    from src.app import app  # pylint: disable=import-outside-toplevel  # import time is what is measured
+    from src.shared.openapi import load_openapi  # pylint: disable=import-outside-toplevel
+
+    imported_at = time.perf_counter()
+    if openapi_file is None:
+        app.openapi()
+    else:
+        load_openapi(app, openapi_file)
+    finished_at = time.perf_counter()
+
+    print(json.dumps({"import": imported_at - started_at, "openapi": finished_at - imported_at}))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -21,6 +21,13 @@ BUILDX_CACHE_SRC="/tmp/.buildx-cache"
 DAYS_BEFORE_ACCESS_TOKEN_EXPIRATION="1"
 DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION="60"
 
+EXISTING_ACCOUNTS_CAPACITY="1000000"
+EXISTING_ACCOUNTS_REFRESH_SECONDS="5"
+
+FRIENDS_CACHE_EXPIRATION_SECONDS="60"
+
+INVALIDATION_CHECK_SECONDS="5"
+
 # Minio related variables are not used for envs/ci/db checks
 # because we don't need to connect to minio to check db-related stuff.
 # But these variables are required by the application config.
@@ -32,13 +39,29 @@ MINIO_ROOT_PASSWORD="minioadmin"
 MINIO_ROOT_USER="minioadmin"
 MINIO_SCHEMA="HTTP"
 
+OPENAPI_FILE="/tmp/wlss-openapi.json"
+OPENAPI_PREBUILT="false"
+
 POSTGRES_DB="postgres"
 POSTGRES_HOST="postgres"
 POSTGRES_PASSWORD="postgres"
 POSTGRES_PORT="5432"
+POSTGRES_READ_YOUR_WRITES_SECONDS="15"
+POSTGRES_REPLICA_LAG_CHECK_SECONDS="5"
+POSTGRES_REPLICA_MAX_LAG_SECONDS="10"
+POSTGRES_REPLICAS="[]"
 POSTGRES_USER="postgres"
 
+REVOKED_SESSIONS_REFRESH_SECONDS="1"
+
 SECRET_KEY="keyboardcat"
+
+SESSIONS_MAX_PER_ACCOUNT="10"
+SESSIONS_PRUNING_BATCH_SIZE="1000"
+SESSIONS_PRUNING_INTERVAL_SECONDS="3600"
+
+TRACING_ENABLED="false"
+TRACING_FILE="/tmp/wlss-traces.jsonl"
 EOF
 
 # ======================================================================================================================
@@ -18,19 +18,42 @@ cat > $ENV_FILE << EOF
 DAYS_BEFORE_ACCESS_TOKEN_EXPIRATION="1"
 DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION="60"
 
+EXISTING_ACCOUNTS_CAPACITY="1000000"
+EXISTING_ACCOUNTS_REFRESH_SECONDS="5"
+
+FRIENDS_CACHE_EXPIRATION_SECONDS="60"
+
+INVALIDATION_CHECK_SECONDS="5"
+
 MINIO_HOST="minio"
 MINIO_PORT="9000"
 MINIO_ROOT_PASSWORD=""  # provide correct value here
 MINIO_ROOT_USER=""  # provide correct value here
 MINIO_SCHEMA="HTTP"
 
+OPENAPI_FILE="/tmp/wlss-openapi.json"
+OPENAPI_PREBUILT="true"
+
 POSTGRES_DB="postgres"
 POSTGRES_HOST="postgres"
 POSTGRES_PASSWORD=""  # provide correct value here
 POSTGRES_PORT="5432"
+POSTGRES_READ_YOUR_WRITES_SECONDS="15"
+POSTGRES_REPLICA_LAG_CHECK_SECONDS="5"
+POSTGRES_REPLICA_MAX_LAG_SECONDS="10"
+POSTGRES_REPLICAS="[]"
 POSTGRES_USER=""  # provide correct value here
 
+REVOKED_SESSIONS_REFRESH_SECONDS="1"
+
 SECRET_KEY="keyboardcat"
+
+SESSIONS_MAX_PER_ACCOUNT="10"
+SESSIONS_PRUNING_BATCH_SIZE="1000"
+SESSIONS_PRUNING_INTERVAL_SECONDS="3600"
+
+TRACING_ENABLED="false"
+TRACING_FILE="/tmp/wlss-traces.jsonl"
 EOF
 
 # ======================================================================================================================
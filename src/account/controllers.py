@@ -3,9 +3,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from api.account.dtos import CreateAccountResponse, GetAccountResponse, GetAccountsResponse
-from src.account.models import Account, PasswordHash
+from src.account.exceptions import AccountNotFoundError
+from src.account.existence import existing_accounts
+from src.account.models import Account
 from src.account.schemas import NewAccount
-from src.profile.models import Profile
 from src.profile.schemas import NewProfile
 
 
@@ -19,12 +20,9 @@ if TYPE_CHECKING:
 
 async def create_account(request_data: CreateAccountRequest, session: AsyncSession) -> CreateAccountResponse:
     new_account = NewAccount.from_(request_data.account)
-    account = await Account.create(session, new_account)
-
     new_profile = NewProfile.from_(request_data.profile)
-    profile = await Profile.create(session, new_profile, account=account)
-
-    await PasswordHash.create(session, request_data.account.password, account=account)
+    account, profile = await Account.create(session, new_account, new_profile)
+    existing_accounts.add(account.email, account.login)
     return CreateAccountResponse.model_validate({"account": account, "profile": profile}, from_attributes=True)
 
 
@@ -48,8 +46,12 @@ async def get_accounts(
 
 
 async def match_account_login(request_data: MatchAccountLoginRequest, session: AsyncSession) -> None:
+    if not existing_accounts.may_have_login(request_data.login):
+        raise AccountNotFoundError()
     await Account.get_by_login(session, request_data.login)
 
 
 async def match_account_email(request_data: MatchAccountEmailRequest, session: AsyncSession) -> None:
+    if not existing_accounts.may_have_email(request_data.email):
+        raise AccountNotFoundError()
     await Account.get_by_email(session, request_data.email)
@@ -0,0 +1,97 @@
+"""Logins and emails of existing accounts kept in memory of each worker process, so match endpoints are answered
+without database queries when there is definitely no such account.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.account.models import Account
+from src.config import CONFIG
+from src.shared.bloom import BloomFilter
+from src.shared.database import async_session
+
+
+if TYPE_CHECKING:
+    from typing import Final, Self
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from wlss.account.types import AccountEmail, AccountLogin
+
+
+logger = logging.getLogger(__name__)
+
+# accounts are re-read with this overlap, so accounts created by transactions which were committed later
+# than they had set creation time are not missed; it's longer than any transaction lasts
+_LOOKBACK: Final = timedelta(minutes=1)
+
+_ERROR_RATE: Final = 0.01  # share of missing logins and emails which are still checked in the database
+
+
+class ExistingAccounts:
+    """Bloom filters of logins and emails of all accounts.
+
+    Filters are filled from `account` table and they're refreshed every `EXISTING_ACCOUNTS_REFRESH_SECONDS`,
+    so account created by another worker is seen in that time. Accounts created by this worker are added
+    immediately. Deleted accounts are never removed, it only makes them false positives.
+
+    Login or email which is not in the filter doesn't exist only if filters are fresh, otherwise they can miss
+    some of the recently created accounts, so the database should be checked.
+    """
+
+    def __init__(self: Self) -> None:
+        self._emails = BloomFilter(CONFIG.EXISTING_ACCOUNTS_CAPACITY, _ERROR_RATE)
+        self._logins = BloomFilter(CONFIG.EXISTING_ACCOUNTS_CAPACITY, _ERROR_RATE)
+        self._refreshed_at: float | None = None  # monotonic time of the last successful refresh
+        self._read_since: datetime | None = None  # `None` means that all accounts should be read
+
+    @property
+    def is_fresh(self: Self) -> bool:
+        if self._refreshed_at is None:
+            return False
+        return time.monotonic() - self._refreshed_at <= 3 * CONFIG.EXISTING_ACCOUNTS_REFRESH_SECONDS
+
+    def may_have_email(self: Self, email: AccountEmail) -> bool:
+        return not self.is_fresh or email.value in self._emails
+
+    def may_have_login(self: Self, login: AccountLogin) -> bool:
+        return not self.is_fresh or login.value in self._logins
+
+    def add(self: Self, email: AccountEmail, login: AccountLogin) -> None:
+        self._emails.add(email.value)
+        self._logins.add(login.value)
+
+    async def refresh(self: Self, session: AsyncSession) -> None:
+        started_at = time.monotonic()
+        query = select(Account.created_at, Account.email, Account.login)
+        if self._read_since is not None:
+            query = query.where(Account.created_at >= self._read_since - _LOOKBACK)
+        rows = (await session.execute(query)).all()
+
+        for row in rows:
+            self.add(row.email, row.login)
+            if self._read_since is None or row.created_at.value > self._read_since:
+                self._read_since = row.created_at.value
+        if self._read_since is None:
+            self._read_since = datetime.now(tz=timezone.utc)
+        self._refreshed_at = started_at
+
+    async def monitor(self: Self) -> None:  # pragma: no cover
+        """Periodically refresh existing accounts. Supposed to be run as a background task."""
+        while True:  # pylint: disable=while-used
+            try:
+                async with async_session() as session:
+                    await self.refresh(session)
+            except (OSError, SQLAlchemyError):
+                logger.warning("Existing accounts are not refreshed.", exc_info=True)
+            await asyncio.sleep(CONFIG.EXISTING_ACCOUNTS_REFRESH_SECONDS)
+
+
+existing_accounts = ExistingAccounts()
@@ -1,81 +1,156 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import typing
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
 
 import bcrypt
-from sqlalchemy import delete, ForeignKey, LargeBinary, select
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import delete, exists, ForeignKey, func, LargeBinary, literal, select, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased, Mapped, mapped_column
 from wlss.account.types import AccountEmail, AccountLogin
 from wlss.shared.types import Id, UtcDatetime
 
 from src.account.columns import AccountEmailColumn, AccountLoginColumn
 from src.account.exceptions import AccountNotFoundError, DuplicateAccountException
 from src.auth.exceptions import SessionNotFoundError
-from src.auth.models import Session
+from src.auth.models import RevokedSession, Session
+from src.config import CONFIG
 from src.file.exceptions import FileAlreadyInUse
 from src.file.models import File
+from src.friendship.cache import friends_cache, invalidate_friends
 from src.friendship.models import Friendship, FriendshipRequest
+from src.friendship.schemas import FriendshipSuggestion, MutualFriends
 from src.profile.models import Profile
 from src.shared.columns import IdColumn, UtcDatetimeColumn
 from src.shared.database import Base
 from src.shared.datetime import utcnow
+from src.shared.metrics import BCRYPT_QUEUE_DEPTH
+from src.shared.singleflight import single_flight
 from src.wish.exceptions import WishNotFoundError
 from src.wish.models import Wish, WishBooking
 
 
 if TYPE_CHECKING:
-    from typing import Self
+    from collections.abc import Callable
+    from typing import Any, Final, Self
     from uuid import UUID
 
+    from sqlalchemy import Table
     from sqlalchemy.ext.asyncio import AsyncSession
     from wlss.account.types import AccountPassword
 
     from src.account.schemas import NewAccount
     from src.auth import schemas as auth_schemas
+    from src.profile.schemas import NewProfile
     from src.wish import schemas
 
 
+_T = TypeVar("_T")
+
+# hashing operations are queued here, so the number of them waiting to be processed can be measured
+_BCRYPT_EXECUTOR: Final = ThreadPoolExecutor(thread_name_prefix="bcrypt")
+
+
 class Account(Base):
 
     __tablename__ = "account"
 
     id: Mapped[Id] = mapped_column(IdColumn, primary_key=True)  # noqa: A003
 
-    created_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False)
+    created_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False, index=True)
     email: Mapped[AccountEmail] = mapped_column(AccountEmailColumn, nullable=False, unique=True)
     login: Mapped[AccountLogin] = mapped_column(AccountLoginColumn, nullable=False, unique=True)
     updated_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False, onupdate=utcnow)
 
     @staticmethod
-    async def create(session: AsyncSession, account_data: NewAccount) -> Account:
-        query = select(Account).where(Account.email == account_data.email)
-        account_with_same_email = (await session.execute(query)).first()
-        if account_with_same_email is not None:
-            raise DuplicateAccountException()
-
-        query = select(Account).where(Account.login == account_data.login)
-        account_with_same_login = (await session.execute(query)).first()
-        if account_with_same_login is not None:
+    async def create(
+        session: AsyncSession,
+        account_data: NewAccount,
+        profile_data: NewProfile,
+    ) -> tuple[Account, Profile]:
+        """Create account with its profile and password hash with a single statement.
+
+        Duplicate email or login is detected by unique constraints of the account table, so there is no race
+        between concurrent sign ups with the same values. Nothing is inserted in this case.
+        """
+        hash_value = await PasswordHash.generate_value(account_data.password)
+        now = utcnow()
+        # statements are built from tables, since ORM statements can't be used inside of CTE
+        accounts = typing.cast("Table", Account.__table__)
+        profiles = typing.cast("Table", Profile.__table__)
+        password_hashes = typing.cast("Table", PasswordHash.__table__)
+
+        account = (
+            insert(accounts)
+            .values(created_at=now, email=account_data.email, login=account_data.login, updated_at=now)
+            .on_conflict_do_nothing()
+            .returning(accounts.c.id)
+            .cte("new_account")
+        )
+        profile = (
+            insert(profiles)
+            .from_select(
+                ["account_id", "created_at", "description", "name", "updated_at"],
+                select(
+                    account.c.id,
+                    literal(now, UtcDatetimeColumn),
+                    literal(profile_data.description, profiles.c.description.type),
+                    literal(profile_data.name, profiles.c.name.type),
+                    literal(now, UtcDatetimeColumn),
+                ),
+            )
+            .cte("new_profile")
+        )
+        password_hash = (
+            insert(password_hashes)
+            .from_select(
+                ["account_id", "created_at", "updated_at", "value"],
+                select(
+                    account.c.id,
+                    literal(now, UtcDatetimeColumn),
+                    literal(now, UtcDatetimeColumn),
+                    literal(hash_value, password_hashes.c.value.type),
+                ),
+            )
+            .cte("new_password_hash")
+        )
+        query = select(account.c.id).add_cte(profile, password_hash)
+        row = (await session.execute(query)).one_or_none()
+        if row is None:
             raise DuplicateAccountException()
 
-        account = Account(
-            email=account_data.email,
-            login=account_data.login,
+        return (
+            Account(
+                id=row.id,
+                created_at=now,
+                email=account_data.email,
+                login=account_data.login,
+                updated_at=now,
+            ),
+            Profile(
+                account_id=row.id,
+                avatar_id=None,
+                created_at=now,
+                description=profile_data.description,
+                name=profile_data.name,
+                updated_at=now,
+            ),
         )
-        session.add(account)
-        await session.flush()
-        return account
 
     @classmethod
     async def get(cls: type[Account], session: AsyncSession, account_id: Id) -> Account:
-        query = select(Account).where(Account.id == account_id)
-        row = (await session.execute(query)).one_or_none()
-        if row is None:
-            raise AccountNotFoundError()
-        return typing.cast(Account, row.Account)
+        async def get_account() -> Account:
+            query = select(Account).where(Account.id == account_id)
+            row = (await session.execute(query)).one_or_none()
+            if row is None:
+                raise AccountNotFoundError()
+            return typing.cast(Account, row.Account)
+
+        return await single_flight.run(session, ("Account.get", account_id.value), get_account)
 
     @classmethod
     async def get_by_login(cls: type[Account], session: AsyncSession, login: AccountLogin) -> Account:
@@ -124,8 +199,26 @@ class Account(Base):
         auth_session = Session(account_id=self.id)
         session.add(auth_session)
         await session.flush()
+        await self._delete_excess_sessions(session)
         return auth_session
 
+    async def _delete_excess_sessions(self: Self, session: AsyncSession) -> None:
+        """Delete the least recently used sessions, so account has at most `SESSIONS_MAX_PER_ACCOUNT` sessions."""
+        excess_sessions = (
+            select(Session.id)
+            .where(Session.account_id == self.id)
+            .order_by(Session.updated_at.desc(), Session.created_at.desc())
+            .offset(CONFIG.SESSIONS_MAX_PER_ACCOUNT)
+        )
+        query = (
+            delete(Session)
+            .where(Session.id.in_(excess_sessions))
+            .returning(Session.id)
+            .execution_options(synchronize_session=False)
+        )
+        session_ids = (await session.execute(query)).scalars().all()
+        await RevokedSession.create_many(session, session_ids)
+
     async def _get_password_hash(self: Self, session: AsyncSession) -> PasswordHash:
         query = select(PasswordHash).where(PasswordHash.account_id == self.id)
         row = (await session.execute(query)).one()
@@ -144,14 +237,18 @@ class Account(Base):
         return typing.cast(Session, row.Session)
 
     async def delete_all_sessions(self: Self, session: AsyncSession) -> None:
-        query = delete(Session).where(Session.account_id == self.id)
-        await session.execute(query)
+        query = delete(Session).where(Session.account_id == self.id).returning(Session.id)
+        session_ids = (await session.execute(query)).scalars().all()
+        await RevokedSession.create_many(session, session_ids)
         await session.flush()
 
     async def get_profile(self: Self, session: AsyncSession) -> Profile:
-        query = select(Profile).where(Profile.account_id == self.id)
-        row = (await session.execute(query)).one()
-        return typing.cast(Profile, row.Profile)
+        async def get_profile() -> Profile:
+            query = select(Profile).where(Profile.account_id == self.id)
+            row = (await session.execute(query)).one()
+            return typing.cast(Profile, row.Profile)
+
+        return await single_flight.run(session, ("Account.get_profile", self.id.value), get_profile)
 
     async def get_friendships(self: Self, session: AsyncSession) -> list[Friendship]:
         query = select(Friendship).where(Friendship.account_id == self.id).order_by(Friendship.created_at.desc())
@@ -170,6 +267,88 @@ class Account(Base):
             )
         )
         await session.execute(query)
+        invalidate_friends(session, self.id, friend_id)
+
+    async def get_friendship_suggestions(
+        self: Self,
+        session: AsyncSession,
+        limit: int,
+        offset: int,
+    ) -> list[FriendshipSuggestion]:
+        """Get friends of friends ranked by the number of mutual friends.
+
+        Suggestions are computed with a single query, which reads only primary key index of friendships.
+        """
+        friendship = aliased(Friendship)
+        friend_friendship = aliased(Friendship)
+        mutual_friends = func.count().label("mutual_friends")
+        query = (
+            select(friend_friendship.friend_id.label("account_id"), mutual_friends)
+            .select_from(friendship)
+            .join(friend_friendship, friend_friendship.account_id == friendship.friend_id)
+            .where(
+                friendship.account_id == self.id,
+                friend_friendship.friend_id != self.id,
+                ~exists().where(
+                    (Friendship.account_id == self.id) & (Friendship.friend_id == friend_friendship.friend_id),
+                ),
+            )
+            .group_by(friend_friendship.friend_id)
+            .order_by(mutual_friends.desc(), friend_friendship.friend_id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await session.execute(query)).all()
+        return [FriendshipSuggestion(account_id=row.account_id, mutual_friends=row.mutual_friends) for row in rows]
+
+    @staticmethod
+    async def get_mutual_friends(
+        session: AsyncSession,
+        account_id: Id,
+        other_id: Id,
+        limit: int,
+        offset: int,
+    ) -> MutualFriends:
+        """Get friends which two accounts have in common.
+
+        Existence of both accounts, total count and the requested page are read with a single query,
+        one row is returned even if the page is empty, so the count is never lost.
+        """
+        other_friendship = aliased(Friendship)
+        mutual_friends = (
+            select(Friendship.friend_id)
+            .join(
+                other_friendship,
+                (other_friendship.account_id == other_id) & (other_friendship.friend_id == Friendship.friend_id),
+            )
+            .where(Friendship.account_id == account_id)
+            .cte("mutual_friends")
+        )
+        total = select(func.count().label("total")).select_from(mutual_friends).subquery("total")
+        page = (
+            select(mutual_friends.c.friend_id)
+            .order_by(mutual_friends.c.friend_id)
+            .limit(limit)
+            .offset(offset)
+            .subquery("page")
+        )
+        query = (
+            select(
+                exists().where(Account.id == account_id).label("account_exists"),
+                exists().where(Account.id == other_id).label("other_exists"),
+                total.c.total,
+                page.c.friend_id,
+            )
+            .select_from(total.outerjoin(page, true()))
+            .order_by(page.c.friend_id)
+        )
+        rows = (await session.execute(query)).all()
+        if not (rows[0].account_exists and rows[0].other_exists):
+            raise AccountNotFoundError()
+        return MutualFriends(
+            account_ids=[row.friend_id for row in rows if row.friend_id is not None],
+            count=rows[0].total,
+        )
 
     async def get_friendship_requests(self: Self, session: AsyncSession) -> list[FriendshipRequest]:
         query = (
@@ -202,9 +381,12 @@ class Account(Base):
         return typing.cast(Wish, row.Wish)
 
     async def get_wishes(self: Self, session: AsyncSession) -> list[Wish]:
-        query = select(Wish).where(Wish.account_id == self.id).order_by(Wish.created_at.desc())
-        rows = (await session.execute(query)).all()
-        return [typing.cast(Wish, row.Wish) for row in rows]
+        async def get_wishes() -> list[Wish]:
+            query = select(Wish).where(Wish.account_id == self.id).order_by(Wish.created_at.desc())
+            rows = (await session.execute(query)).all()
+            return [typing.cast(Wish, row.Wish) for row in rows]
+
+        return await single_flight.run(session, ("Account.get_wishes", self.id.value), get_wishes)
 
     async def get_wish_bookings(self: Self, session: AsyncSession) -> list[WishBooking]:
         query = (
@@ -216,9 +398,13 @@ class Account(Base):
         return [typing.cast(WishBooking, row.WishBooking) for row in rows]
 
     async def has_friend(self: Self, session: AsyncSession, friend_id: Id) -> bool:
-        query = select(Friendship).where((Friendship.account_id == self.id) & (Friendship.friend_id == friend_id))
-        row = (await session.execute(query)).one_or_none()
-        return row is not None
+        friend_ids = friends_cache.get(self.id)
+        if friend_ids is None:
+            version = friends_cache.version
+            query = select(Friendship.friend_id).where(Friendship.account_id == self.id)
+            friend_ids = frozenset(row.friend_id.value for row in (await session.execute(query)).all())
+            friends_cache.set(self.id, friend_ids, version)
+        return friend_id.value in friend_ids
 
 
 class PasswordHash(Base):
@@ -232,17 +418,8 @@ class PasswordHash(Base):
     value: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
 
     @staticmethod
-    async def create(session: AsyncSession, password: AccountPassword, account: Account) -> PasswordHash:
-        hash_value = PasswordHash._generate_hash(password)
-        password_hash = PasswordHash(
-            value=hash_value,
-            account_id=account.id,
-            created_at=account.created_at,
-            updated_at=account.updated_at,
-        )
-        session.add(password_hash)
-        await session.flush()
-        return password_hash
+    async def generate_value(password: AccountPassword) -> bytes:
+        return await _run_bcrypt(PasswordHash._generate_hash, password)
 
     @staticmethod
     def _generate_hash(password: AccountPassword) -> bytes:
@@ -263,5 +440,13 @@ class PasswordHash(Base):
 
     async def check_password(self: Self, password: AccountPassword) -> None:
         byte_password = self._encode_password(password)
-        if not bcrypt.checkpw(byte_password, self.value):
+        if not await _run_bcrypt(bcrypt.checkpw, byte_password, self.value):
             raise AccountNotFoundError()
+
+
+async def _run_bcrypt(function: Callable[..., _T], *args: Any) -> _T:
+    BCRYPT_QUEUE_DEPTH.inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_BCRYPT_EXECUTOR, function, *args)
+    finally:
+        BCRYPT_QUEUE_DEPTH.dec()
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
 import src.routes
+from src.account.existence import existing_accounts
+from src.auth.pruning import run_sessions_pruning
+from src.auth.revocation import revoked_sessions
+from src.config import CONFIG
+from src.file.thumbnails import thumbnails_executor
+from src.shared.database import POSTGRES_CONNECTION_DSN, replicas
 from src.shared.exceptions import (
     BadRequestException,
     NotAllowedException,
@@ -13,13 +21,38 @@ from src.shared.exceptions import (
     NotFoundException,
     TooLargeException,
 )
+from src.shared.invalidation import invalidation_bus
+from src.shared.metrics import HTTP_EXCEPTIONS_TOTAL, MetricsMiddleware
+from src.shared.openapi import load_openapi
+from src.shared.profiling import QueryStatisticsMiddleware
+from src.shared.tracing import instrument
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from fastapi import Request
 
 
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:  # pragma: no cover
+    """Run background tasks needed by each worker process while the app is running."""
+    existing_accounts_monitor = asyncio.create_task(existing_accounts.monitor())
+    invalidation_listener = asyncio.create_task(invalidation_bus.listen(POSTGRES_CONNECTION_DSN))
+    replicas_monitor = asyncio.create_task(replicas.monitor())
+    revoked_sessions_monitor = asyncio.create_task(revoked_sessions.monitor())
+    sessions_pruning = asyncio.create_task(run_sessions_pruning())
+    yield
+    existing_accounts_monitor.cancel()
+    invalidation_listener.cancel()
+    replicas_monitor.cancel()
+    revoked_sessions_monitor.cancel()
+    sessions_pruning.cancel()
+    thumbnails_executor.shutdown()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="WLSS API",
     description="Backend API for Wish List Sharing Service.",
     openapi_tags=[
@@ -56,9 +89,19 @@ app = FastAPI(
 
 app.include_router(src.routes.router)
 
+if CONFIG.OPENAPI_PREBUILT:  # pragma: no cover
+    load_openapi(app, CONFIG.OPENAPI_FILE)
+
+app.add_middleware(QueryStatisticsMiddleware)
+app.add_middleware(MetricsMiddleware)
+
+if CONFIG.TRACING_ENABLED:  # pragma: no cover
+    instrument(app, CONFIG.TRACING_FILE)
+
 
 @app.exception_handler(BadRequestException)
 async def handle_bad_request(_: Request, exception: BadRequestException) -> JSONResponse:
+    HTTP_EXCEPTIONS_TOTAL.labels(type(exception).__name__, exception.status_code).inc()
     return JSONResponse(
         status_code=exception.status_code,
         content={
@@ -71,6 +114,7 @@ async def handle_bad_request(_: Request, exception: BadRequestException) -> JSON
 
 @app.exception_handler(NotAllowedException)
 async def handle_not_allowed(_: Request, exception: NotAllowedException) -> JSONResponse:
+    HTTP_EXCEPTIONS_TOTAL.labels(type(exception).__name__, exception.status_code).inc()
     return JSONResponse(
         status_code=exception.status_code,
         content={
@@ -83,6 +127,7 @@ async def handle_not_allowed(_: Request, exception: NotAllowedException) -> JSON
 
 @app.exception_handler(NotAuthenticatedException)
 async def handle_not_authenticated(_: Request, exception: NotAuthenticatedException) -> JSONResponse:
+    HTTP_EXCEPTIONS_TOTAL.labels(type(exception).__name__, exception.status_code).inc()
     return JSONResponse(
         status_code=exception.status_code,
         content={
@@ -94,6 +139,7 @@ async def handle_not_authenticated(_: Request, exception: NotAuthenticatedExcept
 
 @app.exception_handler(NotFoundException)
 async def handle_not_found(_: Request, exception: NotFoundException) -> JSONResponse:
+    HTTP_EXCEPTIONS_TOTAL.labels(type(exception).__name__, exception.status_code).inc()
     return JSONResponse(
         status_code=exception.status_code,
         content={
@@ -106,6 +152,7 @@ async def handle_not_found(_: Request, exception: NotFoundException) -> JSONResp
 
 @app.exception_handler(TooLargeException)
 async def handle_too_large(_: Request, exception: TooLargeException) -> JSONResponse:
+    HTTP_EXCEPTIONS_TOTAL.labels(type(exception).__name__, exception.status_code).inc()
     return JSONResponse(
         status_code=exception.status_code,
         content={
@@ -61,6 +61,7 @@ async def refresh_tokens(
         raise CannotRefreshTokensError()
 
     auth_session = await current_account.get_session(session, session_id)
+    await auth_session.prolong(session)
     access_token = schemas.AccessTokenPayload(
         account_id=auth_session.account_id,
         created_at=UtcDatetime(datetime.now(tz=timezone.utc)),
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.account.exceptions import AccountNotFoundError
 from src.account.models import Account
 from src.auth.exceptions import InvalidCredentialsError, SessionNotFoundError, TokenExpiredError
+from src.auth.revocation import revoked_sessions
 from src.auth.schemas import AccessTokenPayload, RefreshTokenPayload
 from src.config import CONFIG
 from src.shared.database import get_session
@@ -42,9 +43,14 @@ async def get_account_from_access_token(
     if datetime_now > payload.created_at.value + timedelta(days=CONFIG.DAYS_BEFORE_ACCESS_TOKEN_EXPIRATION):
         raise TokenExpiredError()
 
+    if revoked_sessions.is_revoked(payload.session_id):
+        raise InvalidCredentialsError()
+
     try:  # pylint: disable=too-many-try-statements
         current_account = await Account.get(session, payload.account_id)
-        await current_account.get_session(session, payload.session_id)
+        if not revoked_sessions.is_fresh:
+            # recently revoked sessions could be missed, so the session is checked in the database
+            await current_account.get_session(session, payload.session_id)
     except (SessionNotFoundError, AccountNotFoundError):
         # pylint: disable-next=raise-missing-from
         raise InvalidCredentialsError()  # noqa: B904,TRY200
@@ -76,9 +82,14 @@ async def get_account_from_refresh_token(
     if datetime_now > payload.created_at.value + timedelta(days=CONFIG.DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION):
         raise TokenExpiredError()
 
+    if revoked_sessions.is_revoked(payload.session_id):
+        raise InvalidCredentialsError()
+
     try:  # pylint: disable=too-many-try-statements
         current_account = await Account.get(session, payload.account_id)
-        await current_account.get_session(session, payload.session_id)
+        if not revoked_sessions.is_fresh:
+            # recently revoked sessions could be missed, so the session is checked in the database
+            await current_account.get_session(session, payload.session_id)
     except (SessionNotFoundError, AccountNotFoundError):
         # pylint: disable-next=raise-missing-from
         raise InvalidCredentialsError()  # noqa: B904,TRY200
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import delete, ForeignKey, UUID
+from sqlalchemy import delete, ForeignKey, insert, select, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from wlss.shared.types import Id, UtcDatetime
 
+from src.config import CONFIG
 from src.shared.columns import UtcDatetimeColumn
 from src.shared.database import Base
 from src.shared.datetime import utcnow
+from src.shared.invalidation import Entity, InvalidationEvent, publish
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from typing import Self
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,11 +28,85 @@ class Session(Base):  # pylint: disable=too-few-public-methods
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)  # noqa: A003
 
-    account_id: Mapped[Id] = mapped_column(ForeignKey("account.id"), nullable=False)
+    account_id: Mapped[Id] = mapped_column(ForeignKey("account.id"), nullable=False, index=True)
     created_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False)
-    updated_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False, onupdate=utcnow)
+    # it's updated each time tokens are refreshed, so session is expired when its last refresh token is expired
+    updated_at: Mapped[UtcDatetime] = mapped_column(
+        UtcDatetimeColumn,
+        default=utcnow,
+        nullable=False,
+        onupdate=utcnow,
+        index=True,
+    )
 
     async def delete(self: Self, session: AsyncSession) -> None:
         query = delete(Session).where(Session.id == self.id)
         await session.execute(query)
+        await RevokedSession.create_many(session, [self.id])
         await session.flush()
+
+    async def prolong(self: Self, session: AsyncSession) -> None:
+        self.updated_at = utcnow()
+        await session.flush()
+
+    @staticmethod
+    async def delete_expired(session: AsyncSession, batch_size: int) -> int:
+        """Delete batch of sessions whose refresh tokens are expired, number of deleted sessions is returned.
+
+        Sessions are not logged as revoked, since all their tokens are expired anyway.
+        Sessions locked by other transactions are skipped, so concurrent pruning by several workers doesn't block.
+        """
+        expired_before = datetime.now(tz=timezone.utc) - timedelta(days=CONFIG.DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION)
+        expired_sessions = (
+            select(Session.id)
+            .where(Session.updated_at < expired_before)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            delete(Session)
+            .where(Session.id.in_(expired_sessions))
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(query)
+        return int(result.rowcount)  # type: ignore[attr-defined]
+
+
+class RevokedSession(Base):  # pylint: disable=too-few-public-methods
+    """Log of deleted sessions.
+
+    It's read by each worker periodically, so tokens of deleted sessions are rejected without database queries.
+    """
+
+    __tablename__ = "revoked_session"
+
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True)
+
+    created_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False, index=True)
+
+    @staticmethod
+    async def create_many(session: AsyncSession, session_ids: Sequence[uuid.UUID]) -> None:
+        if not session_ids:
+            return
+        query = insert(RevokedSession).values([{"session_id": session_id} for session_id in session_ids])
+        await session.execute(query)
+        keys = [str(session_id) for session_id in session_ids]
+        publish(session, InvalidationEvent(entity=Entity.SESSION, keys=keys))
+
+    @staticmethod
+    async def delete_expired(session: AsyncSession, batch_size: int) -> int:
+        """Delete batch of log records older than refresh tokens expiration, number of deleted records is returned."""
+        expired_before = datetime.now(tz=timezone.utc) - timedelta(days=CONFIG.DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION)
+        expired_records = (
+            select(RevokedSession.session_id)
+            .where(RevokedSession.created_at < expired_before)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            delete(RevokedSession)
+            .where(RevokedSession.session_id.in_(expired_records))
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(query)
+        return int(result.rowcount)  # type: ignore[attr-defined]
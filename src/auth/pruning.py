@@ -0,0 +1,48 @@
+"""Pruning of expired sessions and revoked sessions log, so these tables don't grow without bound."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.auth.models import RevokedSession, Session
+from src.config import CONFIG
+from src.shared.database import async_session
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+
+async def prune_sessions(session: AsyncSession, batch_size: int) -> int:
+    """Delete expired sessions and revoked sessions log records, number of deleted rows is returned.
+
+    Rows are deleted in batches and each batch is committed separately, so rows are not locked for a long time.
+    """
+    deleted = 0
+    for delete_expired in (Session.delete_expired, RevokedSession.delete_expired):
+        while True:  # pylint: disable=while-used
+            count = await delete_expired(session, batch_size)
+            await session.commit()
+            deleted += count
+            if count < batch_size:
+                break
+    return deleted
+
+
+async def run_sessions_pruning() -> None:  # pragma: no cover
+    """Prune sessions every `SESSIONS_PRUNING_INTERVAL_SECONDS`. Supposed to be run as a background task."""
+    while True:  # pylint: disable=while-used
+        try:
+            async with async_session() as session:
+                deleted = await prune_sessions(session, CONFIG.SESSIONS_PRUNING_BATCH_SIZE)
+            logger.info("Pruned %s expired sessions and revoked sessions log records.", deleted)
+        except (OSError, SQLAlchemyError):
+            logger.warning("Sessions are not pruned.", exc_info=True)
+        await asyncio.sleep(CONFIG.SESSIONS_PRUNING_INTERVAL_SECONDS)
@@ -0,0 +1,104 @@
+"""Revoked sessions kept in memory of each worker process, so tokens are checked without database queries."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.auth.models import RevokedSession
+from src.config import CONFIG
+from src.shared.database import async_session
+from src.shared.invalidation import Entity, invalidation_bus
+
+
+if TYPE_CHECKING:
+    from typing import Final, Self
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+# log is re-read with this overlap, so sessions revoked by transactions which were committed later
+# than they had written their log records are not missed; it's longer than any transaction lasts
+_LOOKBACK: Final = timedelta(minutes=1)
+
+
+class RevokedSessions:
+    """Sessions which were deleted while their tokens could still be not expired.
+
+    The set is filled from `revoked_session` log and it's refreshed every `REVOKED_SESSIONS_REFRESH_SECONDS`,
+    so deletion of a session is seen by all workers in that time. Usually it's seen earlier, since revoked sessions
+    are also added once invalidation event is received. Sessions revoked earlier than refresh tokens
+    expiration are forgotten since their tokens are rejected anyway.
+
+    Token of the session which is not in the set is valid only if the set is fresh, otherwise the set
+    can miss some of the recently revoked sessions (it's not loaded yet or database is unavailable for a while),
+    so session should be checked in the database.
+    """
+
+    def __init__(self: Self) -> None:
+        self._sessions: dict[UUID, datetime] = {}  # session id -> time of revocation
+        self._refreshed_at: float | None = None  # monotonic time of the last successful refresh
+        self._read_since: datetime | None = None  # `None` means that the whole log should be read
+
+    @property
+    def is_fresh(self: Self) -> bool:
+        if self._refreshed_at is None:
+            return False
+        return time.monotonic() - self._refreshed_at <= 3 * CONFIG.REVOKED_SESSIONS_REFRESH_SECONDS
+
+    def is_revoked(self: Self, session_id: UUID) -> bool:
+        return session_id in self._sessions
+
+    def revoke(self: Self, session_id: UUID) -> None:
+        self._sessions.setdefault(session_id, datetime.now(tz=timezone.utc))
+
+    async def refresh(self: Self, session: AsyncSession) -> None:
+        started_at = time.monotonic()
+        query = select(RevokedSession.session_id, RevokedSession.created_at)
+        if self._read_since is not None:
+            query = query.where(RevokedSession.created_at >= self._read_since - _LOOKBACK)
+        rows = (await session.execute(query)).all()
+
+        for row in rows:
+            self._sessions[row.session_id] = row.created_at.value
+            if self._read_since is None or row.created_at.value > self._read_since:
+                self._read_since = row.created_at.value
+        if self._read_since is None:
+            self._read_since = datetime.now(tz=timezone.utc)
+
+        expired_before = datetime.now(tz=timezone.utc) - timedelta(days=CONFIG.DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION)
+        for session_id, revoked_at in list(self._sessions.items()):
+            if revoked_at < expired_before:
+                del self._sessions[session_id]
+        self._refreshed_at = started_at
+
+    async def monitor(self: Self) -> None:  # pragma: no cover
+        """Periodically refresh revoked sessions. Supposed to be run as a background task."""
+        while True:  # pylint: disable=while-used
+            try:
+                async with async_session() as session:
+                    await self.refresh(session)
+            except (OSError, SQLAlchemyError):
+                logger.warning("Revoked sessions are not refreshed.", exc_info=True)
+            await asyncio.sleep(CONFIG.REVOKED_SESSIONS_REFRESH_SECONDS)
+
+
+revoked_sessions = RevokedSessions()
+
+
+def _handle_session_event(keys: list[str]) -> None:
+    for key in keys:
+        revoked_sessions.revoke(UUID(key))
+
+
+# there is no reset, since sessions revoked while events could be lost are read from the log with the next refresh
+invalidation_bus.subscribe(Entity.SESSION, _handle_session_event)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import jwt
@@ -10,10 +10,11 @@ from api.account.fields import AccountEmailField, AccountLoginField, AccountPass
 from api.shared.fields import IdField, UtcDatetimeField, UuidField
 from api.shared.schemas import Schema
 from src.config import CONFIG
+from src.shared.cache import ExpiringLruCache
 
 
 if TYPE_CHECKING:
-    from typing import Self
+    from typing import Final, Self
 
 
 class Credentials(Schema):
@@ -22,6 +23,11 @@ class Credentials(Schema):
     password: AccountPasswordField
 
 
+# clients send the same access token with many consecutive requests,
+# so payloads are cached to skip signature verification and validation of the payload
+_DECODED_ACCESS_TOKENS: Final[ExpiringLruCache[str, AccessTokenPayload]] = ExpiringLruCache(max_size=10000)
+
+
 class AccessTokenPayload(Schema):
     account_id: IdField
     created_at: UtcDatetimeField
@@ -31,8 +37,15 @@ class AccessTokenPayload(Schema):
 
     @classmethod
     def decode(cls: type[AccessTokenPayload], token: str) -> AccessTokenPayload:
-        payload = jwt.decode(token, CONFIG.SECRET_KEY, ["HS256"])
-        return cls.model_validate(payload)
+        """Decode the token, payload of the token is cached by the token itself until the token is expired."""
+        cached_payload = _DECODED_ACCESS_TOKENS.get(token)
+        if cached_payload is not None:
+            return cached_payload
+        payload = cls.model_validate(jwt.decode(token, CONFIG.SECRET_KEY, ["HS256"]))
+        expires_at = payload.created_at.value + timedelta(days=CONFIG.DAYS_BEFORE_ACCESS_TOKEN_EXPIRATION)
+        if expires_at > datetime.now(tz=timezone.utc):  # expired token would only push out tokens which are in use
+            _DECODED_ACCESS_TOKENS.set(token, payload, expires_at)
+        return payload
 
     def encode(self: Self) -> str:
         # double check that generated token doesn't have "created_at" pointing to future
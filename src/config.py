@@ -5,6 +5,7 @@ from typing import Any, TYPE_CHECKING, TypeVar
 from pydantic import (
     field_validator,
     PositiveFloat,  # noqa: TCH002
+    PositiveInt,  # noqa: TCH002
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -23,20 +24,43 @@ class _Config(BaseSettings):
     DAYS_BEFORE_ACCESS_TOKEN_EXPIRATION: PositiveFloat
     DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION: PositiveFloat
 
+    EXISTING_ACCOUNTS_CAPACITY: PositiveInt  # expected number of accounts, more of them make filters less accurate
+    EXISTING_ACCOUNTS_REFRESH_SECONDS: PositiveFloat  # how fast new account is seen by match endpoints of all workers
+
+    FRIENDS_CACHE_EXPIRATION_SECONDS: PositiveFloat  # how fast friendship changes are seen by other workers
+
+    INVALIDATION_CHECK_SECONDS: PositiveFloat  # how fast lost connection of invalidation events listener is restored
+
     MINIO_HOST: str
     MINIO_PORT: str
     MINIO_ROOT_PASSWORD: str
     MINIO_ROOT_USER: str
     MINIO_SCHEMA: UrlSchema
 
+    OPENAPI_FILE: str  # path to the file with OpenAPI schema built by `python -m src.shared.openapi`
+    OPENAPI_PREBUILT: bool  # load OpenAPI schema from the file instead of generating it on the first request
+
     POSTGRES_DB: str
     POSTGRES_HOST: str
     POSTGRES_PASSWORD: str
     POSTGRES_PORT: str
+    POSTGRES_READ_YOUR_WRITES_SECONDS: PositiveFloat
+    POSTGRES_REPLICA_LAG_CHECK_SECONDS: PositiveFloat
+    POSTGRES_REPLICA_MAX_LAG_SECONDS: PositiveFloat
+    POSTGRES_REPLICAS: list[str]  # list of "host:port" strings, for example: ["localhost:5434"]
     POSTGRES_USER: str
 
+    REVOKED_SESSIONS_REFRESH_SECONDS: PositiveFloat  # how fast deletion of a session is seen by all workers
+
     SECRET_KEY: str
 
+    SESSIONS_MAX_PER_ACCOUNT: PositiveInt  # the least recently used sessions are deleted when limit is exceeded
+    SESSIONS_PRUNING_BATCH_SIZE: PositiveInt
+    SESSIONS_PRUNING_INTERVAL_SECONDS: PositiveFloat
+
+    TRACING_ENABLED: bool
+    TRACING_FILE: str  # path to the file where finished traces are written to if tracing is enabled
+
     model_config = SettingsConfigDict(env_file=get_dotenv_path(), extra="allow", frozen=True)
 
     @field_validator("*")
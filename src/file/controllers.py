@@ -6,9 +6,10 @@ from typing import TYPE_CHECKING
 from fastapi import status
 
 from api.file.dtos import CreateFileResponse, GetFileResponse
+from api.file.enums import MimeType
 from src.config import CONFIG
 from src.file.models import File
-from src.file.schemas import NewFile
+from src.file.thumbnails import choose_size, create_thumbnails
 from src.shared.minio import Minio
 
 
@@ -19,34 +20,38 @@ if TYPE_CHECKING:
     from fastapi import BackgroundTasks
     from sqlalchemy.ext.asyncio import AsyncSession
 
-    from api.file.dtos import CreateFileRequest
     from src.account.models import Account
+    from src.file.schemas import NewFile
 
 
 async def create_file(
     background_tasks: BackgroundTasks,
-    request_data: CreateFileRequest,
+    new_file: NewFile,
     current_account: Account,  # noqa: ARG001
     session: AsyncSession,
 ) -> CreateFileResponse:
-    new_file = NewFile.from_(request_data)
-    file = await File.create_file(session, new_file)
-    minio = Minio(
-        CONFIG.MINIO_SCHEMA,
-        CONFIG.MINIO_HOST,
-        CONFIG.MINIO_PORT,
-        CONFIG.MINIO_ROOT_USER,
-        CONFIG.MINIO_ROOT_PASSWORD,
-    )
-    minio.upload_file(file.id, new_file.tmp_file_path)
-
-    background_tasks.add_task(shutil.rmtree, new_file.tmp_file_path.parent)
+    file, is_new_content = await File.create_file(session, new_file)
+    # content which is already stored is not uploaded again, its thumbnails are already made too
+    if is_new_content:
+        minio = Minio(
+            CONFIG.MINIO_SCHEMA,
+            CONFIG.MINIO_HOST,
+            CONFIG.MINIO_PORT,
+            CONFIG.MINIO_ROOT_USER,
+            CONFIG.MINIO_ROOT_PASSWORD,
+        )
+        minio.upload_file(file.object_name, new_file.tmp_file_path)
+        # temporary directory is removed by the same task, since tasks after the failed one are not run
+        background_tasks.add_task(create_thumbnails, minio, file.object_name, new_file.tmp_file_path)
+    else:
+        background_tasks.add_task(shutil.rmtree, new_file.tmp_file_path.parent)
     return CreateFileResponse.model_validate(file, from_attributes=True)
 
 
 async def get_file(
     background_tasks: BackgroundTasks,
     file_id: UUID,
+    size: int | None,
     tmp_dir: Path,
     session: AsyncSession,
 ) -> GetFileResponse:
@@ -58,10 +63,20 @@ async def get_file(
         CONFIG.MINIO_ROOT_USER,
         CONFIG.MINIO_ROOT_PASSWORD,
     )
-    file_path = tmp_dir / file.name.value
-    minio.download_file(file.id, file_path)
-
     background_tasks.add_task(shutil.rmtree, tmp_dir)
+
+    # original file is returned if there is no thumbnail of such size or thumbnails are not made yet
+    thumbnail_size = None if size is None else choose_size(size)
+    thumbnail_path = (tmp_dir / file.name.value).with_suffix(".webp")
+    if thumbnail_size is not None and minio.download_thumbnail(file.object_name, thumbnail_size, thumbnail_path):
+        return GetFileResponse(
+            thumbnail_path,
+            status_code=status.HTTP_200_OK,
+            media_type=MimeType.IMAGE_WEBP.value,
+        )
+
+    file_path = tmp_dir / file.name.value
+    minio.download_file(file.object_name, file_path)
     return GetFileResponse(
         file_path,
         status_code=status.HTTP_200_OK,
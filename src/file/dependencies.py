@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import tempfile
 from pathlib import Path
 from typing import Annotated, TYPE_CHECKING
@@ -10,8 +11,8 @@ from pydantic import ValidationError
 from wlss.file.types import FileName
 
 from api.file.constants import EOF_BYTE, MAX_SIZE, MEGABYTE
-from api.file.dtos import CreateFileRequest
 from src.file.exceptions import FileTooLarge
+from src.file.schemas import NewFile
 
 
 if TYPE_CHECKING:
@@ -26,15 +27,16 @@ async def get_tmp_dir() -> Path:
 async def get_new_file(
     file_request: Annotated[UploadFile, File(..., alias="file", validation_alias="file")],
     tmp_dir: Annotated[Path, Depends(get_tmp_dir)],
-) -> AsyncIterator[CreateFileRequest]:
+) -> AsyncIterator[NewFile]:
     filename = Path(file_request.filename or "")
     extension = filename.suffix.lstrip(".").lower()
 
     file_path = Path(tmp_dir) / filename
-    size = _download_file(file_path, file_request.file)
+    size, digest = _download_file(file_path, file_request.file)
 
     try:
-        yield CreateFileRequest(
+        yield NewFile(
+            digest=digest,
             extension=extension,
             mime_type=file_request.content_type,
             name=FileName(str(filename)),
@@ -45,15 +47,18 @@ async def get_new_file(
         raise RequestValidationError(e.errors()) from None
 
 
-def _download_file(dst_path: Path, file_data: BinaryIO) -> int:
+def _download_file(dst_path: Path, file_data: BinaryIO) -> tuple[int, str]:
+    """Save file and return its size and hex SHA-256 digest, which is calculated while the file is saved."""
+    digest = hashlib.sha256()
     with dst_path.open("wb") as f:
         size = 0
         chunk_data = None
         while chunk_data != EOF_BYTE:  # pylint: disable=while-used
             chunk_data = file_data.read(10 * MEGABYTE)
             chunk_size = f.write(chunk_data)
+            digest.update(chunk_data)
 
             size += chunk_size
             if size > MAX_SIZE:
                 raise FileTooLarge()
-    return size
+    return size, digest.hexdigest()
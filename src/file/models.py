@@ -4,7 +4,8 @@ import typing
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, select, text, UUID
+from sqlalchemy import delete, Enum, ForeignKey, Integer, literal, select, String, text, update, UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Mapped, mapped_column
 from wlss.file.types import FileName, FileSize
 from wlss.shared.types import UtcDatetime
@@ -18,18 +19,37 @@ from src.shared.datetime import utcnow
 
 
 if TYPE_CHECKING:
+    from typing import Self
 
+    from sqlalchemy import Table
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.file.schemas import NewFile
 
 
+class Blob(Base):  # pylint: disable=too-few-public-methods
+    """Content of uploaded files, which is stored in MinIO once no matter how many times it was uploaded.
+
+    Blob with zero references is kept, so its object can be removed from MinIO later.
+    """
+
+    __tablename__ = "blob"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)  # hex SHA-256 of the content
+
+    created_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False)
+    reference_count: Mapped[int] = mapped_column(Integer, nullable=False)  # number of files with this content
+    size: Mapped[FileSize] = mapped_column(FileSizeColumn, nullable=False)
+
+
 class File(Base):
 
     __tablename__ = "file"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID, primary_key=True, default=uuid.uuid4)  # noqa: A003
 
+    # files uploaded before deduplication of the content have no blob
+    blob_digest: Mapped[str | None] = mapped_column(ForeignKey("blob.digest"))
     created_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False)
     extension: Mapped[Extension] = mapped_column(Enum(Extension, name="extension_enum"), nullable=False)
     mime_type: Mapped[MimeType] = mapped_column(Enum(MimeType, name="mime_type_enum"), nullable=False)
@@ -37,17 +57,82 @@ class File(Base):
     size: Mapped[FileSize] = mapped_column(FileSizeColumn, nullable=False)
     updated_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False, onupdate=utcnow)
 
+    @property
+    def object_name(self: Self) -> str:
+        """Name of MinIO object with content of the file."""
+        return self.blob_digest or str(self.id)
+
+    @classmethod
+    async def create_file(cls: type[File], session: AsyncSession, new_file: NewFile) -> tuple[File, bool]:
+        """Create file and reference its blob with a single statement.
+
+        Returned flag is `True` if there were no other references to the blob, so its content should be uploaded.
+        Concurrent uploads of the same content wait for each other on the blob row, so the content is already
+        uploaded once the flag is `False`.
+        """
+        file_id = uuid.uuid4()
+        now = utcnow()
+        # statements are built from tables, since ORM statements can't be used inside of CTE
+        blobs = typing.cast("Table", Blob.__table__)
+        files = typing.cast("Table", File.__table__)
+
+        blob = (
+            insert(blobs)
+            .values(created_at=now, digest=new_file.digest, reference_count=1, size=new_file.size)
+            .on_conflict_do_update(
+                index_elements=[blobs.c.digest],
+                set_={"reference_count": blobs.c.reference_count + 1},
+            )
+            .returning(blobs.c.digest, blobs.c.reference_count)
+            .cte("referenced_blob")
+        )
+        file = (
+            insert(files)
+            .from_select(
+                ["id", "blob_digest", "created_at", "extension", "mime_type", "name", "size", "updated_at"],
+                select(
+                    literal(file_id, files.c.id.type),
+                    blob.c.digest,
+                    literal(now, UtcDatetimeColumn),
+                    literal(new_file.extension, files.c.extension.type),
+                    literal(new_file.mime_type, files.c.mime_type.type),
+                    literal(new_file.name, files.c.name.type),
+                    literal(new_file.size, files.c.size.type),
+                    literal(now, UtcDatetimeColumn),
+                ),
+            )
+            .cte("new_file")
+        )
+        query = select(blob.c.reference_count).add_cte(file)
+        row = (await session.execute(query)).one()
+
+        return (
+            File(
+                id=file_id,
+                blob_digest=new_file.digest,
+                created_at=now,
+                extension=new_file.extension,
+                mime_type=new_file.mime_type,
+                name=new_file.name,
+                size=new_file.size,
+                updated_at=now,
+            ),
+            row.reference_count == 1,
+        )
+
     @classmethod
-    async def create_file(cls: type[File], session: AsyncSession, new_file: NewFile) -> File:
-        file = File(
-            extension=new_file.extension,
-            mime_type=new_file.mime_type,
-            name=new_file.name,
-            size=new_file.size,
+    async def delete_file(cls: type[File], session: AsyncSession, file_id: uuid.UUID) -> None:
+        """Delete file and release its blob with a single statement."""
+        blobs = typing.cast("Table", Blob.__table__)
+        files = typing.cast("Table", File.__table__)
+
+        file = delete(files).where(files.c.id == file_id).returning(files.c.blob_digest).cte("deleted_file")
+        query = (
+            update(blobs)
+            .where(blobs.c.digest.in_(select(file.c.blob_digest)))
+            .values(reference_count=blobs.c.reference_count - 1)
         )
-        session.add(file)
-        await session.flush()
-        return file
+        await session.execute(query)
 
     @classmethod
     async def get(cls: type[File], session: AsyncSession, file_id: uuid.UUID) -> File:
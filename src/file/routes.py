@@ -3,15 +3,16 @@ from __future__ import annotations
 import pathlib
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Path, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.file.dtos import CreateFileRequest, CreateFileResponse, GetFileResponse
+from api.file.dtos import CreateFileResponse, GetFileResponse
 from api.shared.fields import UuidField
 from src.account.models import Account
 from src.auth.dependencies import get_account_from_access_token
 from src.file import controllers
 from src.file.dependencies import get_new_file, get_tmp_dir
+from src.file.schemas import NewFile
 from src.shared import swagger as shared_swagger
 from src.shared.database import get_session
 
@@ -32,16 +33,20 @@ router = APIRouter(tags=["file"])
 )
 async def create_file(
     background_tasks: BackgroundTasks,
-    request_data: Annotated[CreateFileRequest, Depends(get_new_file)],
+    new_file: Annotated[NewFile, Depends(get_new_file)],
     current_account: Annotated[Account, Depends(get_account_from_access_token)],
     session: AsyncSession = Depends(get_session),
 ) -> CreateFileResponse:
-    return await controllers.create_file(background_tasks, request_data, current_account, session)
+    return await controllers.create_file(background_tasks, new_file, current_account, session)
 
 
 @router.get(
     "/files/{file_id}",
-    description="Get (download) uploaded file.",
+    description=(
+        "Get (download) uploaded file. If `size` is provided, then the smallest WebP thumbnail which is not smaller "
+        "than `size` pixels is returned (64, 256 or 1024), the original file is returned if there is no such "
+        "thumbnail (`size` is larger than 1024, image is smaller or thumbnails are not made yet)."
+    ),
     responses={
         status.HTTP_200_OK: {"description": "Uploaded file returned."},
         status.HTTP_401_UNAUTHORIZED: shared_swagger.responses[status.HTTP_401_UNAUTHORIZED],
@@ -55,6 +60,7 @@ async def get_file(
     background_tasks: BackgroundTasks,
     file_id: Annotated[UuidField, Path(example="47b3d7a9-d7d3-459a-aac1-155997775a0e")],
     tmp_dir: Annotated[pathlib.Path, Depends(get_tmp_dir)],
+    size: Annotated[int | None, Query(ge=1, example=64)] = None,
     session: AsyncSession = Depends(get_session),
 ) -> GetFileResponse:
-    return await controllers.get_file(background_tasks, file_id, tmp_dir, session)
+    return await controllers.get_file(background_tasks, file_id, size, tmp_dir, session)
@@ -9,6 +9,7 @@ from api.shared.schemas import Schema
 
 class NewFile(Schema):
 
+    digest: str  # hex SHA-256 of the content, calculated while the file is received
     extension: Extension
     name: FileNameField
     mime_type: MimeType
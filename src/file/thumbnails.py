@@ -0,0 +1,108 @@
+"""Thumbnails of uploaded images, so clients download images of the size they actually render."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from PIL import Image, ImageOps
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Final, Self
+
+    from src.shared.minio import Minio
+
+
+logger = logging.getLogger(__name__)
+
+SIZES: Final = (64, 256, 1024)  # max width and height of thumbnails in pixels
+
+
+class ThumbnailsExecutor:
+    """Process pool of the current worker process which makes thumbnails.
+
+    Resizing is CPU-bound, so it's done out of the event loop, a single process is enough since each worker
+    of the production server is supposed to use a single CPU. Pool is created on the first use rather than on import,
+    because the app is imported by the master process before workers are forked and pool inherited by forked process
+    doesn't work. Broken pool (for example its process is killed because of memory) refuses all tasks, so it's replaced.
+    """
+
+    def __init__(self: Self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._pid: int | None = None  # id of the process which created the pool
+
+    def get(self: Self) -> ProcessPoolExecutor:
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = ProcessPoolExecutor(max_workers=1)
+            self._pid = os.getpid()
+        return self._executor
+
+    def replace(self: Self, executor: ProcessPoolExecutor) -> None:
+        """Replace the broken pool, it's done once even if several tasks of the pool have failed."""
+        if executor is self._executor:
+            self._executor = None
+        executor.shutdown(wait=False)
+
+    def shutdown(self: Self) -> None:
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown()
+        self._executor = None
+
+
+thumbnails_executor = ThumbnailsExecutor()
+
+
+def choose_size(size: int) -> int | None:
+    """Choose the smallest thumbnail which is not smaller than requested size, `None` if all of them are smaller."""
+    return next((thumbnail_size for thumbnail_size in SIZES if thumbnail_size >= size), None)
+
+
+def make_thumbnails(file_path: Path) -> list[tuple[int, Path]]:
+    """Save WebP thumbnails next to the image, sizes and paths of saved thumbnails are returned.
+
+    Images are never upscaled, so there are no thumbnails larger than the image itself, the original is served
+    instead of them. Animated images have no thumbnails at all, since the animation would be lost.
+    """
+    thumbnails = []
+    with Image.open(file_path) as original:
+        if getattr(original, "is_animated", False):
+            return []
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in {"RGB", "RGBA"}:
+            image = image.convert("RGBA")
+        for size in SIZES:
+            if max(image.size) <= size:
+                break
+            thumbnail = image.copy()
+            thumbnail.thumbnail((size, size))
+            thumbnail_path = file_path.with_name(f"{file_path.stem}.{size}.webp")
+            thumbnail.save(thumbnail_path, "WEBP")
+            thumbnails.append((size, thumbnail_path))
+    return thumbnails
+
+
+async def create_thumbnails(minio: Minio, object_name: str, file_path: Path) -> None:
+    """Make thumbnails of the uploaded file and store them. Supposed to be run as a background task.
+
+    Temporary directory of the uploaded file is removed afterwards, even if thumbnails are not stored.
+    """
+    loop = asyncio.get_running_loop()
+    executor = thumbnails_executor.get()
+    try:
+        thumbnails = await loop.run_in_executor(executor, make_thumbnails, file_path)
+        for size, thumbnail_path in thumbnails:
+            minio.upload_thumbnail(object_name, size, thumbnail_path)
+    except BrokenProcessPool:
+        logger.warning("Thumbnails of object %s are not created, process pool is replaced.", object_name, exc_info=True)
+        thumbnails_executor.replace(executor)
+    except (Image.DecompressionBombError, OSError):
+        logger.warning("Thumbnails of object %s are not created.", object_name, exc_info=True)
+    finally:
+        shutil.rmtree(file_path.parent)
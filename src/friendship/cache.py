@@ -0,0 +1,73 @@
+"""Friends of accounts kept in memory of each worker process, so friendship is checked without database queries."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from wlss.shared.types import Id
+
+from src.config import CONFIG
+from src.shared.cache import ExpiringLruCache
+from src.shared.invalidation import Entity, invalidation_bus, InvalidationEvent, publish
+
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class FriendsCache:
+    """Sets of friend ids of the recently checked accounts.
+
+    Friends of an account are invalidated when its friendships are changed by the current worker,
+    other workers invalidate them once they receive invalidation event. If events are lost, for example
+    while listener is reconnected, the change is seen once cached set is expired in `FRIENDS_CACHE_EXPIRATION_SECONDS`.
+    """
+
+    def __init__(self: Self, max_size: int) -> None:
+        self._friends: ExpiringLruCache[int, frozenset[int]] = ExpiringLruCache(max_size=max_size)
+        self._version = 0  # it's incremented on each invalidation
+
+    @property
+    def version(self: Self) -> int:
+        return self._version
+
+    def get(self: Self, account_id: Id) -> frozenset[int] | None:
+        return self._friends.get(account_id.value)
+
+    def set(self: Self, account_id: Id, friend_ids: frozenset[int], version: int) -> None:  # noqa: A003
+        """Cache friends which were read when cache had the given version.
+
+        Friends are not cached if any friendships were invalidated while they were read, since they can be outdated.
+        """
+        if version != self._version:
+            return
+        expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=CONFIG.FRIENDS_CACHE_EXPIRATION_SECONDS)
+        self._friends.set(account_id.value, friend_ids, expires_at)
+
+    def invalidate(self: Self, *account_ids: Id) -> None:
+        self._version += 1
+        for account_id in account_ids:
+            self._friends.delete(account_id.value)
+
+    def clear(self: Self) -> None:
+        self._friends.clear()
+
+
+friends_cache = FriendsCache(max_size=10000)
+
+
+def invalidate_friends(session: AsyncSession, *account_ids: Id) -> None:
+    """Invalidate friends of the accounts in the current worker and in other workers once session is committed."""
+    friends_cache.invalidate(*account_ids)
+    keys = [str(account_id.value) for account_id in account_ids]
+    publish(session, InvalidationEvent(entity=Entity.FRIENDSHIP, keys=keys))
+
+
+def _handle_friendship_event(keys: list[str]) -> None:
+    friends_cache.invalidate(*(Id(int(key)) for key in keys))
+
+
+invalidation_bus.subscribe(Entity.FRIENDSHIP, _handle_friendship_event, reset=friends_cache.clear)
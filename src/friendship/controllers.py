@@ -5,8 +5,11 @@ from typing import TYPE_CHECKING
 from api.friendship.dtos import (
     AcceptFriendshipRequestResponse,
     CreateFriendshipRequestResponse,
+    FriendshipRequestsBatchResponse,
     GetAccountFriendshipsResponse,
     GetFriendshipRequestsResponse,
+    GetFriendshipSuggestionsResponse,
+    GetMutualFriendsResponse,
     RejectFriendshipRequestResponse,
 )
 from src.account.models import Account
@@ -17,6 +20,7 @@ from src.friendship.exceptions import (
     CannotCreateFriendshipRequest,
     CannotDeleteFriendship,
     CannotGetFriendshipRequests,
+    CannotGetFriendshipSuggestions,
     CannotRejectFriendshipRequest,
 )
 from src.friendship.models import FriendshipRequest
@@ -69,10 +73,10 @@ async def accept_friendship_request(
     current_account: Account,
     session: AsyncSession,
 ) -> AcceptFriendshipRequestResponse:
-    friendship_request = await FriendshipRequest.get(session, request_id)
-    if friendship_request.receiver_id != current_account.id:
+    friendships = await FriendshipRequest.accept(session, request_id, current_account.id)
+    if not friendships:
+        await FriendshipRequest.get(session, request_id)  # raises not found error if there is no such request
         raise CannotAcceptFriendshipRequest()
-    friendships = await friendship_request.accept(session)
     return AcceptFriendshipRequestResponse.model_validate({"friendships": friendships}, from_attributes=True)
 
 
@@ -88,6 +92,33 @@ async def reject_friendship_request(
     return RejectFriendshipRequestResponse.model_validate(friendship_request, from_attributes=True)
 
 
+async def accept_friendship_requests(
+    request_ids: list[Id],
+    current_account: Account,
+    session: AsyncSession,
+) -> FriendshipRequestsBatchResponse:
+    results = await FriendshipRequest.accept_many(session, request_ids, current_account.id)
+    return FriendshipRequestsBatchResponse.model_validate({"results": results}, from_attributes=True)
+
+
+async def reject_friendship_requests(
+    request_ids: list[Id],
+    current_account: Account,
+    session: AsyncSession,
+) -> FriendshipRequestsBatchResponse:
+    results = await FriendshipRequest.reject_many(session, request_ids, current_account.id)
+    return FriendshipRequestsBatchResponse.model_validate({"results": results}, from_attributes=True)
+
+
+async def cancel_friendship_requests(
+    request_ids: list[Id],
+    current_account: Account,
+    session: AsyncSession,
+) -> FriendshipRequestsBatchResponse:
+    results = await FriendshipRequest.delete_many(session, request_ids, current_account.id)
+    return FriendshipRequestsBatchResponse.model_validate({"results": results}, from_attributes=True)
+
+
 async def get_friendship_requests(
     account_id: Id,
     current_account: Account,
@@ -100,6 +131,30 @@ async def get_friendship_requests(
     return GetFriendshipRequestsResponse.model_validate({"requests": friendship_requests}, from_attributes=True)
 
 
+async def get_friendship_suggestions(
+    account_id: Id,
+    current_account: Account,
+    limit: int,
+    offset: int,
+    session: AsyncSession,
+) -> GetFriendshipSuggestionsResponse:
+    if account_id != current_account.id:
+        raise CannotGetFriendshipSuggestions()
+    suggestions = await current_account.get_friendship_suggestions(session, limit, offset)
+    return GetFriendshipSuggestionsResponse.model_validate({"suggestions": suggestions}, from_attributes=True)
+
+
+async def get_mutual_friends(
+    account_id: Id,
+    other_id: Id,
+    limit: int,
+    offset: int,
+    session: AsyncSession,
+) -> GetMutualFriendsResponse:
+    mutual_friends = await Account.get_mutual_friends(session, account_id, other_id, limit, offset)
+    return GetMutualFriendsResponse.model_validate(mutual_friends, from_attributes=True)
+
+
 async def delete_friendships(
     account_id: Id,
     friend_id: Id,
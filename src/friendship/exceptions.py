@@ -45,6 +45,14 @@ class CannotGetFriendshipRequests(NotAllowedException):
     status_code = status.HTTP_403_FORBIDDEN
 
 
+class CannotGetFriendshipSuggestions(NotAllowedException):
+    action = "Get friendship suggestions."
+
+    description = "Requested action not allowed."
+    details = "Provided tokens or credentials don't grant you enough access rights."
+    status_code = status.HTTP_403_FORBIDDEN
+
+
 class CannotRejectFriendshipRequest(NotAllowedException):
     action = "Reject friendship request."
 
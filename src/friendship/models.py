@@ -3,20 +3,37 @@ from __future__ import annotations
 import typing
 from typing import TYPE_CHECKING
 
-from sqlalchemy import and_, CheckConstraint, delete, Enum, ForeignKey, or_, select, UniqueConstraint
+from sqlalchemy import (
+    CheckConstraint,
+    column,
+    delete,
+    Enum,
+    ForeignKey,
+    literal,
+    select,
+    union_all,
+    UniqueConstraint,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Mapped, mapped_column
 from wlss.shared.types import Id, UtcDatetime
 
-from api.friendship.enums import FriendshipRequestStatus
+from api.friendship.enums import BatchResult, FriendshipRequestStatus
+from src.friendship.cache import invalidate_friends
 from src.friendship.exceptions import FriendshipRequestNotFoundError
+from src.friendship.schemas import FriendshipRequestResult
 from src.shared.columns import IdColumn, UtcDatetimeColumn
 from src.shared.database import Base
 from src.shared.datetime import utcnow
 
 
 if TYPE_CHECKING:
-    from typing import Self
+    from collections.abc import Sequence
+    from typing import Any, Self
 
+    from sqlalchemy import ColumnElement, CTE, Row, Select, Table
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.friendship.schemas import NewFriendshipRequest
@@ -64,20 +81,96 @@ class FriendshipRequest(Base):
         session: AsyncSession,
         new_friendship_request: NewFriendshipRequest,
     ) -> FriendshipRequest:
-        query = delete(FriendshipRequest).where(
-            FriendshipRequest.receiver_id == new_friendship_request.receiver_id,
-            FriendshipRequest.sender_id == new_friendship_request.sender_id,
+        """Create friendship request or re-send the existing one with a single statement.
+
+        If the receiver has already sent pending request to the sender, then that request is accepted instead
+        (the same way as `accept` does) and it's returned with `ACCEPTED` status.
+        """
+        sender_id, receiver_id = new_friendship_request.sender_id, new_friendship_request.receiver_id
+        now = utcnow()
+        # statements are built from tables, since ORM statements can't be used inside of CTE
+        requests = typing.cast("Table", FriendshipRequest.__table__)
+
+        reverse_request = (
+            delete(requests)
+            .where(
+                (requests.c.sender_id == receiver_id)
+                & (requests.c.receiver_id == sender_id)
+                & (requests.c.status == FriendshipRequestStatus.PENDING),
+            )
+            .returning(requests.c.id, requests.c.created_at, requests.c.receiver_id, requests.c.sender_id)
+            .cte("reverse_request")
         )
-        await session.execute(query)
-        await session.flush()
+        is_accepted = select(reverse_request.c.id).exists()
+        same_request = (
+            delete(requests)
+            .where((requests.c.sender_id == sender_id) & (requests.c.receiver_id == receiver_id) & is_accepted)
+            .cte("same_request")
+        )
+        pairs = (
+            values(column("account_id", IdColumn), column("friend_id", IdColumn), name="pair")
+            .data([(sender_id, receiver_id), (receiver_id, sender_id)])
+        )
+        friendships = (
+            insert(typing.cast("Table", Friendship.__table__))
+            .from_select(
+                ["account_id", "friend_id", "created_at", "updated_at"],
+                select(
+                    pairs.c.account_id,
+                    pairs.c.friend_id,
+                    literal(now, UtcDatetimeColumn),
+                    literal(now, UtcDatetimeColumn),
+                ).where(is_accepted),
+            )
+            .on_conflict_do_nothing()
+            .cte("friendships")
+        )
+        new_request = insert(requests).from_select(
+            ["created_at", "receiver_id", "sender_id", "status", "updated_at"],
+            select(
+                literal(now, UtcDatetimeColumn),
+                literal(receiver_id, IdColumn),
+                literal(sender_id, IdColumn),
+                literal(FriendshipRequestStatus.PENDING, requests.c.status.type),
+                literal(now, UtcDatetimeColumn),
+            ).where(~is_accepted),
+        )
+        request = (
+            new_request.on_conflict_do_update(
+                index_elements=[requests.c.sender_id, requests.c.receiver_id],
+                set_={
+                    "created_at": new_request.excluded.created_at,
+                    "status": new_request.excluded.status,
+                    "updated_at": new_request.excluded.updated_at,
+                },
+            )
+            .returning(
+                requests.c.id,
+                requests.c.created_at,
+                requests.c.receiver_id,
+                requests.c.sender_id,
+                requests.c.status,
+            )
+            .cte("request")
+        )
+        query = union_all(
+            select(request),
+            select(
+                reverse_request,
+                literal(FriendshipRequestStatus.ACCEPTED, requests.c.status.type).label("status"),
+            ),
+        ).add_cte(same_request, friendships)
+        row = (await session.execute(query)).one()
 
-        friendship_request = FriendshipRequest(
-            receiver_id=new_friendship_request.receiver_id,
-            sender_id=new_friendship_request.sender_id,
+        if row.status == FriendshipRequestStatus.ACCEPTED:
+            invalidate_friends(session, sender_id, receiver_id)
+        return FriendshipRequest(
+            id=row.id,
+            created_at=row.created_at,
+            receiver_id=row.receiver_id,
+            sender_id=row.sender_id,
+            status=row.status,
         )
-        session.add(friendship_request)
-        await session.flush()
-        return friendship_request
 
     @classmethod
     async def get(
@@ -96,32 +189,175 @@ class FriendshipRequest(Base):
         await session.execute(query)
         await session.flush()
 
-    async def accept(self: Self, session: AsyncSession) -> list[Friendship]:
-        friendships = [
-            Friendship(account_id=self.sender_id, friend_id=self.receiver_id),
-            Friendship(account_id=self.receiver_id, friend_id=self.sender_id),
+    @staticmethod
+    async def accept(session: AsyncSession, request_id: Id, receiver_id: Id) -> list[Friendship]:
+        """Accept friendship request sent to the receiver with a single statement.
+
+        The request and the request sent in the opposite direction are deleted and two friendship relations
+        are created. Empty list is returned if there is no such request sent to the receiver, so when
+        the same request is accepted concurrently, only one of the acceptances succeeds.
+        """
+        requests = typing.cast("Table", FriendshipRequest.__table__)
+        _, reverse_request, friendships = _accept_statements(
+            (requests.c.id == request_id) & (requests.c.receiver_id == receiver_id),
+        )
+        rows = (await session.execute(select(friendships).add_cte(reverse_request))).all()
+        if not rows:
+            return []
+
+        invalidate_friends(session, *(row.account_id for row in rows))
+        # friendship of the sender goes first
+        rows = sorted(rows, key=lambda row: row.account_id == receiver_id)
+        return [
+            Friendship(account_id=row.account_id, friend_id=row.friend_id, created_at=row.created_at)
+            for row in rows
         ]
-        session.add_all(friendships)
-        await session.flush()
 
+    @staticmethod
+    async def accept_many(
+        session: AsyncSession,
+        request_ids: Sequence[Id],
+        receiver_id: Id,
+    ) -> list[FriendshipRequestResult]:
+        """Accept friendship requests sent to the receiver with a single statement, result is returned for each id."""
+        if not request_ids:
+            return []
+        requests = typing.cast("Table", FriendshipRequest.__table__)
+        request, reverse_request, friendships = _accept_statements(
+            requests.c.id.in_(request_ids) & (requests.c.receiver_id == receiver_id),
+        )
         query = (
-            delete(FriendshipRequest)
-            .where(
-                or_(
-                    and_(
-                        FriendshipRequest.sender_id == self.sender_id,
-                        FriendshipRequest.receiver_id == self.receiver_id,
-                    ),
-                    and_(
-                        FriendshipRequest.sender_id == self.receiver_id,
-                        FriendshipRequest.receiver_id == self.sender_id,
-                    ),
-                ),
-            )
+            _results_query(request_ids, request)
+            .add_columns(request.c.sender_id)
+            .add_cte(reverse_request, friendships)
         )
-        await session.execute(query)
-        return friendships
+        rows = (await session.execute(query)).all()
+
+        sender_ids = [row.sender_id for row in rows if row.sender_id is not None]
+        if sender_ids:  # friends are not changed if nothing is accepted
+            invalidate_friends(session, receiver_id, *sender_ids)
+        return _results(request_ids, rows)
+
+    @staticmethod
+    async def reject_many(
+        session: AsyncSession,
+        request_ids: Sequence[Id],
+        receiver_id: Id,
+    ) -> list[FriendshipRequestResult]:
+        """Reject friendship requests sent to the receiver with a single statement, result is returned for each id."""
+        if not request_ids:
+            return []
+        requests = typing.cast("Table", FriendshipRequest.__table__)
+        rejected = (
+            update(requests)
+            .where(requests.c.id.in_(request_ids) & (requests.c.receiver_id == receiver_id))
+            .values(status=FriendshipRequestStatus.REJECTED, updated_at=utcnow())
+            .returning(requests.c.id)
+            .cte("rejected")
+        )
+        rows = (await session.execute(_results_query(request_ids, rejected))).all()
+        return _results(request_ids, rows)
+
+    @staticmethod
+    async def delete_many(
+        session: AsyncSession,
+        request_ids: Sequence[Id],
+        sender_id: Id,
+    ) -> list[FriendshipRequestResult]:
+        """Delete friendship requests sent by the sender with a single statement, result is returned for each id."""
+        if not request_ids:
+            return []
+        requests = typing.cast("Table", FriendshipRequest.__table__)
+        deleted = (
+            delete(requests)
+            .where(requests.c.id.in_(request_ids) & (requests.c.sender_id == sender_id))
+            .returning(requests.c.id)
+            .cte("deleted")
+        )
+        rows = (await session.execute(_results_query(request_ids, deleted))).all()
+        return _results(request_ids, rows)
 
     async def reject(self: Self, session: AsyncSession) -> None:
         self.status = FriendshipRequestStatus.REJECTED
         await session.flush()
+
+
+def _accept_statements(condition: ColumnElement[bool]) -> tuple[CTE, CTE, CTE]:
+    """Build CTEs which accept requests matching the condition.
+
+    Requests matching the condition and the requests sent in the opposite direction are deleted and
+    two friendship relations are created for each request. CTEs returned are: deleted requests,
+    deleted opposite requests and created friendships.
+    """
+    now = utcnow()
+    # statements are built from tables, since ORM statements can't be used inside of CTE
+    requests = typing.cast("Table", FriendshipRequest.__table__)
+    friendships = typing.cast("Table", Friendship.__table__)
+
+    request = (
+        delete(requests)
+        .where(condition)
+        .returning(requests.c.id, requests.c.receiver_id, requests.c.sender_id)
+        .cte("request")
+    )
+    reverse_request = (
+        delete(requests)
+        .where((requests.c.sender_id == request.c.receiver_id) & (requests.c.receiver_id == request.c.sender_id))
+        .cte("reverse_request")
+    )
+    pairs = union_all(
+        select(request.c.sender_id.label("account_id"), request.c.receiver_id.label("friend_id")),
+        select(request.c.receiver_id, request.c.sender_id),
+    ).subquery("pair")
+    new_friendships = insert(friendships).from_select(
+        ["account_id", "friend_id", "created_at", "updated_at"],
+        select(
+            pairs.c.account_id,
+            pairs.c.friend_id,
+            literal(now, UtcDatetimeColumn),
+            literal(now, UtcDatetimeColumn),
+        ),
+    )
+    new_friendships_cte = (
+        new_friendships.on_conflict_do_update(
+            index_elements=[friendships.c.account_id, friendships.c.friend_id],
+            set_={"updated_at": new_friendships.excluded.updated_at},
+        )
+        .returning(friendships.c.account_id, friendships.c.friend_id, friendships.c.created_at)
+        .cte("friendships")
+    )
+    return request, reverse_request, new_friendships_cte
+
+
+def _results_query(request_ids: Sequence[Id], changed: CTE) -> Select[tuple[Id, bool, bool]]:
+    """Build query which tells for each requested id whether the request is changed and whether it exists.
+
+    Outer query sees the table as it was before the statement, so changed requests are found there too.
+    """
+    requests = typing.cast("Table", FriendshipRequest.__table__)
+    requested = values(column("id", IdColumn), name="requested").data([(request_id,) for request_id in request_ids])
+    return (
+        select(
+            requested.c.id,
+            changed.c.id.is_not(None).label("is_changed"),
+            requests.c.id.is_not(None).label("is_found"),
+        )
+        .select_from(requested)
+        .outerjoin(changed, changed.c.id == requested.c.id)
+        .outerjoin(requests, requests.c.id == requested.c.id)
+    )
+
+
+def _results(request_ids: Sequence[Id], rows: Sequence[Row[Any]]) -> list[FriendshipRequestResult]:
+    results: dict[int, BatchResult] = {}
+    for row in rows:
+        if row.is_changed:
+            results[row.id.value] = BatchResult.DONE
+        elif row.is_found:
+            results[row.id.value] = BatchResult.NOT_ALLOWED
+        else:
+            results[row.id.value] = BatchResult.NOT_FOUND
+    return [
+        FriendshipRequestResult(request_id=request_id, result=results[request_id.value])
+        for request_id in request_ids
+    ]
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.friendship.dtos import (
     AcceptFriendshipRequestResponse,
     CreateFriendshipRequestRequest,
     CreateFriendshipRequestResponse,
+    FriendshipRequestsBatchResponse,
     GetAccountFriendshipsResponse,
     GetFriendshipRequestsResponse,
+    GetFriendshipSuggestionsResponse,
+    GetMutualFriendsResponse,
     RejectFriendshipRequestResponse,
 )
 from api.shared.fields import IdField
@@ -46,9 +49,17 @@ async def get_account_friendships(
 
 @router.post(
     "/friendships/requests",
-    description="Create new friendship request.",
+    description=(
+        "Create new friendship request. If the receiver has already sent pending request to the sender, "
+        "then that request is accepted instead."
+    ),
     responses={
-        status.HTTP_201_CREATED: {"description": "New friendship request is created and returned."},
+        status.HTTP_201_CREATED: {
+            "description": (
+                "New friendship request is created and returned. "
+                "Or the request from the receiver is accepted and returned with 'ACCEPTED' status."
+            ),
+        },
         status.HTTP_401_UNAUTHORIZED: shared_swagger.responses[status.HTTP_401_UNAUTHORIZED],
         status.HTTP_403_FORBIDDEN: shared_swagger.responses[status.HTTP_403_FORBIDDEN],
     },
@@ -126,6 +137,84 @@ async def reject_friendship_request(
     return await controllers.reject_friendship_request(request_id, current_account, session)
 
 
+@router.delete(
+    "/friendships/requests",
+    description="Cancel (same as delete) multiple friendship requests at once.",
+    responses={
+        status.HTTP_200_OK: {
+            "description": (
+                "Result is returned for each request id: 'DONE', 'NOT_ALLOWED' if the request belongs "
+                "to another account or 'NOT_FOUND' if there is no such request."
+            ),
+        },
+        status.HTTP_401_UNAUTHORIZED: shared_swagger.responses[status.HTTP_401_UNAUTHORIZED],
+    },
+    status_code=status.HTTP_200_OK,
+    summary="Cancel friendship requests.",
+)
+async def cancel_friendship_requests(
+    current_account: Annotated[Account, Depends(get_account_from_access_token)],
+    request_ids: Annotated[
+        list[IdField],
+        Query(example=[42, 18], alias="request_id", max_length=100),
+    ] = [],  # noqa: B006
+    session: AsyncSession = Depends(get_session),
+) -> FriendshipRequestsBatchResponse:
+    return await controllers.cancel_friendship_requests(request_ids, current_account, session)
+
+
+@router.put(
+    "/friendships/requests/accepted",
+    description="Accept multiple friendship requests at once, the same way as a single request is accepted.",
+    responses={
+        status.HTTP_200_OK: {
+            "description": (
+                "Result is returned for each request id: 'DONE', 'NOT_ALLOWED' if the request belongs "
+                "to another account or 'NOT_FOUND' if there is no such request."
+            ),
+        },
+        status.HTTP_401_UNAUTHORIZED: shared_swagger.responses[status.HTTP_401_UNAUTHORIZED],
+    },
+    status_code=status.HTTP_200_OK,
+    summary="Accept friendship requests.",
+)
+async def accept_friendship_requests(
+    current_account: Annotated[Account, Depends(get_account_from_access_token)],
+    request_ids: Annotated[
+        list[IdField],
+        Query(example=[42, 18], alias="request_id", max_length=100),
+    ] = [],  # noqa: B006
+    session: AsyncSession = Depends(get_session),
+) -> FriendshipRequestsBatchResponse:
+    return await controllers.accept_friendship_requests(request_ids, current_account, session)
+
+
+@router.put(
+    "/friendships/requests/rejected",
+    description="Reject multiple friendship requests at once.",
+    responses={
+        status.HTTP_200_OK: {
+            "description": (
+                "Result is returned for each request id: 'DONE', 'NOT_ALLOWED' if the request belongs "
+                "to another account or 'NOT_FOUND' if there is no such request."
+            ),
+        },
+        status.HTTP_401_UNAUTHORIZED: shared_swagger.responses[status.HTTP_401_UNAUTHORIZED],
+    },
+    status_code=status.HTTP_200_OK,
+    summary="Reject friendship requests.",
+)
+async def reject_friendship_requests(
+    current_account: Annotated[Account, Depends(get_account_from_access_token)],
+    request_ids: Annotated[
+        list[IdField],
+        Query(example=[42, 18], alias="request_id", max_length=100),
+    ] = [],  # noqa: B006
+    session: AsyncSession = Depends(get_session),
+) -> FriendshipRequestsBatchResponse:
+    return await controllers.reject_friendship_requests(request_ids, current_account, session)
+
+
 @router.get(
     "/accounts/{account_id}/friendships/requests",
     description="Get friendship requests related to particular account",
@@ -151,6 +240,52 @@ async def get_friendship_requests(
     return await controllers.get_friendship_requests(account_id, current_account, session)
 
 
+@router.get(
+    "/accounts/{account_id}/friendships/suggestions",
+    description=(
+        "Get accounts which are friends of friends of particular account, "
+        "ordered by the number of mutual friends from the largest."
+    ),
+    responses={
+        status.HTTP_200_OK: {"description": "Page of friendship suggestions is returned."},
+        status.HTTP_401_UNAUTHORIZED: shared_swagger.responses[status.HTTP_401_UNAUTHORIZED],
+        status.HTTP_403_FORBIDDEN: shared_swagger.responses[status.HTTP_403_FORBIDDEN],
+    },
+    status_code=status.HTTP_200_OK,
+    summary="Get friendship suggestions.",
+)
+async def get_friendship_suggestions(
+    account_id: Annotated[IdField, Path(example=42)],
+    current_account: Annotated[Account, Depends(get_account_from_access_token)],
+    limit: Annotated[int, Query(ge=1, le=100, example=20)] = 20,
+    offset: Annotated[int, Query(ge=0, example=0)] = 0,
+    session: AsyncSession = Depends(get_session),
+) -> GetFriendshipSuggestionsResponse:
+    return await controllers.get_friendship_suggestions(account_id, current_account, limit, offset, session)
+
+
+@router.get(
+    "/accounts/{account_id}/friendships/mutual/{other_id}",
+    dependencies=[Depends(get_account_from_access_token)],
+    description="Get friends which two accounts have in common.",
+    responses={
+        status.HTTP_200_OK: {"description": "Total number of mutual friends and page of their ids are returned."},
+        status.HTTP_401_UNAUTHORIZED: shared_swagger.responses[status.HTTP_401_UNAUTHORIZED],
+        status.HTTP_404_NOT_FOUND: shared_swagger.responses[status.HTTP_404_NOT_FOUND],
+    },
+    status_code=status.HTTP_200_OK,
+    summary="Get mutual friends.",
+)
+async def get_mutual_friends(
+    account_id: Annotated[IdField, Path(example=42)],
+    other_id: Annotated[IdField, Path(example=18)],
+    limit: Annotated[int, Query(ge=1, le=100, example=20)] = 20,
+    offset: Annotated[int, Query(ge=0, example=0)] = 0,
+    session: AsyncSession = Depends(get_session),
+) -> GetMutualFriendsResponse:
+    return await controllers.get_mutual_friends(account_id, other_id, limit, offset, session)
+
+
 @router.delete(
     "/accounts/{account_id}/friendships/{friend_id}",
     description="Delete friendhips between account_id and friend_id.",
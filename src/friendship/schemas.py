@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from api.friendship.enums import BatchResult
 from api.shared.fields import IdField
 from api.shared.schemas import Schema
 
@@ -7,3 +8,18 @@ from api.shared.schemas import Schema
 class NewFriendshipRequest(Schema):
     receiver_id: IdField
     sender_id: IdField
+
+
+class FriendshipSuggestion(Schema):
+    account_id: IdField
+    mutual_friends: int
+
+
+class MutualFriends(Schema):
+    account_ids: list[IdField]  # only requested page of mutual friends
+    count: int  # total number of mutual friends
+
+
+class FriendshipRequestResult(Schema):
+    request_id: IdField
+    result: BatchResult
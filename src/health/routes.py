@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, status
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from api.health import dtos
 from src.health import enums
+from src.shared import metrics
 
 
 router = APIRouter(tags=["service"])
@@ -30,3 +33,28 @@ router = APIRouter(tags=["service"])
 )
 async def get_health() -> dtos.HealthResponse:
     return dtos.HealthResponse(status=enums.HealthStatus.OK)
+
+
+@router.get(
+    "/metrics",
+    description="Get backend metrics in Prometheus text format. Metrics are aggregated across all worker processes.",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Current values of backend metrics.",
+            "content": {
+                "text/plain": {
+                    "example": (
+                        "# HELP http_requests_in_progress Number of HTTP requests which are being processed.\n"
+                        "# TYPE http_requests_in_progress gauge\n"
+                        'http_requests_in_progress{method="GET"} 1.0\n'
+                    ),
+                },
+            },
+        },
+    },
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Get metrics.",
+)
+async def get_metrics() -> Response:
+    return Response(content=metrics.generate_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -22,9 +22,7 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
-    from src.account.models import Account
     from src.profile import schemas
-    from src.profile.schemas import NewProfile
 
 
 class Profile(Base):
@@ -39,20 +37,6 @@ class Profile(Base):
     name: Mapped[ProfileName] = mapped_column(ProfileNameColumn, nullable=False)
     updated_at: Mapped[UtcDatetime] = mapped_column(UtcDatetimeColumn, default=utcnow, nullable=False, onupdate=utcnow)
 
-    @staticmethod
-    async def create(session: AsyncSession, profile_data: NewProfile, account: Account) -> Profile:
-        """Create new profile object."""
-        profile = Profile(
-            account_id=account.id,
-            created_at=account.created_at,
-            description=profile_data.description,
-            name=profile_data.name,
-            updated_at=account.updated_at,
-        )
-        session.add(profile)
-        await session.flush()
-        return profile
-
     async def update(self: Self, session: AsyncSession, profile_update: schemas.ProfileUpdate) -> Profile:
         if (
             self.avatar_id != profile_update.avatar_id
@@ -0,0 +1,106 @@
+"""Production server of the app: gunicorn master process which manages uvicorn workers.
+
+- number of workers is equal to the number of available CPUs, since each worker runs its event loop in a single thread
+- workers use uvloop and httptools, which are faster than pure python implementations
+- app is imported by the master process before workers are forked, so workers share memory pages of imported code
+- on SIGTERM workers stop accepting new connections and finish requests in progress before exit
+- workers are restarted after handling a number of requests, so possible memory leaks don't pile up
+
+Usage example:
+
+    WLSS_ENV=qa/deploy python -m src.server --bind=0.0.0.0:8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import TYPE_CHECKING
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any, Self
+
+    from fastapi import FastAPI
+    from gunicorn.arbiter import Arbiter
+    from gunicorn.workers.base import Worker as BaseWorker
+
+
+class Worker(UvicornWorker):
+    """Uvicorn worker which fails on start if uvloop or httptools is not installed instead of silent fallback."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}  # noqa: RUF012
+
+
+class Server(BaseApplication):  # type: ignore[misc]  # pylint: disable=abstract-method
+    def __init__(self: Self, options: dict[str, Any]) -> None:
+        self.options = options
+        super().__init__()  # config is loaded here, so options should be set before
+
+    def load_config(self: Self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self: Self) -> FastAPI:
+        from src.app import app  # pylint: disable=import-outside-toplevel  # app is imported once options are set
+
+        return app
+
+
+def get_default_workers() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))  # only CPUs available to the current process, for example in a container
+    return os.cpu_count() or 1  # pragma: no cover  # `sched_getaffinity` is not available on some platforms
+
+
+def get_options(bind: str, workers: int, max_requests: int, graceful_timeout: float) -> dict[str, Any]:
+    return {
+        "accesslog": "-",  # here "-" means stdout
+        "bind": bind,
+        "child_exit": _child_exit,
+        "errorlog": "-",  # here "-" means stdout
+        "graceful_timeout": graceful_timeout,
+        "keepalive": 5,  # seconds, a bit more than default to reuse connections from reverse proxy
+        "max_requests": max_requests,
+        "max_requests_jitter": max_requests // 10,  # so workers are not restarted all at the same moment
+        "preload_app": True,
+        "worker_class": f"{__name__}.Worker",
+        "workers": workers,
+    }
+
+
+def _child_exit(_: Arbiter, worker: BaseWorker) -> None:  # pragma: no cover
+    """Remove metrics of the dead worker, otherwise its gauges would be reported forever."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess  # pylint: disable=import-outside-toplevel
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def main(args: Sequence[str] | None = None) -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(prog="python -m src.server", description="Run production server of the app.")
+    parser.add_argument("--bind", default="127.0.0.1:8000", help="address to listen (default: 127.0.0.1:8000)")
+    parser.add_argument("--workers", type=int, default=get_default_workers(), help="(default: number of CPUs)")
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=10000,
+        help="number of requests after which worker is restarted (default: 10000)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        default=30,
+        help="seconds to finish requests in progress on shutdown, then workers are killed (default: 30)",
+    )
+    arguments = parser.parse_args(args)
+    options = get_options(arguments.bind, arguments.workers, arguments.max_requests, arguments.graceful_timeout)
+    Server(options).run()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from typing import Self
+
+
+class BloomFilter:
+    """Compact set of strings which can answer only "definitely not added" or "possibly added".
+
+    Size of the filter is chosen from the expected number of values and the desired rate of false positives.
+    When more values are added, false positives become more frequent, but there are never false negatives.
+    """
+
+    def __init__(self: Self, capacity: int, error_rate: float) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))  # number of bits
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))  # number of bits set for each value
+        self._bits = bytearray(math.ceil(self.size / 8))
+
+    def __contains__(self: Self, value: str) -> bool:
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._get_indexes(value))
+
+    def add(self: Self, value: str) -> None:
+        for index in self._get_indexes(value):
+            self._bits[index >> 3] |= 1 << (index & 7)
+
+    def _get_indexes(self: Self, value: str) -> list[int]:
+        # two halves of a single digest are combined to get as many indexes as needed (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+        return [(first + i * second) % self.size for i in range(self.hashes)]
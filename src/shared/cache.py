@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import collections
+from datetime import datetime, timezone
+from typing import Generic, TYPE_CHECKING, TypeVar
+
+
+if TYPE_CHECKING:
+    from typing import Self
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class ExpiringLruCache(Generic[K, V]):
+    """Cache of limited size which stores each value until its expiration time.
+
+    If cache is full then the least recently used value is evicted. Cache is not shared between worker processes.
+    """
+
+    def __init__(self: Self, max_size: int) -> None:
+        self.max_size = max_size
+        self._items: collections.OrderedDict[K, tuple[V, datetime]] = collections.OrderedDict()
+
+    def __len__(self: Self) -> int:
+        return len(self._items)
+
+    def get(self: Self, key: K) -> V | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if datetime.now(tz=timezone.utc) >= expires_at:
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def set(self: Self, key: K, value: V, expires_at: datetime) -> None:  # noqa: A003
+        self._items[key] = (value, expires_at)
+        self._items.move_to_end(key)
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def delete(self: Self, key: K) -> None:
+        self._items.pop(key, None)
+
+    def clear(self: Self) -> None:
+        self._items.clear()
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import math
+import time
+import typing
 from typing import TYPE_CHECKING
 
-from sqlalchemy import create_engine
+from fastapi import Request, Response  # noqa: TCH002
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.sql.dml import UpdateBase
 
 from src.config import CONFIG
+from src.shared.invalidation import dispatch_sent_events, send_events
+from src.shared.metrics import MeasuredQueuePool
 
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
-    from typing import Final
+    from typing import Any, Final, Self
 
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 
 # constants below are defined only for shortening long names from config
@@ -28,14 +38,121 @@ _USER: Final = CONFIG.POSTGRES_USER
 
 
 POSTGRES_CONNECTION_URL: Final = f"postgresql+asyncpg://{_USER}:{_PASSWORD}@{_HOST}:{_PORT}/{_DB}"
+POSTGRES_CONNECTION_DSN: Final = f"postgresql://{_USER}:{_PASSWORD}@{_HOST}:{_PORT}/{_DB}"  # used by asyncpg directly
 POSTGRES_CONNECTION_URL_SYNC: Final = f"postgresql+psycopg2://{_USER}:{_PASSWORD}@{_HOST}:{_PORT}/{_DB}"
 
+# each replica is defined in config as "host:port" and shares credentials and database name with the primary
+POSTGRES_REPLICA_CONNECTION_URLS: Final = [
+    f"postgresql+asyncpg://{_USER}:{_PASSWORD}@{replica}/{_DB}" for replica in CONFIG.POSTGRES_REPLICAS
+]
+
+# unix time until which read-only requests of the client are sent to the primary database, see `get_session()` below
+READ_YOUR_WRITES_COOKIE: Final = "read_your_writes_until"
+
+# replication lag in seconds, it is NULL if server is not a replica or hasn't replayed anything yet
+_REPLICATION_LAG_QUERY: Final = text("""
+    SELECT
+        CASE
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+    ;
+""")
+
+
+class Replica:
+    """Read-only replica of the primary database."""
+
+    def __init__(self: Self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        # `None` means that lag is unknown (replica is not checked yet or it's unreachable)
+        self.lag: float | None = None
+
+    @property
+    def is_available(self: Self) -> bool:
+        return self.lag is not None and self.lag <= CONFIG.POSTGRES_REPLICA_MAX_LAG_SECONDS
+
+    async def check_lag(self: Self) -> None:  # pragma: no cover
+        try:
+            async with self.engine.connect() as connection:
+                lag = (await connection.execute(_REPLICATION_LAG_QUERY)).scalar_one()
+        except (OSError, SQLAlchemyError):
+            self.lag = None
+            return
+        self.lag = None if lag is None else float(lag)
+
+
+class ReplicaPool:
+    """Pool of read-only replicas used to serve read-only requests.
+
+    Replica is used only if its replication lag is known and acceptable, otherwise primary database is used.
+    """
+
+    def __init__(self: Self, engines: list[AsyncEngine]) -> None:
+        self._replicas = [Replica(engine) for engine in engines]
+        self._counter = itertools.count()
+
+    def choose(self: Self) -> AsyncEngine | None:
+        """Choose replica engine for read-only queries.
+
+        :returns: replica engine or `None` if primary database should be used
+        """
+        available_replicas = [replica for replica in self._replicas if replica.is_available]
+        if not available_replicas:
+            return None
+        return available_replicas[next(self._counter) % len(available_replicas)].engine
+
+    async def monitor(self: Self) -> None:  # pragma: no cover
+        """Periodically refresh replication lag of each replica. Supposed to be run as a background task."""
+        if not self._replicas:
+            return
+        while True:  # pylint: disable=while-used
+            await asyncio.gather(*(replica.check_lag() for replica in self._replicas))
+            await asyncio.sleep(CONFIG.POSTGRES_REPLICA_LAG_CHECK_SECONDS)
+
+
+class RoutingSession(Session):
+    """Session which sends queries of read-only requests to replicas.
+
+    Request is considered read-only if `session.info["readonly"]` is set, see `get_session()` below.
+    Replica is chosen once per session, so all queries of the same request see the same snapshot of data.
+    """
+
+    def get_bind(  # type: ignore[override]
+        self: Self,
+        mapper: Any | None = None,  # noqa: ANN401
+        *,
+        clause: Any | None = None,  # noqa: ANN401
+        **kwargs: Any,
+    ) -> Engine | Connection:
+        if self.info.get("readonly") and not self._flushing and not isinstance(clause, UpdateBase):
+            replica = get_replica(self.info)
+            if replica is not None:
+                return replica.sync_engine  # type: ignore[no-any-return]
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def get_replica(session_info: dict[str, Any]) -> AsyncEngine | None:
+    """Get replica of the read-only session, it's chosen on the first call. `None` means primary database."""
+    if "replica" not in session_info:
+        session_info["replica"] = replicas.choose()
+    return typing.cast("AsyncEngine | None", session_info["replica"])
+
+
 # will allow us to connect to the database
-async_engine = create_async_engine(POSTGRES_CONNECTION_URL)
+async_engine = create_async_engine(POSTGRES_CONNECTION_URL, poolclass=MeasuredQueuePool)
 sync_engine = create_engine(POSTGRES_CONNECTION_URL_SYNC)  # needed for some cases when we cannot use async python code
 
+# read-only requests are distributed between these replicas
+replicas = ReplicaPool(
+    [create_async_engine(url, poolclass=MeasuredQueuePool) for url in POSTGRES_REPLICA_CONNECTION_URLS],
+)
+
 # will allow us to send SQL queries to database associated with engine
-async_session = async_scoped_session(async_sessionmaker(bind=async_engine), scopefunc=asyncio.current_task)
+async_session = async_scoped_session(
+    async_sessionmaker(bind=async_engine, sync_session_class=RoutingSession),
+    scopefunc=asyncio.current_task,
+)
 
 
 # will allow us to map relation tables from PostgreSQL to python classes
@@ -43,15 +160,50 @@ async_session = async_scoped_session(async_sessionmaker(bind=async_engine), scop
 class Base(DeclarativeBase):  # pylint: disable=too-few-public-methods
     """Base class for models."""
 
+    def copy(self: Self) -> Self:
+        """Copy column attributes to a new transient model, it can be used after session of this model is closed."""
+        columns = inspect(type(self)).column_attrs
+        return type(self)(**{column.key: getattr(self, column.key) for column in columns})
+
+
+def stick_to_primary(response: Response) -> None:
+    """Make read-only requests of the client use the primary database for `POSTGRES_READ_YOUR_WRITES_SECONDS`.
+
+    Deadline is kept by the client in a cookie, so the client reads its own writes whichever worker handles the request.
+    """
+    until = math.ceil(time.time() + CONFIG.POSTGRES_READ_YOUR_WRITES_SECONDS)
+    response.set_cookie(
+        READ_YOUR_WRITES_COOKIE,
+        str(until),
+        max_age=math.ceil(CONFIG.POSTGRES_READ_YOUR_WRITES_SECONDS),
+        httponly=True,
+        samesite="strict",
+    )
+
+
+def is_sticky_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies[READ_YOUR_WRITES_COOKIE]) > time.time()
+    except (KeyError, ValueError):
+        return False
+
 
-async def get_session() -> AsyncIterator[AsyncSession]:  # pragma: no cover
+async def get_session(request: Request, response: Response) -> AsyncIterator[AsyncSession]:  # pragma: no cover
     """Get database session. FastAPI dependency for database session."""
     async with async_session() as session:
+        session.info["readonly"] = request.method in {"GET", "HEAD"}
+        if not session.info["readonly"]:
+            # cookie is set before the request is handled, since headers can be sent before the session is closed
+            stick_to_primary(response)
+        elif is_sticky_to_primary(request):
+            session.info["replica"] = None
         try:
             yield session
+            await send_events(session)
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.commit()
             await session.close()
+        dispatch_sent_events(session)
@@ -0,0 +1,134 @@
+"""Invalidation events which are sent by workers to each other, so their in-memory caches are not stale.
+
+Events are collected in the database session by model methods and they're sent with `NOTIFY` right before
+the commit of the session, so they're delivered only if changes are committed. Each worker receives events
+of all workers (including its own ones) over a dedicated connection which is not taken from the pool.
+Events of the session are dispatched to the current worker right after the commit too, since data read
+by concurrent requests before the commit could be cached after the change had been made.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypeAlias
+
+import asyncpg
+from sqlalchemy import text
+
+from api.shared.enum import Enum
+from api.shared.schemas import Schema
+from src.config import CONFIG
+
+
+if TYPE_CHECKING:
+    from typing import Final, Self
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL: Final = "invalidation"
+
+_NOTIFY: Final = text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS TEXT[])) AS payload;")
+
+
+class Entity(Enum):
+    ACCOUNT = "ACCOUNT"
+    FRIENDSHIP = "FRIENDSHIP"
+    PROFILE = "PROFILE"
+    SESSION = "SESSION"
+    WISH = "WISH"
+
+
+class InvalidationEvent(Schema):
+    entity: Entity
+    keys: list[str]  # identifiers of changed entities, for example account ids for friendship
+
+
+Handler: TypeAlias = Callable[[list[str]], None]
+
+
+def publish(session: AsyncSession, event: InvalidationEvent) -> None:
+    """Add event to the session, it will be sent to all workers if the session is committed."""
+    session.info.setdefault("invalidation_events", []).append(event)
+
+
+async def send_events(session: AsyncSession) -> None:
+    """Send events of the session with a single statement, they're delivered once the transaction is committed."""
+    events: list[InvalidationEvent] = session.info.pop("invalidation_events", [])
+    if not events:
+        return
+    session.info["sent_invalidation_events"] = events
+    await session.execute(_NOTIFY, {"channel": CHANNEL, "payloads": [event.model_dump_json() for event in events]})
+
+
+class InvalidationBus:
+    """Subscribers of invalidation events of the current worker.
+
+    Each subscriber has a handler which is called with keys of received events and a reset function
+    which is called when some events could be missed, so the whole cache of the subscriber should be dropped.
+    """
+
+    def __init__(self: Self) -> None:
+        self._handlers: collections.defaultdict[Entity, list[Handler]] = collections.defaultdict(list)
+        self._resets: list[Callable[[], None]] = []
+
+    def subscribe(self: Self, entity: Entity, handler: Handler, reset: Callable[[], None] | None = None) -> None:
+        self._handlers[entity].append(handler)
+        if reset is not None:
+            self._resets.append(reset)
+
+    def dispatch(self: Self, payload: str) -> None:
+        self.handle(InvalidationEvent.model_validate_json(payload))
+
+    def handle(self: Self, event: InvalidationEvent) -> None:
+        for handler in self._handlers[event.entity]:
+            handler(event.keys)
+
+    def reset(self: Self) -> None:
+        for reset in self._resets:
+            reset()
+
+    async def listen(self: Self, dsn: str) -> None:  # pragma: no cover
+        """Receive events of all workers. Supposed to be run as a background task.
+
+        Events sent while listener is disconnected are lost, so subscribers are reset each time listener is connected.
+        Connection is checked every `INVALIDATION_CHECK_SECONDS` and it's reconnected when it's lost.
+        """
+        while True:  # pylint: disable=while-used
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(CHANNEL, self._on_notification)
+                self.reset()
+                while True:  # pylint: disable=while-used
+                    await asyncio.sleep(CONFIG.INVALIDATION_CHECK_SECONDS)
+                    await connection.execute("SELECT 1;")
+            except (OSError, asyncpg.InterfaceError, asyncpg.PostgresError):
+                logger.warning("Invalidation events are not received.", exc_info=True)
+            finally:
+                if connection is not None:
+                    connection.terminate()
+            await asyncio.sleep(CONFIG.INVALIDATION_CHECK_SECONDS)
+
+    def _on_notification(  # pragma: no cover
+        self: Self,
+        _connection: asyncpg.Connection,
+        _pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        self.dispatch(payload)
+
+
+invalidation_bus = InvalidationBus()
+
+
+def dispatch_sent_events(session: AsyncSession) -> None:
+    """Dispatch events sent by the session to the current worker, supposed to be called after the commit."""
+    for event in session.info.pop("sent_invalidation_events", []):
+        invalidation_bus.handle(event)
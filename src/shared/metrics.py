@@ -0,0 +1,124 @@
+"""Application metrics in Prometheus format.
+
+When the app is run by several worker processes (gunicorn), `PROMETHEUS_MULTIPROC_DIR` environment variable
+must point to an empty directory, so metrics of all the workers are aggregated and any worker is able to report them.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, generate_latest, Histogram, multiprocess, REGISTRY
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+if TYPE_CHECKING:
+    from typing import Any, Final, Self
+
+    from sqlalchemy.pool import ConnectionPoolEntry
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+HTTP_REQUEST_DURATION_SECONDS: Final = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests.",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS: Final = Gauge(
+    "http_requests_in_progress",
+    "Number of HTTP requests which are being processed.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+HTTP_EXCEPTIONS_TOTAL: Final = Counter(
+    "http_exceptions",
+    "Number of exceptions handled by the app exception handlers.",
+    ["exception", "status"],
+)
+DB_POOL_CHECKOUT_DURATION_SECONDS: Final = Histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time spent waiting for a database connection from the pool.",
+)
+DB_POOL_CONNECTIONS_IN_USE: Final = Gauge(
+    "db_pool_connections_in_use",
+    "Number of database connections checked out from the pool.",
+    multiprocess_mode="livesum",
+)
+MINIO_REQUEST_DURATION_SECONDS: Final = Histogram(
+    "minio_request_duration_seconds",
+    "Duration of requests to MinIO.",
+    ["operation"],
+)
+BCRYPT_QUEUE_DEPTH: Final = Gauge(
+    "bcrypt_queue_depth",
+    "Number of password hashing operations which are queued or in progress.",
+    multiprocess_mode="livesum",
+)
+
+
+def generate_metrics() -> bytes:
+    """Generate current values of all metrics in Prometheus text format."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:  # pragma: no cover
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool which measures how long it takes to check out a connection."""
+
+    def _do_get(self: Self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_DURATION_SECONDS.observe(time.perf_counter() - started_at)
+
+
+@event.listens_for(Pool, "checkout")
+def _count_checkout(*_: Any) -> None:
+    DB_POOL_CONNECTIONS_IN_USE.inc()
+
+
+@event.listens_for(Pool, "checkin")
+def _count_checkin(*_: Any) -> None:
+    DB_POOL_CONNECTIONS_IN_USE.dec()
+
+
+class MetricsMiddleware:
+    """Measure duration and number of in-progress HTTP requests.
+
+    Requests are labeled with a route path template (for example "/accounts/{account_id}")
+    instead of an actual path to keep the number of label values bounded.
+    """
+
+    def __init__(self: Self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":  # pragma: no cover
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # if the app fails before sending response, the client gets "Internal Server Error"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(scope["method"])
+        in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started_at
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION_SECONDS.labels(scope["method"], route, status).observe(duration)
@@ -3,15 +3,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import minio
+from minio.error import S3Error
 
 from api.shared import enum
+from src.shared.metrics import MINIO_REQUEST_DURATION_SECONDS
 from src.shared.types import UrlSchema
 
 
 if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any, Final, Self
-    from uuid import UUID
 
 
 @enum.unique
@@ -54,8 +55,30 @@ class Minio(minio.Minio):  # type: ignore[misc]
             if not self.bucket_exists(bucket_name):
                 self.make_bucket(bucket_name)
 
-    def upload_file(self: Self, file_id: UUID, file_path: Path) -> None:
-        self.fput_object(self.BUCKETS.FILES.value, str(file_id), file_path)
+    def upload_file(self: Self, object_name: str, file_path: Path) -> None:
+        with MINIO_REQUEST_DURATION_SECONDS.labels("upload_file").time():
+            self.fput_object(self.BUCKETS.FILES.value, object_name, file_path)
 
-    def download_file(self: Self, file_id: UUID, file_path: Path) -> None:
-        self.fget_object(self.BUCKETS.FILES.value, str(file_id), file_path)
+    def download_file(self: Self, object_name: str, file_path: Path) -> None:
+        with MINIO_REQUEST_DURATION_SECONDS.labels("download_file").time():
+            self.fget_object(self.BUCKETS.FILES.value, object_name, file_path)
+
+    def upload_thumbnail(self: Self, object_name: str, size: int, file_path: Path) -> None:
+        with MINIO_REQUEST_DURATION_SECONDS.labels("upload_thumbnail").time():
+            self.fput_object(self.BUCKETS.FILES.value, _get_thumbnail_name(object_name, size), file_path)
+
+    def download_thumbnail(self: Self, object_name: str, size: int, file_path: Path) -> bool:
+        """Download thumbnail of the file, `False` is returned if there is no such thumbnail."""
+        with MINIO_REQUEST_DURATION_SECONDS.labels("download_thumbnail").time():
+            try:
+                self.fget_object(self.BUCKETS.FILES.value, _get_thumbnail_name(object_name, size), file_path)
+            except S3Error as e:
+                if e.code != "NoSuchKey":  # pragma: no cover
+                    raise
+                return False
+        return True
+
+
+def _get_thumbnail_name(object_name: str, size: int) -> str:
+    """Get name of thumbnail object, it's stored next to the object with the original content."""
+    return f"{object_name}.{size}.webp"
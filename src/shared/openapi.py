@@ -0,0 +1,36 @@
+"""Prebuilt OpenAPI schema.
+
+Generation of OpenAPI schema is expensive, so in production the schema is built once before workers are started
+and each worker loads it from the file instead of generating it on the first request to the docs.
+
+Usage example:
+
+    # build OpenAPI schema and write it to $OPENAPI_FILE, prebuilt schema is disabled since it doesn't exist yet
+    WLSS_ENV=qa/deploy OPENAPI_PREBUILT=false python -m src.shared.openapi
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+
+def build_openapi(app: FastAPI, path: str) -> None:
+    Path(path).write_text(json.dumps(app.openapi()))
+
+
+def load_openapi(app: FastAPI, path: str) -> None:
+    """Load OpenAPI schema from the file, FastAPI serves cached schema as is and doesn't generate it anymore."""
+    app.openapi_schema = json.loads(Path(path).read_text())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    from src.app import app as wlss_app
+    from src.config import CONFIG
+
+    build_openapi(wlss_app, CONFIG.OPENAPI_FILE)
@@ -0,0 +1,161 @@
+"""SQL queries profiling. Collects number of queries, their total duration and number of rows per request."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import logging
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any, Final, Self
+
+    from sqlalchemy.engine import Connection, ExecutionContext
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+logger = logging.getLogger(__name__)
+
+# same statement executed this many times during one request most likely means N+1 queries problem
+REPEATED_STATEMENT_THRESHOLD: Final = 3
+
+
+@dataclasses.dataclass
+class QueryStatistics:
+    """Statistics of SQL queries executed in a particular scope (usually during a single request)."""
+
+    count: int = 0
+    duration: float = 0  # seconds
+    rows: int = 0
+    statements: collections.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+
+    @property
+    def repeated_statements(self: Self) -> dict[str, int]:
+        """Get statements which were executed suspiciously many times, they are likely to be N+1 queries."""
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= REPEATED_STATEMENT_THRESHOLD
+        }
+
+    def add(self: Self, other: QueryStatistics) -> None:
+        self.count += other.count
+        self.duration += other.duration
+        self.rows += other.rows
+        self.statements.update(other.statements)
+
+
+_current_statistics: ContextVar[QueryStatistics | None] = ContextVar("current_statistics", default=None)
+
+
+@contextlib.contextmanager
+def collect_query_statistics() -> Iterator[QueryStatistics]:
+    """Collect statistics of SQL queries executed inside `with` block.
+
+    Scopes can be nested, in that case statistics of inner scope is also added to the outer one.
+    """
+    statistics = QueryStatistics()
+    outer_statistics = _current_statistics.get()
+    token = _current_statistics.set(statistics)
+    try:
+        yield statistics
+    finally:
+        _current_statistics.reset(token)
+        if outer_statistics is not None:
+            outer_statistics.add(statistics)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(  # pylint: disable=too-many-arguments
+    connection: Connection,
+    cursor: Any,  # noqa: ANN401,ARG001
+    statement: str,  # noqa: ARG001
+    parameters: Any,  # noqa: ANN401,ARG001
+    context: ExecutionContext,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001,FBT001
+) -> None:
+    if _current_statistics.get() is not None:
+        connection.info["query_started_at"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(  # pylint: disable=too-many-arguments
+    connection: Connection,
+    cursor: Any,  # noqa: ANN401
+    statement: str,
+    parameters: Any,  # noqa: ANN401,ARG001
+    context: ExecutionContext,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001,FBT001
+) -> None:
+    statistics = _current_statistics.get()
+    started_at = connection.info.pop("query_started_at", None)
+    if statistics is None or started_at is None:
+        return
+    statistics.count += 1
+    statistics.duration += time.perf_counter() - started_at
+    statistics.rows += _get_rows_count(cursor)
+    statistics.statements[statement] += 1
+
+
+def _get_rows_count(cursor: Any) -> int:  # noqa: ANN401
+    if cursor.rowcount >= 0:
+        return int(cursor.rowcount)
+    # asyncpg adapter doesn't report rowcount for SELECT statements, but it fetches all rows right away
+    return len(getattr(cursor, "_rows", ()))
+
+
+class QueryStatisticsMiddleware:
+    """Collect SQL queries statistics for each request.
+
+    Statistics is returned to the client in `Server-Timing` header and written to logs.
+    """
+
+    def __init__(self: Self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":  # pragma: no cover
+            await self.app(scope, receive, send)
+            return
+
+        with collect_query_statistics() as statistics:
+
+            async def send_with_server_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message.setdefault("headers", []).append((b"server-timing", _format_server_timing(statistics)))
+                await send(message)
+
+            await self.app(scope, receive, send_with_server_timing)
+
+        _log_statistics(scope, statistics)
+
+
+def _format_server_timing(statistics: QueryStatistics) -> bytes:
+    duration_ms = statistics.duration * 1000
+    return f'db;dur={duration_ms:.2f};desc="{statistics.count} queries, {statistics.rows} rows"'.encode("latin-1")
+
+
+def _log_statistics(scope: Scope, statistics: QueryStatistics) -> None:
+    extra = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "db_queries": statistics.count,
+        "db_duration_ms": round(statistics.duration * 1000, 2),
+        "db_rows": statistics.rows,
+    }
+    logger.info("SQL queries executed during the request.", extra=extra)
+
+    for statement, count in statistics.repeated_statements.items():
+        logger.warning(
+            "Same SQL statement executed %s times during the request, it may be N+1 queries problem.",
+            count,
+            extra={**extra, "statement": statement},
+        )
@@ -0,0 +1,82 @@
+"""Deduplication of identical concurrent reads, so a burst of the same requests runs database query only once."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, TypeVar
+
+from src.shared.database import Base, get_replica
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+    from typing import Any, Self
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run identical concurrent calls once and share the result (or the exception) between all callers.
+
+    Only calls of read-only requests are deduplicated, since other requests should read their own writes.
+    Calls are grouped by the database used by the session too, so request which is sticky to the primary database
+    never gets data read from replica. Each waiting caller gets its own copy of models, because models are expired
+    once the session which loaded them is committed. If the caller which runs the call is cancelled, then one of
+    waiting callers runs the call itself, so only cancelled callers are cancelled. Calls are not shared between
+    worker processes.
+    """
+
+    def __init__(self: Self) -> None:
+        self._flights: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def run(self: Self, session: AsyncSession, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Run the call or wait for the result of identical call which is already running.
+
+        :param session: database session used by the call
+        :param key: identifies the call, for example name of the method and its arguments
+        :param call: function without arguments which reads data using the session
+        :returns: result of the call
+        """
+        if not session.info.get("readonly"):
+            return await call()
+
+        flight_key = (key, get_replica(session.info))
+        while (flight := self._flights.get(flight_key)) is not None:
+            with contextlib.suppress(_CallAbandonedError):  # the first waiter which wakes up runs the call itself
+                return _copy(await asyncio.shield(flight))  # so cancelled waiter doesn't cancel the call of others
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[flight_key] = flight
+        try:
+            result = await call()
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()  # marks exception as retrieved, so there is no warning if nobody is waiting
+            raise
+        except BaseException:  # for example the caller is cancelled, but waiters are not
+            flight.set_exception(_CallAbandonedError())
+            flight.exception()
+            raise
+        finally:
+            del self._flights[flight_key]
+        flight.set_result(_copy(result))
+        return result
+
+
+class _CallAbandonedError(Exception):
+    """Caller which runs the call is stopped before the call is completed, so waiting callers have to run it."""
+
+
+def _copy(value: T) -> T:
+    if isinstance(value, Base):
+        return value.copy()  # type: ignore[return-value]
+    if isinstance(value, list):
+        return [_copy(item) for item in value]  # type: ignore[return-value]
+    return value
+
+
+single_flight = SingleFlight()
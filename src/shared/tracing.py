@@ -0,0 +1,381 @@
+"""Opt-in request tracing.
+
+Each request is traced with a tree of spans: route -> controller -> model methods -> SQL statements / MinIO calls.
+Trace context is propagated according to W3C Trace Context (https://www.w3.org/TR/trace-context/):
+incoming `traceparent` header continues the caller's trace and `traceresponse` header is returned to the caller.
+
+Finished traces are written to a file as OTLP JSON lines, so the file can be read by OpenTelemetry collector
+(see `otlpjsonfile` receiver) or just inspected by hand.
+
+Tracing is disabled by default, when it's disabled nothing is instrumented, so there is no overhead at all.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import importlib
+import inspect
+import json
+import os
+import re
+import secrets
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.auth.schemas import AccessTokenPayload, RefreshTokenPayload
+from src.shared.database import Base
+from src.shared.minio import Minio
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from types import ModuleType
+    from typing import Any, Final, Self
+
+    from fastapi import FastAPI
+    from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# see: https://www.w3.org/TR/trace-context/#traceparent-header-field-values
+_TRACEPARENT_PATTERN: Final = re.compile(r"00-(?P<trace_id>[0-9a-f]{32})-(?P<parent_id>[0-9a-f]{16})-[0-9a-f]{2}")
+_INVALID_TRACE_ID: Final = "0" * 32
+_INVALID_SPAN_ID: Final = "0" * 16
+
+# see: https://opentelemetry.io/docs/specs/otel/trace/api/#spankind
+SPAN_KIND_INTERNAL: Final = 1
+SPAN_KIND_SERVER: Final = 2
+SPAN_KIND_CLIENT: Final = 3
+
+# see: https://opentelemetry.io/docs/specs/otel/trace/api/#set-status
+_STATUS_CODE_ERROR: Final = 2
+
+CONTROLLERS_MODULES: Final = (
+    "src.account.controllers",
+    "src.auth.controllers",
+    "src.file.controllers",
+    "src.friendship.controllers",
+    "src.profile.controllers",
+    "src.wish.controllers",
+)
+
+
+@dataclasses.dataclass
+class Span:
+    """Single timed operation, part of a trace."""
+
+    name: str
+    trace: Trace
+    span_id: str
+    parent_span_id: str | None
+    kind: int = SPAN_KIND_INTERNAL
+    attributes: dict[str, Any] = dataclasses.field(default_factory=dict)
+    start_time: int = dataclasses.field(default_factory=time.time_ns)  # nanoseconds since epoch
+    end_time: int | None = None  # nanoseconds since epoch
+    error: str | None = None
+
+    @property
+    def traceparent(self: Self) -> str:
+        return f"00-{self.trace.trace_id}-{self.span_id}-01"
+
+    def start_child(self: Self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Span:
+        return Span(name, self.trace, _generate_span_id(), self.span_id, kind, attributes)
+
+    def end(self: Self, error: BaseException | None = None) -> None:
+        self.end_time = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.trace.finished_spans.append(self)
+
+
+@dataclasses.dataclass
+class Trace:
+    """Part of a distributed trace which is processed by the current process."""
+
+    trace_id: str
+    finished_spans: list[Span] = dataclasses.field(default_factory=list)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(traceparent: str | None) -> tuple[str, str] | None:
+    """Parse W3C `traceparent` header value.
+
+    :returns: trace id and parent span id or `None` if header is missing or invalid
+    """
+    if traceparent is None:
+        return None
+    match = _TRACEPARENT_PATTERN.fullmatch(traceparent.strip())
+    if match is None or match["trace_id"] == _INVALID_TRACE_ID or match["parent_id"] == _INVALID_SPAN_ID:
+        return None
+    return match["trace_id"], match["parent_id"]
+
+
+@contextlib.contextmanager
+def start_trace(name: str, traceparent: str | None = None, **attributes: Any) -> Iterator[Span]:
+    """Start root span of the trace in current process. Trace is exported when the root span ends.
+
+    :param name: root span name
+    :param traceparent: value of W3C `traceparent` header, if it's valid then the caller's trace is continued
+    :param attributes: root span attributes
+    """
+    parent = parse_traceparent(traceparent)
+    trace_id, parent_span_id = parent if parent is not None else (secrets.token_hex(16), None)
+    span = Span(name, Trace(trace_id), _generate_span_id(), parent_span_id, SPAN_KIND_SERVER, attributes)
+    try:
+        with _activate(span):
+            yield span
+    finally:
+        exporter.export(span.trace.finished_spans)
+
+
+@contextlib.contextmanager
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Span | None]:
+    """Start child span of the current span. Nothing is traced outside of a trace, then `None` is yielded."""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    with _activate(parent.start_child(name, kind, **attributes)) as span:
+        yield span
+
+
+@contextlib.contextmanager
+def _activate(span: Span) -> Iterator[Span]:
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.end(error=e)
+        raise
+    else:
+        span.end()
+    finally:
+        _current_span.reset(token)
+
+
+def _generate_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+def traced(function: Callable[..., Any], name: str, **attributes: Any) -> Callable[..., Any]:
+    """Wrap sync or async function, so each its call is traced as a separate span."""
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with start_span(name, **attributes):
+                return await function(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        with start_span(name, **attributes):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class FileSpanExporter:
+    """Append finished traces to a file. Each trace is written as a single line in OTLP JSON format.
+
+    File is opened in append mode and each line is written with a single system call,
+    so several worker processes are able to write to the same file.
+    """
+
+    def __init__(self: Self, path: Path | str, service_name: str = "wlss-backend") -> None:
+        self.path = path
+        self.service_name = service_name
+
+    def export(self: Self, spans: list[Span]) -> None:
+        line = json.dumps(self._to_otlp(spans), separators=(",", ":")) + "\n"
+        file_descriptor = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(file_descriptor, line.encode("utf-8"))
+        finally:
+            os.close(file_descriptor)
+
+    def _to_otlp(self: Self, spans: list[Span]) -> dict[str, Any]:
+        # see: https://opentelemetry.io/docs/specs/otlp/#json-protobuf-encoding
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _to_otlp_attributes({"service.name": self.service_name})},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [_to_otlp_span(span) for span in spans],
+                        },
+                    ],
+                },
+            ],
+        }
+
+
+class NoopSpanExporter:  # pylint: disable=too-few-public-methods
+    """Drop finished traces. Used when tracing is not configured."""
+
+    def export(self: Self, spans: list[Span]) -> None:
+        pass
+
+
+def _to_otlp_span(span: Span) -> dict[str, Any]:
+    otlp_span = {
+        "traceId": span.trace.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time),
+        "attributes": _to_otlp_attributes(span.attributes),
+    }
+    if span.parent_span_id is not None:
+        otlp_span["parentSpanId"] = span.parent_span_id
+    if span.error is not None:
+        otlp_span["status"] = {"code": _STATUS_CODE_ERROR, "message": span.error}
+    return otlp_span
+
+
+def _to_otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    otlp_attributes = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            otlp_value = {"boolValue": value}
+        elif isinstance(value, int):
+            otlp_value = {"intValue": str(value)}  # int64 values are encoded as strings
+        elif isinstance(value, float):
+            otlp_value = {"doubleValue": value}
+        else:
+            otlp_value = {"stringValue": str(value)}
+        otlp_attributes.append({"key": key, "value": otlp_value})
+    return otlp_attributes
+
+
+exporter: FileSpanExporter | NoopSpanExporter = NoopSpanExporter()
+
+
+class TracingMiddleware:
+    """Trace each HTTP request. Root span is named after the route, for example "GET /accounts/{account_id}"."""
+
+    def __init__(self: Self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":  # pragma: no cover
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        traceparent = headers[b"traceparent"].decode("latin-1") if b"traceparent" in headers else None
+        method = scope["method"]
+        attributes = {"http.request.method": method, "url.path": scope["path"]}
+        with start_trace(f"{method} {scope['path']}", traceparent, **attributes) as span:
+
+            async def send_with_traceresponse(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.attributes["http.response.status_code"] = message["status"]
+                    message.setdefault("headers", []).append((b"traceresponse", span.traceparent.encode("latin-1")))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_traceresponse)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.name = f"{method} {route.path}"
+                    span.attributes["http.route"] = route.path
+
+
+def _start_statement_span(  # pylint: disable=too-many-arguments
+    connection: Connection,
+    cursor: Any,  # noqa: ANN401,ARG001
+    statement: str,
+    parameters: Any,  # noqa: ANN401,ARG001
+    context: ExecutionContext,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001,FBT001
+) -> None:
+    parent = _current_span.get()
+    if parent is not None:
+        operation = statement.split(maxsplit=1)[0].upper()  # for example "SELECT" or "INSERT"
+        span = parent.start_child(operation, SPAN_KIND_CLIENT, **{"db.system": "postgresql", "db.statement": statement})
+        connection.info["tracing_span"] = span
+
+
+def _end_statement_span(  # pylint: disable=too-many-arguments
+    connection: Connection,
+    cursor: Any,  # noqa: ANN401,ARG001
+    statement: str,  # noqa: ARG001
+    parameters: Any,  # noqa: ANN401,ARG001
+    context: ExecutionContext,  # noqa: ARG001
+    executemany: bool,  # noqa: ARG001,FBT001
+) -> None:
+    span = connection.info.pop("tracing_span", None)
+    if span is not None:
+        span.end()
+
+
+def _end_failed_statement_span(context: ExceptionContext) -> None:
+    if context.connection is None:  # pragma: no cover  # error happened while connecting, no statement was executed
+        return
+    span = context.connection.info.pop("tracing_span", None)
+    if span is not None:
+        span.end(error=context.original_exception)
+
+
+def instrument_engine(target: type[Engine] | Engine) -> None:
+    """Trace SQL statements executed by the engine, or by all engines if `Engine` class is passed."""
+    event.listen(target, "before_cursor_execute", _start_statement_span)
+    event.listen(target, "after_cursor_execute", _end_statement_span)
+    event.listen(target, "handle_error", _end_failed_statement_span)
+
+
+def instrument_module(module: ModuleType, layer: str) -> None:
+    """Trace calls of all functions defined in the module."""
+    for name, function in list(vars(module).items()):
+        if inspect.isfunction(function) and function.__module__ == module.__name__:
+            setattr(module, name, traced(function, f"{module.__name__}.{name}", **{"wlss.layer": layer}))
+
+
+def instrument_class(cls: type, layer: str, kind: int = SPAN_KIND_INTERNAL) -> None:
+    """Trace calls of all methods defined in the class, except magic methods and properties."""
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("__"):
+            continue
+        span_name = f"{cls.__name__}.{name}"
+        span_attributes = {"wlss.layer": layer}
+        if isinstance(attribute, staticmethod | classmethod):
+            wrapper = traced(attribute.__func__, span_name, kind=kind, **span_attributes)
+            setattr(cls, name, type(attribute)(wrapper))
+        elif inspect.isfunction(attribute):
+            setattr(cls, name, traced(attribute, span_name, kind=kind, **span_attributes))
+
+
+def instrument(app: FastAPI, path: Path | str) -> None:  # pragma: no cover
+    """Enable tracing of the app, finished traces are written to the file at `path`."""
+    global exporter  # noqa: PLW0603  # pylint: disable=global-statement
+    exporter = FileSpanExporter(path)
+
+    app.add_middleware(TracingMiddleware)
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            # endpoint function is taken from `dependant` on each request, so it can be replaced here
+            endpoint = route.dependant.call
+            route.dependant.call = traced(endpoint, endpoint.__name__, **{"wlss.layer": "route"})
+    for module_name in CONTROLLERS_MODULES:
+        instrument_module(importlib.import_module(module_name), "controller")
+    for mapper in Base.registry.mappers:
+        instrument_class(mapper.class_, "model")
+    instrument_class(AccessTokenPayload, "token")
+    instrument_class(RefreshTokenPayload, "token")
+    instrument_class(Minio, "minio", kind=SPAN_KIND_CLIENT)
+    instrument_engine(Engine)
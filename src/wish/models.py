@@ -73,8 +73,7 @@ class Wish(Base):
         if avatar_id is None:
             return
 
-        query = delete(File).where(File.id == avatar_id)
-        await session.execute(query)
+        await File.delete_file(session, avatar_id)
         await session.flush()
 
     async def create_booking(self: Self, session: AsyncSession, new_booking: NewWishBooking) -> WishBooking:
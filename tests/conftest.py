@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from types import SimpleNamespace
 
 import pytest
@@ -11,8 +12,11 @@ from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, cre
 from api.client import Api
 from src.app import app
 from src.config import CONFIG
+from src.friendship.cache import friends_cache
 from src.shared.database import get_session, POSTGRES_CONNECTION_URL
+from src.shared.metrics import MeasuredQueuePool
 from src.shared.minio import Minio
+from src.shared.profiling import collect_query_statistics
 from tests.utils.database import set_autoincrement_counters
 
 
@@ -22,6 +26,12 @@ def _initialize_db():
     set_autoincrement_counters()
 
 
+@pytest.fixture(autouse=True)
+def _clear_friends_cache():
+    """Forget friends cached by previous tests, since their database state is rolled back."""
+    friends_cache.clear()
+
+
 @pytest.fixture
 def anyio_backend():
     """Choose anyio back-end runner as asyncio. Source https://anyio.readthedocs.io/en/1.4.0/testing.html."""
@@ -43,7 +53,11 @@ async def db_empty():
     """Empty database session."""
     # this solution is from sqlalchemy docs:
     # https://docs.sqlalchemy.org/en/14/orm/session_transaction.html#joining-a-session-into-an-external-transaction-such-as-for-test-suites
-    async_engine = create_async_engine(POSTGRES_CONNECTION_URL, connect_args={"server_settings": {"jit": "off"}})
+    async_engine = create_async_engine(
+        POSTGRES_CONNECTION_URL,
+        connect_args={"server_settings": {"jit": "off"}},
+        poolclass=MeasuredQueuePool,
+    )
     connection = await async_engine.connect()
     transaction = await connection.begin()
     async_session = async_scoped_session(async_sessionmaker(bind=connection), scopefunc=asyncio.current_task)
@@ -71,6 +85,20 @@ async def minio_empty():
     return minio
 
 
+@pytest.fixture
+def max_queries():
+    """Fail the test if code inside `with max_queries(limit):` block executes more SQL queries than `limit`."""
+    @contextlib.contextmanager
+    def check_queries_count(limit):
+        with collect_query_statistics() as statistics:
+            yield statistics
+        assert statistics.count <= limit, (
+            f"Expected at most {limit} SQL queries, but {statistics.count} were executed:\n"
+            + "\n".join(statistics.statements)
+        )
+    return check_queries_count
+
+
 @pytest.fixture
 def f(request):
     """Load fixtures declared via 'fixtures' mark and put it into 'f' as its attributes."""
@@ -157,3 +157,24 @@ async def test_create_account_with_already_existed_login_raises_correct_exceptio
         "description": "Account already exists.",
         "details": "There is another account with same value for one of the unique fields.",
     }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "db": "db_empty", "max_queries": "max_queries"})
+async def test_create_account_executes_limited_number_of_queries(f):
+    with f.max_queries(1):
+        result = await f.api.account.create_account(
+            request_data=CreateAccountRequest.model_validate({
+                "account": {
+                    "email": "john.doe@mail.com",
+                    "login": "john_doe",
+                    "password": "qwerty123",
+                },
+                "profile": {
+                    "name": "John Doe",
+                    "description": "I'm the best guy for your mocks.",
+                },
+            }),
+        )
+
+    assert isinstance(result, CreateAccountResponse)
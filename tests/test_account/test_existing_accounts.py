@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from wlss.account.types import AccountEmail, AccountLogin
+from wlss.shared.types import Id
+
+from api.account.dtos import CreateAccountRequest, MatchAccountEmailRequest, MatchAccountLoginRequest
+from src.account.existence import ExistingAccounts
+from src.account.models import Account
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_with_one_account"})
+async def test_refresh_loads_existing_accounts(f):
+    existing_accounts = ExistingAccounts()
+
+    await existing_accounts.refresh(f.db)
+
+    assert existing_accounts.is_fresh
+    assert existing_accounts.may_have_login(AccountLogin("john_doe"))
+    assert existing_accounts.may_have_email(AccountEmail("john.doe@mail.com"))
+    assert not existing_accounts.may_have_login(AccountLogin("jane_doe"))
+    assert not existing_accounts.may_have_email(AccountEmail("jane.doe@mail.com"))
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_with_one_account"})
+async def test_refresh_loads_accounts_created_since_previous_refresh(f):
+    existing_accounts = ExistingAccounts()
+    await existing_accounts.refresh(f.db)
+    f.db.add(Account(id=Id(2), email=AccountEmail("jane.doe@mail.com"), login=AccountLogin("jane_doe")))
+    await f.db.flush()
+
+    await existing_accounts.refresh(f.db)
+
+    assert existing_accounts.may_have_login(AccountLogin("john_doe"))
+    assert existing_accounts.may_have_login(AccountLogin("jane_doe"))
+    assert existing_accounts.may_have_email(AccountEmail("jane.doe@mail.com"))
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_refresh_of_empty_accounts_reads_only_new_accounts_next_time(f):
+    existing_accounts = ExistingAccounts()
+    await existing_accounts.refresh(f.db)
+    f.db.add(Account(id=Id(1), email=AccountEmail("john.doe@mail.com"), login=AccountLogin("john_doe")))
+    await f.db.flush()
+
+    await existing_accounts.refresh(f.db)
+
+    assert existing_accounts.may_have_login(AccountLogin("john_doe"))
+
+
+def test_existing_accounts_may_have_any_login_and_email_until_refreshed():
+    existing_accounts = ExistingAccounts()
+
+    result = [
+        existing_accounts.is_fresh,
+        existing_accounts.may_have_login(AccountLogin("john_doe")),
+        existing_accounts.may_have_email(AccountEmail("john.doe@mail.com")),
+    ]
+
+    assert result == [False, True, True]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "db": "db_with_one_account", "max_queries": "max_queries"})
+async def test_match_account_login_with_missing_login_is_answered_without_database_check(f):
+    existing_accounts = ExistingAccounts()
+    await existing_accounts.refresh(f.db)
+
+    with (
+        patch("src.account.controllers.existing_accounts", existing_accounts),
+        f.max_queries(0),
+        pytest.raises(httpx.HTTPError) as exc_info,
+    ):
+        await f.api.account.match_account_login(request_data=MatchAccountLoginRequest(login="jane_doe"))
+
+    assert exc_info.value.response.status_code == 404
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "db": "db_with_one_account", "max_queries": "max_queries"})
+async def test_match_account_email_with_missing_email_is_answered_without_database_check(f):
+    existing_accounts = ExistingAccounts()
+    await existing_accounts.refresh(f.db)
+
+    with (
+        patch("src.account.controllers.existing_accounts", existing_accounts),
+        f.max_queries(0),
+        pytest.raises(httpx.HTTPError) as exc_info,
+    ):
+        await f.api.account.match_account_email(request_data=MatchAccountEmailRequest(email="jane.doe@mail.com"))
+
+    assert exc_info.value.response.status_code == 404
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "db": "db_with_one_account"})
+async def test_match_account_login_with_existing_login_is_checked_in_database(f):
+    existing_accounts = ExistingAccounts()
+    await existing_accounts.refresh(f.db)
+
+    with patch("src.account.controllers.existing_accounts", existing_accounts):
+        result = await f.api.account.match_account_login(request_data=MatchAccountLoginRequest(login="john_doe"))
+
+    assert result
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "db": "db_empty"})
+async def test_create_account_adds_account_to_existing_accounts(f):
+    existing_accounts = ExistingAccounts()
+    await existing_accounts.refresh(f.db)
+
+    with patch("src.account.controllers.existing_accounts", existing_accounts):
+        await f.api.account.create_account(
+            request_data=CreateAccountRequest.model_validate({
+                "account": {
+                    "email": "john.doe@mail.com",
+                    "login": "john_doe",
+                    "password": "qwerty123",
+                },
+                "profile": {
+                    "name": "John Doe",
+                    "description": "I'm the best guy for your mocks.",
+                },
+            }),
+        )
+
+    assert existing_accounts.may_have_login(AccountLogin("john_doe"))
+    assert existing_accounts.may_have_email(AccountEmail("john.doe@mail.com"))
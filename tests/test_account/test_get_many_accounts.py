@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+from wlss.shared.types import Id
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_two_accounts"})
+async def test_get_many_accounts_sends_request_per_batch_of_accounts(f):
+    # requests are sent one by one, since all of them share the same test database session
+    result = [
+        response.model_dump()
+        async for response in f.api.account.get_many_accounts(
+            account_ids=[Id(1), Id(2)],
+            token=f.access_token,
+            batch_size=1,
+            concurrency=1,
+        )
+    ]
+
+    assert sorted(result, key=lambda response: response["accounts"][0]["id"]) == [
+        {"accounts": [{"id": 1, "login": "john_doe"}]},
+        {"accounts": [{"id": 2, "login": "john_smith"}]},
+    ]
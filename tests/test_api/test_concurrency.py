@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+
+import pytest
+
+from api.shared.concurrency import get_batches, run_concurrently
+
+
+@pytest.mark.anyio
+async def test_run_concurrently_yields_results_in_order_of_completion():
+    async def call(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    calls = [functools.partial(call, "slow", 0.05), functools.partial(call, "fast", 0)]
+
+    result = [value async for value in run_concurrently(calls, concurrency=2)]
+
+    assert result == ["fast", "slow"]
+
+
+@pytest.mark.anyio
+async def test_run_concurrently_runs_limited_number_of_calls_at_once():
+    running = []
+    max_running = 0
+
+    async def call(value):
+        nonlocal max_running
+        running.append(value)
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(0)
+        running.remove(value)
+        return value
+
+    result = [value async for value in run_concurrently([functools.partial(call, i) for i in range(10)], concurrency=3)]
+
+    assert sorted(result) == list(range(10))
+    assert max_running == 3
+
+
+@pytest.mark.anyio
+async def test_run_concurrently_raises_first_exception_and_cancels_other_calls():
+    cancelled = asyncio.Event()
+
+    async def fail():
+        raise ValueError
+
+    async def wait():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        async for _ in run_concurrently([wait, fail], concurrency=2):
+            pass
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.anyio
+async def test_run_concurrently_takes_calls_from_iterable_lazily():
+    taken = []
+
+    async def call(value):
+        await asyncio.sleep(0)
+        return value
+
+    def get_calls():
+        for i in itertools.count():
+            taken.append(i)
+            yield functools.partial(call, i)
+
+    result = []
+    async for value in run_concurrently(get_calls(), concurrency=2):
+        result.append(value)
+        if len(result) == 3:
+            break
+
+    assert len(result) == 3
+    assert len(taken) < 10
+
+
+def test_get_batches_splits_values_keeping_their_order():
+    result = get_batches(iter(range(5)), size=2)
+
+    assert result == [[0, 1], [2, 3], [4]]
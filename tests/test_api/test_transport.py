@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from api.client import Api
+from api.health.dtos import HealthResponse
+from api.shared.transport import RetryTransport
+from src.app import app
+
+
+def _get_transport(*responses):
+    """Get transport which returns responses one by one, exception instead of response is raised."""
+    requests = []
+
+    def handle(request):
+        requests.append(request.method)
+        response = responses[len(requests) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.MockTransport(handle), requests
+
+
+@pytest.mark.anyio
+async def test_retry_transport_retries_idempotent_request_until_success():
+    transport, requests = _get_transport(
+        httpx.Response(503),
+        httpx.ConnectError("Connection refused."),
+        httpx.Response(200),
+    )
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=2, backoff=0)) as client:
+        result = await client.get("http://app/health")
+
+    assert result.status_code == 200
+    assert requests == ["GET", "GET", "GET"]
+
+
+@pytest.mark.anyio
+async def test_retry_transport_returns_last_response_when_retries_are_exhausted():
+    transport, requests = _get_transport(httpx.Response(429), httpx.Response(502))
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=1, backoff=0)) as client:
+        result = await client.put("http://app/accounts/1/wishes/1")
+
+    assert result.status_code == 502
+    assert requests == ["PUT", "PUT"]
+
+
+@pytest.mark.anyio
+async def test_retry_transport_does_not_retry_not_idempotent_request():
+    transport, requests = _get_transport(httpx.Response(503))
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=2, backoff=0)) as client:
+        result = await client.post("http://app/accounts")
+
+    assert result.status_code == 503
+    assert requests == ["POST"]
+
+
+@pytest.mark.anyio
+async def test_retry_transport_does_not_retry_client_error():
+    transport, requests = _get_transport(httpx.Response(404))
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=2, backoff=0)) as client:
+        result = await client.get("http://app/accounts/1")
+
+    assert result.status_code == 404
+    assert requests == ["GET"]
+
+
+@pytest.mark.anyio
+@patch("api.shared.transport.asyncio.sleep", new_callable=AsyncMock)
+async def test_retry_transport_waits_for_retry_after_from_server(sleep):
+    transport, _ = _get_transport(
+        httpx.Response(503, headers={"Retry-After": "7"}),
+        httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+        httpx.Response(200),
+    )
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=2, backoff=0)) as client:
+        result = await client.get("http://app/health")  # noqa: F841
+
+    assert [call.args for call in sleep.call_args_list] == [(7,), (0,)]
+
+
+@pytest.mark.anyio
+async def test_retry_transport_returns_response_when_retry_after_is_longer_than_max_delay():
+    transport, requests = _get_transport(httpx.Response(503, headers={"Retry-After": "3600"}), httpx.Response(200))
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=2, backoff=0, max_delay=60)) as client:
+        result = await client.get("http://app/health")
+
+    assert result.status_code == 503
+    assert requests == ["GET"]
+
+
+@pytest.mark.anyio
+@patch("api.shared.transport.asyncio.sleep", new_callable=AsyncMock)
+async def test_retry_transport_does_not_wait_longer_than_max_delay(sleep):
+    transport, _ = _get_transport(httpx.ConnectError("Connection refused."), httpx.Response(200))
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=1, backoff=100, max_delay=1)) as client:
+        result = await client.get("http://app/health")  # noqa: F841
+
+    assert 0 <= sleep.call_args.args[0] <= 1
+
+
+@pytest.mark.anyio
+async def test_retry_transport_does_not_retry_pool_timeout():
+    transport, requests = _get_transport(httpx.PoolTimeout("Pool is exhausted."), httpx.Response(200))
+
+    async with httpx.AsyncClient(transport=RetryTransport(transport, retries=2, backoff=0)) as client:
+        with pytest.raises(httpx.PoolTimeout):
+            await client.get("http://app/health")
+
+    assert requests == ["GET"]
+
+
+@pytest.mark.anyio
+async def test_api_with_retries_sends_requests_to_the_app():
+    async with Api(app=app, base_url="http://", retries=1) as api:
+        result = await api.health.get_health()
+
+    assert isinstance(result, HealthResponse)
+
+
+@pytest.mark.anyio
+async def test_api_with_retries_raises_network_error_when_retries_are_exhausted():
+    async with Api(base_url="http://127.0.0.1:1", retries=1, backoff=0) as api:
+        with pytest.raises(httpx.ConnectError):
+            await api.health.get_health()
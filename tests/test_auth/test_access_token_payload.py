@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from src.auth.schemas import AccessTokenPayload
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token"})
+async def test_decode_caches_payload_of_the_same_token(f):
+    payload = AccessTokenPayload.decode(f.access_token)
+
+    with patch.object(jwt, "decode", side_effect=AssertionError("token should not be decoded again")):
+        result = AccessTokenPayload.decode(f.access_token)
+
+    assert result is payload
+
+
+def test_decode_does_not_cache_payload_of_expired_token():
+    token = AccessTokenPayload.model_validate({
+        "account_id": 42,
+        "created_at": datetime(2023, 6, 17, 11, 47, 2, 823000, tzinfo=timezone.utc),
+        "session_id": "0b928aaa-521f-47ec-8be5-396650e2a187",
+    }).encode()
+    AccessTokenPayload.decode(token)
+
+    with patch.object(jwt, "decode", wraps=jwt.decode) as decode:
+        result = AccessTokenPayload.decode(token)  # noqa: F841
+
+    decode.assert_called_once()
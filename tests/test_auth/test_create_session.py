@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
+from uuid import UUID
 
 import dirty_equals
 import httpx
@@ -9,10 +11,10 @@ import jwt
 import pydantic
 import pytest
 from sqlalchemy import select
-from wlss.shared.types import Id
+from wlss.shared.types import Id, UtcDatetime
 
 from api.auth.dtos import CreateSessionRequest, CreateSessionResponse
-from src.auth.models import Session
+from src.auth.models import RevokedSession, Session
 from src.config import CONFIG
 from src.shared.database import Base
 from tests.utils.dirty_equals import IsUtcDatetime, IsUtcDatetimeSerialized
@@ -148,3 +150,26 @@ async def test_create_session_with_wrong_credentials_raises_correct_exception(f)
         "description": "Requested resource not found.",
         "details": "Requested resource doesn't exist or has been deleted.",
     }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "db": "db_with_one_account"})
+async def test_create_session_deletes_least_recently_used_sessions_over_the_limit(f):
+    least_recently_used_at = UtcDatetime(datetime.now(tz=timezone.utc) - timedelta(days=1))
+    f.db.add(Session(
+        id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"),
+        account_id=Id(1),
+        updated_at=least_recently_used_at,
+    ))
+    f.db.add_all([Session(account_id=Id(1)) for _ in range(CONFIG.SESSIONS_MAX_PER_ACCOUNT - 1)])
+    await f.db.commit()
+
+    result = await f.api.auth.create_session(  # noqa: F841
+        request_data=CreateSessionRequest.model_validate({"login": "john_doe", "password": "qwerty123"}),
+    )
+
+    session_ids = (await f.db.execute(select(Session.id))).scalars().all()
+    assert len(session_ids) == CONFIG.SESSIONS_MAX_PER_ACCOUNT
+    assert UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec") not in session_ids
+    revoked_session_ids = (await f.db.execute(select(RevokedSession.session_id))).scalars().all()
+    assert revoked_session_ids == [UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")]
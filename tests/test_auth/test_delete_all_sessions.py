@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 import httpx
 import pytest
 from sqlalchemy import select
 from wlss.shared.types import Id
 
-from src.auth.models import Session
+from src.auth.models import RevokedSession, Session
 
 
 @pytest.mark.anyio
@@ -41,3 +43,12 @@ async def test_delete_all_sessions_with_account_different_than_current_account_r
         "description": "Requested action not allowed.",
         "details": "Provided tokens or credentials don't grant you enough access rights.",
     }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "access_token": "access_token", "db": "db_with_one_account_and_two_sessions"})
+async def test_delete_all_sessions_records_revoked_sessions_to_db_correctly(f):
+    result = await f.api.auth.delete_all_sessions(account_id=Id(1), token=f.access_token)  # noqa: F841
+
+    rows = (await f.db.execute(select(RevokedSession.session_id))).scalars().all()
+    assert sorted(rows) == [UUID("2ee55d6c-fe71-4ba0-9bbc-df074d365f60"), UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")]
@@ -7,7 +7,7 @@ import pytest
 from sqlalchemy import select
 from wlss.shared.types import Id
 
-from src.auth.models import Session
+from src.auth.models import RevokedSession, Session
 
 
 @pytest.mark.anyio
@@ -35,6 +35,19 @@ async def test_delete_session_deletes_session_from_db_correctly(f):
     assert not rows
 
 
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "access_token": "access_token", "db": "db_with_one_account_and_one_session"})
+async def test_delete_session_records_revoked_session_to_db_correctly(f):
+    result = await f.api.auth.delete_session(  # noqa: F841
+        account_id=Id(1),
+        session_id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"),
+        token=f.access_token,
+    )
+
+    rows = (await f.db.execute(select(RevokedSession.session_id))).scalars().all()
+    assert rows == [UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")]
+
+
 @pytest.mark.anyio
 @pytest.mark.fixtures({"api": "api", "access_token": "access_token", "db": "db_with_one_account_and_one_session"})
 async def test_delete_session_with_different_session_ids_in_url_path_and_token_raises_correct_exception(f):
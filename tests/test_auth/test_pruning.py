@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from wlss.shared.types import Id, UtcDatetime
+
+from src.auth.models import RevokedSession, Session
+from src.auth.pruning import prune_sessions
+from src.config import CONFIG
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_with_one_account"})
+async def test_prune_sessions_deletes_expired_sessions_and_log_records_in_batches(f):
+    expired_at = UtcDatetime(
+        datetime.now(tz=timezone.utc) - timedelta(days=CONFIG.DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION + 1),
+    )
+    f.db.add_all([
+        Session(id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"), account_id=Id(1), updated_at=expired_at),
+        Session(id=UUID("2ee55d6c-fe71-4ba0-9bbc-df074d365f60"), account_id=Id(1), updated_at=expired_at),
+        Session(id=UUID("0b928aaa-521f-47ec-8be5-396650e2a187"), account_id=Id(1)),
+        RevokedSession(session_id=UUID("4b2c7e0b-3a05-4b8f-9c6e-1f2d3a4b5c6d"), created_at=expired_at),
+        RevokedSession(session_id=UUID("9f8e7d6c-5b4a-4321-8fed-cba987654321")),
+    ])
+    await f.db.flush()
+
+    result = await prune_sessions(f.db, batch_size=1)
+
+    assert result == 3
+    sessions = (await f.db.execute(select(Session.id))).scalars().all()
+    assert sessions == [UUID("0b928aaa-521f-47ec-8be5-396650e2a187")]
+    log_records = (await f.db.execute(select(RevokedSession.session_id))).scalars().all()
+    assert log_records == [UUID("9f8e7d6c-5b4a-4321-8fed-cba987654321")]
@@ -7,10 +7,12 @@ import dirty_equals
 import httpx
 import jwt
 import pytest
+from sqlalchemy import select
 from wlss.shared.types import Id
 
 from api.auth.dtos import RefreshTokensResponse
 from api.shared.datetime import DATETIME_FORMAT
+from src.auth.models import Session
 from src.config import CONFIG
 from tests.utils.dirty_equals import IsUtcDatetimeSerialized
 
@@ -52,6 +54,21 @@ async def test_refresh_tokens_returns_correct_response(f):
     assert access_token_expiration < refresh_token_expiration
 
 
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "refresh_token": "refresh_token", "db": "db_with_one_account_and_one_session"})
+async def test_refresh_tokens_prolongs_session_in_db_correctly(f):
+    refreshed_after = datetime.now(tz=timezone.utc)
+
+    result = await f.api.auth.refresh_tokens(  # noqa: F841
+        account_id=Id(1),
+        session_id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"),
+        token=f.refresh_token,
+    )
+
+    auth_session = (await f.db.execute(select(Session))).scalar_one()
+    assert auth_session.updated_at.value > refreshed_after
+
+
 @pytest.mark.anyio
 @pytest.mark.fixtures({
     "api": "api",
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import UUID
+
+import httpx
+import pytest
+from sqlalchemy import select
+from wlss.shared.types import Id, UtcDatetime
+
+from src.auth.models import RevokedSession
+from src.auth.revocation import RevokedSessions
+from src.config import CONFIG
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_refresh_loads_revoked_sessions_from_log(f):
+    await RevokedSession.create_many(f.db, [UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")])
+    revoked_sessions = RevokedSessions()
+
+    await revoked_sessions.refresh(f.db)
+
+    assert revoked_sessions.is_fresh
+    assert revoked_sessions.is_revoked(UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"))
+    assert not revoked_sessions.is_revoked(UUID("2ee55d6c-fe71-4ba0-9bbc-df074d365f60"))
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_refresh_loads_sessions_revoked_since_previous_refresh(f):
+    await RevokedSession.create_many(f.db, [UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")])
+    revoked_sessions = RevokedSessions()
+    await revoked_sessions.refresh(f.db)
+    await RevokedSession.create_many(f.db, [UUID("2ee55d6c-fe71-4ba0-9bbc-df074d365f60")])
+
+    await revoked_sessions.refresh(f.db)
+
+    assert revoked_sessions.is_revoked(UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"))
+    assert revoked_sessions.is_revoked(UUID("2ee55d6c-fe71-4ba0-9bbc-df074d365f60"))
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_refresh_forgets_sessions_revoked_before_refresh_tokens_expiration(f):
+    revoked_at = datetime.now(tz=timezone.utc) - timedelta(days=CONFIG.DAYS_BEFORE_REFRESH_TOKEN_EXPIRATION + 1)
+    f.db.add(RevokedSession(
+        session_id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"),
+        created_at=UtcDatetime(revoked_at),
+    ))
+    await f.db.flush()
+    revoked_sessions = RevokedSessions()
+
+    await revoked_sessions.refresh(f.db)
+
+    assert not revoked_sessions.is_revoked(UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"))
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_create_many_with_no_sessions_does_nothing(f):
+    await RevokedSession.create_many(f.db, [])
+
+    rows = (await f.db.execute(select(RevokedSession))).all()
+    assert not rows
+
+
+def test_revoked_sessions_are_not_fresh_until_refreshed():
+    result = RevokedSessions().is_fresh
+
+    assert result is False
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_one_account_and_one_session",
+})
+async def test_access_token_of_revoked_session_is_rejected_without_database_check(f):
+    await RevokedSession.create_many(f.db, [UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")])
+    revoked_sessions = RevokedSessions()
+    await revoked_sessions.refresh(f.db)
+
+    with patch("src.auth.dependencies.revoked_sessions", revoked_sessions), pytest.raises(httpx.HTTPError) as exc_info:
+        await f.api.auth.delete_all_sessions(account_id=Id(1), token=f.access_token)
+
+    assert exc_info.value.response.status_code == 401
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "refresh_token": "refresh_token",
+    "db": "db_with_one_account_and_one_session",
+})
+async def test_refresh_token_of_revoked_session_is_rejected_without_database_check(f):
+    await RevokedSession.create_many(f.db, [UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")])
+    revoked_sessions = RevokedSessions()
+    await revoked_sessions.refresh(f.db)
+
+    with patch("src.auth.dependencies.revoked_sessions", revoked_sessions), pytest.raises(httpx.HTTPError) as exc_info:
+        await f.api.auth.refresh_tokens(
+            account_id=Id(1),
+            session_id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"),
+            token=f.refresh_token,
+        )
+
+    assert exc_info.value.response.status_code == 401
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_one_account_and_one_session",
+})
+async def test_access_token_of_not_revoked_session_is_accepted_when_revoked_sessions_are_fresh(f):
+    revoked_sessions = RevokedSessions()
+    await revoked_sessions.refresh(f.db)
+
+    with patch("src.auth.dependencies.revoked_sessions", revoked_sessions):
+        result = await f.api.auth.delete_all_sessions(account_id=Id(1), token=f.access_token)
+
+    assert result is None
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "refresh_token": "refresh_token",
+    "db": "db_with_one_account_and_one_session",
+})
+async def test_refresh_token_of_not_revoked_session_is_accepted_when_revoked_sessions_are_fresh(f):
+    revoked_sessions = RevokedSessions()
+    await revoked_sessions.refresh(f.db)
+
+    with patch("src.auth.dependencies.revoked_sessions", revoked_sessions):
+        result = await f.api.auth.refresh_tokens(
+            account_id=Id(1),
+            session_id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"),
+            token=f.refresh_token,
+        )
+
+    assert result.access_token
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from api.client import Api
+from benchmarks.load.recording import get_endpoint, get_percentile, Recorder, RecordingTransport
+from benchmarks.load.runner import run_load
+from src.app import app
+
+
+def test_get_endpoint_replaces_ids_with_placeholders():
+    result = [
+        get_endpoint("GET", "/accounts/42/wishes/17"),
+        get_endpoint("GET", "/files/0b928aaa-521f-47ec-8be5-396650e2a187"),
+        get_endpoint("POST", "/accounts"),
+    ]
+
+    assert result == ["GET /accounts/{id}/wishes/{id}", "GET /files/{id}", "POST /accounts"]
+
+
+def test_get_percentile_uses_nearest_rank():
+    values = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+
+    result = [get_percentile(values, percentile) for percentile in (0, 50, 90, 95, 100)]
+
+    assert result == [0.1, 0.5, 0.9, 1.0, 1.0]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api"})  # makes the app use test database
+async def test_run_load_reports_latency_of_each_endpoint(f):
+    recorder = Recorder()
+    transport = RecordingTransport(httpx.ASGITransport(app=app), recorder)
+
+    async with Api(base_url="http://", transport=transport) as api:
+        result = await run_load(api, recorder, {"create_wishes": 1}, users=1, duration=0.1)
+
+    assert result.iterations >= 1
+    assert result.failed_iterations == 0
+    assert [endpoint.endpoint for endpoint in result.endpoints] == [
+        "GET /accounts/{id}/wishes",
+        "POST /accounts/{id}/wishes",
+    ]
+    assert all(endpoint.requests == result.iterations for endpoint in result.endpoints)
+    assert all(endpoint.errors == 0 for endpoint in result.endpoints)
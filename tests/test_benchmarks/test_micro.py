@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.micro.__main__ import main
+from benchmarks.micro.cases import BENCHMARKS
+from benchmarks.micro.measuring import compare, Measurement, measure, save_baseline
+
+
+@pytest.mark.parametrize("name", BENCHMARKS)
+def test_benchmark_runs_without_errors(name):
+    BENCHMARKS[name]()
+
+
+def test_measure_returns_time_of_single_call():
+    result = measure("noop", lambda: None, rounds=2, min_time=0.01)
+
+    assert result.name == "noop"
+    assert 0 < result.seconds < 0.001
+    assert result.calls >= 2
+
+
+def test_compare_marks_measurements_slower_than_threshold_as_regression():
+    measurements = [
+        Measurement(name="fast", seconds=1.1, calls=1),
+        Measurement(name="slow", seconds=1.3, calls=1),
+        Measurement(name="new", seconds=1.0, calls=1),
+    ]
+
+    result = compare(measurements, {"fast": 1.0, "slow": 1.0}, threshold=0.2)
+
+    assert [(comparison.name, comparison.is_regression) for comparison in result] == [
+        ("fast", False),
+        ("slow", True),
+        ("new", False),
+    ]
+
+
+def test_save_baseline_keeps_baseline_of_not_measured_benchmarks(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"a": 1.0, "b": 2.0}))
+
+    save_baseline(path, [Measurement(name="b", seconds=3.0, calls=1)])
+
+    assert json.loads(path.read_text()) == {"a": 1.0, "b": 3.0}
+
+
+def test_main_fails_without_baseline_of_the_benchmark(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"access_token_encode": 1.0}))
+
+    result = main(["--benchmark=access_token_encode", "--benchmark=schema_from", f"--baseline={path}"])
+
+    assert result == 2
+    assert "There is no baseline of schema_from" in capsys.readouterr().err
@@ -12,7 +12,7 @@ from wlss.file.types import FileName, FileSize
 
 from api.file.dtos import CreateFileRequest, CreateFileResponse
 from api.file.enums import Extension, MimeType
-from src.file.models import File
+from src.file.models import Blob, File
 from src.shared.database import Base
 from tests.utils.dirty_equals import IsUtcDatetime
 from tests.utils.mocks.models import __eq__
@@ -77,6 +77,7 @@ async def test_create_file_creates_file_in_db_correctly(f):
         files = (await f.db.execute(select(File))).scalars().all()
         assert files == [
             File(
+                blob_digest="da412fa678f3fe990582c4ec8de250ac360c5dcc994908f0ad98d58f47a63652",
                 created_at=IsUtcDatetime,
                 id=dirty_equals.IsUUID(4),
                 extension=Extension.PNG,
@@ -114,7 +115,7 @@ async def test_create_file_uploads_file_to_minio_correctly(f):
     files = list(f.minio.list_objects("files"))
     assert len(files) == 1
     file = files[0]
-    assert file.object_name == dirty_equals.IsUUID(4)
+    assert file.object_name == "da412fa678f3fe990582c4ec8de250ac360c5dcc994908f0ad98d58f47a63652"
     assert file.size == 17
     with tempfile.TemporaryDirectory() as tmp_dir:
         file_path = Path(tmp_dir) / "file"
@@ -122,6 +123,71 @@ async def test_create_file_uploads_file_to_minio_correctly(f):
         assert file_path.read_bytes() == b"image binary data"
 
 
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_one_account_and_one_session",
+    "minio": "minio_empty",
+})
+async def test_create_file_creates_blob_in_db_correctly(f):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_file_path = Path(tmp_dir) / "image.png"
+        tmp_file_path.write_bytes(b"image binary data")
+
+        result = await f.api.file.create_file(  # noqa: F841
+            token=f.access_token,
+            request_data=CreateFileRequest(
+                name="image.png",
+                mime_type="image/png",
+                extension="png",
+                size=17,
+                tmp_file_path=tmp_file_path,
+            ),
+        )
+
+    with patch.object(Base, "__eq__", __eq__):
+        blobs = (await f.db.execute(select(Blob))).scalars().all()
+        assert blobs == [
+            Blob(
+                created_at=IsUtcDatetime,
+                digest="da412fa678f3fe990582c4ec8de250ac360c5dcc994908f0ad98d58f47a63652",
+                reference_count=1,
+                size=FileSize(17),
+            ),
+        ]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_one_account_and_one_session",
+    "minio": "minio_empty",
+})
+async def test_create_file_with_same_content_references_stored_blob(f):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_file_path = Path(tmp_dir) / "image.png"
+        tmp_file_path.write_bytes(b"image binary data")
+        request_data = CreateFileRequest(
+            name="image.png",
+            mime_type="image/png",
+            extension="png",
+            size=17,
+            tmp_file_path=tmp_file_path,
+        )
+        await f.api.file.create_file(token=f.access_token, request_data=request_data)
+
+        with patch("src.file.controllers.Minio.upload_file") as upload_file:
+            result = await f.api.file.create_file(token=f.access_token, request_data=request_data)
+
+    upload_file.assert_not_called()
+    file = (await f.db.execute(select(File).where(File.id == result.id))).scalar_one()
+    assert file.blob_digest == "da412fa678f3fe990582c4ec8de250ac360c5dcc994908f0ad98d58f47a63652"
+    blob = (await f.db.execute(select(Blob))).scalar_one()
+    assert blob.reference_count == 2
+
+
 @pytest.mark.anyio
 @pytest.mark.fixtures({
     "access_token": "access_token",
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import tempfile
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import Mock
+from uuid import UUID
+
+import pytest
+from PIL import Image
+
+from api.file.dtos import CreateFileRequest, GetFileResponse
+from src.file.thumbnails import choose_size, create_thumbnails, make_thumbnails, thumbnails_executor, ThumbnailsExecutor
+
+
+def _save_png(file_path, width, height):
+    Image.new("RGB", (width, height), color="red").save(file_path, "PNG")
+    return file_path
+
+
+def _save_upload(upload_dir):
+    """Save image like an uploaded file which is stored in its own temporary directory."""
+    upload_dir.mkdir()
+    return _save_png(upload_dir / "image.png", 100, 100)
+
+
+@pytest.mark.parametrize(
+    ("size", "expected_size"),
+    [(1, 64), (64, 64), (65, 256), (1024, 1024), (1025, None), (5000, None)],
+)
+def test_choose_size_returns_smallest_thumbnail_which_is_not_smaller_than_requested_or_none(size, expected_size):
+    result = choose_size(size)
+
+    assert result == expected_size
+
+
+def test_make_thumbnails_saves_webp_thumbnail_of_each_size(tmp_path):
+    file_path = _save_png(tmp_path / "image.png", 2000, 1000)
+
+    result = make_thumbnails(file_path)
+
+    assert result == [
+        (64, tmp_path / "image.64.webp"),
+        (256, tmp_path / "image.256.webp"),
+        (1024, tmp_path / "image.1024.webp"),
+    ]
+    for size, thumbnail_path in result:
+        with Image.open(thumbnail_path) as thumbnail:
+            assert thumbnail.format == "WEBP"
+            assert thumbnail.size == (size, size // 2)
+
+
+def test_make_thumbnails_does_not_upscale_image(tmp_path):
+    file_path = _save_png(tmp_path / "image.png", 100, 50)
+
+    result = make_thumbnails(file_path)
+
+    assert result == [(64, tmp_path / "image.64.webp")]
+
+
+def test_make_thumbnails_converts_image_with_palette(tmp_path):
+    file_path = tmp_path / "image.png"
+    Image.new("P", (100, 100)).save(file_path, "PNG")
+
+    result = make_thumbnails(file_path)
+
+    assert result == [(64, tmp_path / "image.64.webp")]
+
+
+def test_make_thumbnails_skips_animated_image(tmp_path):
+    file_path = tmp_path / "image.gif"
+    frames = [Image.new("RGB", (100, 100), color=color) for color in ("red", "blue")]
+    frames[0].save(file_path, "GIF", save_all=True, append_images=frames[1:])
+
+    result = make_thumbnails(file_path)
+
+    assert result == []
+
+
+@pytest.mark.anyio
+async def test_create_thumbnails_removes_temporary_directory_if_upload_fails(tmp_path):
+    (tmp_path / "upload").mkdir()
+    file_path = _save_png(tmp_path / "upload" / "image.png", 300, 300)
+    minio = Mock(upload_thumbnail=Mock(side_effect=RuntimeError))
+
+    with pytest.raises(RuntimeError):
+        await create_thumbnails(minio, "object", file_path)
+
+    assert not file_path.parent.exists()
+
+
+def test_create_thumbnails_works_in_process_forked_after_executor_is_used(tmp_path):
+    asyncio.run(create_thumbnails(Mock(), "object", _save_upload(tmp_path / "parent")))
+    file_path = _save_upload(tmp_path / "child")
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        exit_code = 1
+        try:
+            minio = Mock()
+            asyncio.run(asyncio.wait_for(create_thumbnails(minio, "object", file_path), timeout=30))
+            exit_code = 0 if minio.upload_thumbnail.call_count == 1 else 1
+        finally:
+            os._exit(exit_code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+def test_create_thumbnails_replaces_broken_executor(tmp_path):
+    with contextlib.suppress(BrokenProcessPool):
+        thumbnails_executor.get().submit(os._exit, 1).result()
+    asyncio.run(create_thumbnails(Mock(), "object", _save_upload(tmp_path / "first")))
+    minio = Mock()
+
+    asyncio.run(create_thumbnails(minio, "object", _save_upload(tmp_path / "second")))
+
+    assert minio.upload_thumbnail.call_count == 1
+
+
+def test_thumbnails_executor_shutdown_allows_to_use_it_again():
+    executor = ThumbnailsExecutor()
+    first_pool = executor.get()
+    executor.shutdown()
+    executor.shutdown()
+
+    result = executor.get()
+
+    assert result is not first_pool
+    assert result.submit(abs, -1).result() == 1
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_one_account_and_one_session",
+    "minio": "minio_empty",
+})
+async def test_create_file_uploads_thumbnails_to_minio(f):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_file_path = _save_png(Path(tmp_dir) / "image.png", 300, 300)
+        digest = hashlib.sha256(tmp_file_path.read_bytes()).hexdigest()
+
+        result = await f.api.file.create_file(  # noqa: F841
+            token=f.access_token,
+            request_data=CreateFileRequest(
+                name="image.png",
+                mime_type="image/png",
+                extension="png",
+                size=tmp_file_path.stat().st_size,
+                tmp_file_path=tmp_file_path,
+            ),
+        )
+
+    object_names = sorted(minio_object.object_name for minio_object in f.minio.list_objects("files"))
+    assert object_names == [digest, f"{digest}.256.webp", f"{digest}.64.webp"]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "db": "db_with_one_file",
+    "minio": "minio_with_one_file",
+    "tmp_path": "tmp_path",
+})
+async def test_get_file_with_size_returns_nearest_thumbnail(f):
+    f.minio.put_object(
+        "files",
+        "4c8a2c85-0fe3-4ab0-b683-96bb1805d370.256.webp",
+        data=BytesIO(b"thumbnail binary data"),
+        length=21,
+    )
+
+    result = await f.api.file.get_file(
+        file_id=UUID("4c8a2c85-0fe3-4ab0-b683-96bb1805d370"),
+        tmp_file_path=f.tmp_path / "image.webp",
+        size=100,
+    )
+
+    assert isinstance(result, GetFileResponse)
+    assert result.media_type == "image/webp"
+    assert result.path.read_bytes() == b"thumbnail binary data"
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "db": "db_with_one_file",
+    "minio": "minio_with_one_file",
+    "tmp_path": "tmp_path",
+})
+async def test_get_file_with_size_returns_original_file_if_there_is_no_thumbnail(f):
+    result = await f.api.file.get_file(
+        file_id=UUID("4c8a2c85-0fe3-4ab0-b683-96bb1805d370"),
+        tmp_file_path=f.tmp_path / "image.png",
+        size=64,
+    )
+
+    assert result.media_type == "image/png"
+    assert result.path.read_bytes() == b"image binary data"
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "db": "db_with_one_file",
+    "minio": "minio_with_one_file",
+    "tmp_path": "tmp_path",
+})
+async def test_get_file_with_size_larger_than_all_thumbnails_returns_original_file(f):
+    f.minio.put_object(
+        "files",
+        "4c8a2c85-0fe3-4ab0-b683-96bb1805d370.1024.webp",
+        data=BytesIO(b"thumbnail binary data"),
+        length=21,
+    )
+
+    result = await f.api.file.get_file(
+        file_id=UUID("4c8a2c85-0fe3-4ab0-b683-96bb1805d370"),
+        tmp_file_path=f.tmp_path / "image.png",
+        size=2048,
+    )
+
+    assert result.media_type == "image/png"
+    assert result.path.read_bytes() == b"image binary data"
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from api.file.dtos import CreateFileRequest
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_one_account_and_one_session",
+    "minio": "minio_empty",
+    "tmp_path": "tmp_path",
+})
+async def test_upload_many_uploads_each_file(f):
+    requests_data = []
+    for name, content in (("first.png", b"first image"), ("second.png", b"second image")):
+        tmp_file_path = Path(f.tmp_path) / name
+        tmp_file_path.write_bytes(content)
+        requests_data.append(
+            CreateFileRequest(
+                name=name,
+                mime_type="image/png",
+                extension="png",
+                size=len(content),
+                tmp_file_path=tmp_file_path,
+            ),
+        )
+
+    # requests are sent one by one, since all of them share the same test database session
+    result = [
+        (request_data.name.value, response.model_dump()["size"])
+        async for request_data, response in f.api.file.upload_many(requests_data, token=f.access_token, concurrency=1)
+    ]
+
+    assert sorted(result) == [("first.png", 11), ("second.png", 12)]
+    assert len(list(f.minio.list_objects("files"))) == 2
@@ -82,6 +82,23 @@ async def db_with_one_friendship_request(db_with_two_accounts):  # pylint: disab
     return session
 
 
+@pytest.fixture
+async def db_with_one_rejected_friendship_request(db_with_two_accounts):  # pylint: disable=redefined-outer-name
+    session = db_with_two_accounts
+
+    friendship_request = FriendshipRequest(
+        id=Id(1),
+        receiver_id=Id(2),
+        sender_id=Id(1),
+        status=FriendshipRequestStatus.REJECTED,
+    )
+    session.add(friendship_request)
+    await session.flush()
+
+    await session.commit()
+    return session
+
+
 @pytest.fixture
 async def db_with_friendship_request_from_another_user(db_with_two_accounts):  # pylint: disable=redefined-outer-name
     session = db_with_two_accounts
@@ -141,6 +158,33 @@ async def db_with_three_accounts_and_three_friendship_requests(
     return session
 
 
+@pytest.fixture
+async def db_with_three_accounts_and_four_friendship_requests(
+    db_with_two_accounts,  # pylint: disable=redefined-outer-name
+):
+    session = db_with_two_accounts
+
+    account = Account(
+        id=Id(3),
+        email=AccountEmail("john.bloggs@mail.com"),
+        login=AccountLogin("john_bloggs"),
+    )
+    session.add(account)
+    await session.flush()
+
+    friendship_requests = [
+        FriendshipRequest(id=Id(1), sender_id=Id(2), receiver_id=Id(1)),
+        FriendshipRequest(id=Id(2), sender_id=Id(3), receiver_id=Id(1)),
+        FriendshipRequest(id=Id(3), sender_id=Id(2), receiver_id=Id(3)),
+        FriendshipRequest(id=Id(4), sender_id=Id(1), receiver_id=Id(2)),
+    ]
+    session.add_all(friendship_requests)
+    await session.flush()
+
+    await session.commit()
+    return session
+
+
 @pytest.fixture
 async def db_with_two_friendships(db_with_two_accounts):  # pylint: disable=redefined-outer-name
     session = db_with_two_accounts
@@ -162,6 +206,34 @@ async def db_with_two_friendships(db_with_two_accounts):  # pylint: disable=rede
     return session
 
 
+@pytest.fixture
+async def db_with_friends_of_friends(db_with_two_accounts):  # pylint: disable=redefined-outer-name
+    session = db_with_two_accounts
+
+    accounts = [
+        Account(
+            id=Id(account_id),
+            email=AccountEmail(f"john.doe.{account_id}@mail.com"),
+            login=AccountLogin(f"john_doe_{account_id}"),
+        )
+        for account_id in (3, 4, 5)
+    ]
+    session.add_all(accounts)
+    await session.flush()
+
+    # account 1 is friend of 2 and 3, account 4 is friend of 2 and 3, account 5 is friend of 2 only
+    friendships = [
+        Friendship(account_id=Id(account_id), friend_id=Id(friend_id))
+        for pair in ((1, 2), (1, 3), (2, 4), (3, 4), (2, 5))
+        for account_id, friend_id in (pair, pair[::-1])
+    ]
+    session.add_all(friendships)
+    await session.flush()
+
+    await session.commit()
+    return session
+
+
 @pytest.fixture
 async def access_token():
     payload = {
@@ -81,3 +81,23 @@ async def test_accept_friendship_request_with_friendship_request_from_another_us
         "description": "Requested action not allowed.",
         "details": "Provided tokens or credentials don't grant you enough access rights.",
     }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "access_token": "access_token",
+    "api": "api",
+    "db": "db_with_friendship_request_from_another_user",
+})
+async def test_accept_friendship_request_twice_raises_correct_exception(f):
+    await f.api.friendship.accept_friendship_request(request_id=Id(1), token=f.access_token)
+
+    with pytest.raises(httpx.HTTPError) as exc_info:
+        await f.api.friendship.accept_friendship_request(request_id=Id(1), token=f.access_token)
+
+    assert exc_info.value.response.status_code == 404
+    assert exc_info.value.response.json() == {
+        "description": "Requested resource not found.",
+        "details": "Requested resource doesn't exist or has been deleted.",
+        "resource": "Friendship request",
+    }
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+from wlss.shared.types import Id
+
+from api.friendship.dtos import FriendshipRequestsBatchResponse
+from api.friendship.enums import BatchResult
+from src.friendship.models import FriendshipRequest
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "access_token": "access_token",
+    "api": "api",
+    "db": "db_with_three_accounts_and_four_friendship_requests",
+})
+async def test_cancel_friendship_requests_returns_correct_response(f):
+    result = await f.api.friendship.cancel_friendship_requests(
+        request_ids=[Id(4), Id(1), Id(999)],
+        token=f.access_token,
+    )
+
+    assert isinstance(result, FriendshipRequestsBatchResponse)
+    assert result.model_dump() == {
+        "results": [
+            {"request_id": 4, "result": BatchResult.DONE},
+            {"request_id": 1, "result": BatchResult.NOT_ALLOWED},
+            {"request_id": 999, "result": BatchResult.NOT_FOUND},
+        ],
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "access_token": "access_token",
+    "api": "api",
+    "db": "db_with_three_accounts_and_four_friendship_requests",
+})
+async def test_cancel_friendship_requests_deletes_objects_from_db_correctly(f):
+    result = await f.api.friendship.cancel_friendship_requests(  # noqa: F841
+        request_ids=[Id(4), Id(1), Id(999)],
+        token=f.access_token,
+    )
+
+    request_ids = (await f.db.execute(select(FriendshipRequest.id).order_by(FriendshipRequest.id))).scalars().all()
+    assert [request_id.value for request_id in request_ids] == [1, 2, 3]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_one_friendship_request"})
+async def test_cancel_friendship_requests_without_ids_returns_empty_results(f):
+    result = await f.api.friendship.cancel_friendship_requests(request_ids=[], token=f.access_token)
+
+    assert result.model_dump() == {"results": []}
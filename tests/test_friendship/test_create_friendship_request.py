@@ -9,7 +9,7 @@ from wlss.shared.types import Id
 
 from api.friendship.dtos import CreateFriendshipRequestRequest, CreateFriendshipRequestResponse
 from api.friendship.enums import FriendshipRequestStatus
-from src.friendship.models import FriendshipRequest
+from src.friendship.models import Friendship, FriendshipRequest
 from src.shared.database import Base
 from tests.utils.dirty_equals import IsId, IsIdSerialized, IsUtcDatetime, IsUtcDatetimeSerialized
 from tests.utils.mocks.models import __eq__
@@ -55,6 +55,66 @@ async def test_create_friendship_request_creates_objects_in_db_correctly(f):
         ]
 
 
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "access_token": "access_token", "db": "db_with_one_rejected_friendship_request"})
+async def test_create_friendship_request_resends_rejected_request(f):
+    result = await f.api.friendship.create_friendship_request(
+        request_data=CreateFriendshipRequestRequest.model_validate({"receiver_id": 2, "sender_id": 1}),
+        token=f.access_token,
+    )
+
+    assert result.model_dump() == {
+        "id": 1,
+        "created_at": IsUtcDatetimeSerialized,
+        "receiver_id": 2,
+        "sender_id": 1,
+        "status": FriendshipRequestStatus.PENDING,
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_friendship_request_from_another_user",
+})
+async def test_create_friendship_request_with_reverse_pending_request_accepts_it(f):
+    result = await f.api.friendship.create_friendship_request(
+        request_data=CreateFriendshipRequestRequest.model_validate({"receiver_id": 2, "sender_id": 1}),
+        token=f.access_token,
+    )
+
+    assert result.model_dump() == {
+        "id": 1,
+        "created_at": IsUtcDatetimeSerialized,
+        "receiver_id": 1,
+        "sender_id": 2,
+        "status": FriendshipRequestStatus.ACCEPTED,
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_friendship_request_from_another_user",
+})
+async def test_create_friendship_request_with_reverse_pending_request_creates_friendships_in_db(f):
+    result = await f.api.friendship.create_friendship_request(  # noqa: F841
+        request_data=CreateFriendshipRequestRequest.model_validate({"receiver_id": 2, "sender_id": 1}),
+        token=f.access_token,
+    )
+
+    with patch.object(Base, "__eq__", __eq__):
+        friendships = (await f.db.execute(select(Friendship).order_by(Friendship.account_id))).scalars().all()
+        assert friendships == [
+            Friendship(account_id=Id(1), friend_id=Id(2), created_at=IsUtcDatetime, updated_at=IsUtcDatetime),
+            Friendship(account_id=Id(2), friend_id=Id(1), created_at=IsUtcDatetime, updated_at=IsUtcDatetime),
+        ]
+    friendship_requests = (await f.db.execute(select(FriendshipRequest))).scalars().all()
+    assert friendship_requests == []
+
+
 @pytest.mark.anyio
 @pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_one_friendship_request"})
 async def test_create_friendship_request_for_different_account_ids_in_query_and_token_raises_correct_exception(f):
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import delete
+from wlss.shared.types import Id
+
+from src.account.models import Account
+from src.friendship.cache import friends_cache, FriendsCache
+from src.friendship.models import Friendship, FriendshipRequest
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_with_two_friendships"})
+async def test_has_friend_reads_friends_from_cache(f):
+    account = await Account.get(f.db, Id(1))
+    await account.has_friend(f.db, Id(2))
+    await f.db.execute(delete(Friendship))
+
+    result = await account.has_friend(f.db, Id(2))
+
+    assert result is True
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_with_two_friendships"})
+async def test_delete_friendships_invalidates_cached_friends(f):
+    account = await Account.get(f.db, Id(1))
+    friend = await Account.get(f.db, Id(2))
+    await account.has_friend(f.db, Id(2))
+    await friend.has_friend(f.db, Id(1))
+
+    await account.delete_friendships(f.db, Id(2))
+
+    assert await account.has_friend(f.db, Id(2)) is False
+    assert await friend.has_friend(f.db, Id(1)) is False
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_with_one_friendship_request"})
+async def test_accept_friendship_request_invalidates_cached_friends(f):
+    account = await Account.get(f.db, Id(1))
+    friend = await Account.get(f.db, Id(2))
+    await account.has_friend(f.db, Id(2))
+    await friend.has_friend(f.db, Id(1))
+
+    await FriendshipRequest.accept(f.db, Id(1), Id(2))
+
+    assert await account.has_friend(f.db, Id(2)) is True
+    assert await friend.has_friend(f.db, Id(1)) is True
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_with_one_friendship_request"})
+async def test_accept_many_friendship_requests_does_not_invalidate_cache_if_nothing_is_accepted(f):
+    version = friends_cache.version
+
+    await FriendshipRequest.accept_many(f.db, [Id(999)], Id(2))
+
+    assert friends_cache.version == version
+
+
+def test_friends_cache_set_ignores_friends_read_before_invalidation():
+    cache = FriendsCache(max_size=10)
+    version = cache.version
+    cache.invalidate(Id(1))
+
+    cache.set(Id(1), frozenset({2}), version)
+
+    assert cache.get(Id(1)) is None
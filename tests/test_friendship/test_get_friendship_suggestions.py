@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from wlss.shared.types import Id
+
+from api.friendship.dtos import GetFriendshipSuggestionsResponse
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_friends_of_friends"})
+async def test_get_friendship_suggestions_returns_correct_response(f):
+    result = await f.api.friendship.get_friendship_suggestions(account_id=Id(1), token=f.access_token)
+
+    assert isinstance(result, GetFriendshipSuggestionsResponse)
+    assert result.model_dump() == {
+        "suggestions": [
+            {"account_id": 4, "mutual_friends": 2},
+            {"account_id": 5, "mutual_friends": 1},
+        ],
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_friends_of_friends"})
+async def test_get_friendship_suggestions_returns_requested_page(f):
+    result = await f.api.friendship.get_friendship_suggestions(
+        account_id=Id(1),
+        token=f.access_token,
+        limit=1,
+        offset=1,
+    )
+
+    assert result.model_dump() == {"suggestions": [{"account_id": 5, "mutual_friends": 1}]}
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_two_friendships"})
+async def test_get_friendship_suggestions_without_friends_of_friends_returns_empty_list(f):
+    result = await f.api.friendship.get_friendship_suggestions(account_id=Id(1), token=f.access_token)
+
+    assert result.model_dump() == {"suggestions": []}
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_friends_of_friends"})
+async def test_get_friendship_suggestions_for_another_account_raises_correct_exception(f):
+    with pytest.raises(httpx.HTTPError) as exc_info:
+        await f.api.friendship.get_friendship_suggestions(account_id=Id(2), token=f.access_token)
+
+    assert exc_info.value.response.status_code == 403
+    assert exc_info.value.response.json() == {
+        "action": "Get friendship suggestions.",
+        "description": "Requested action not allowed.",
+        "details": "Provided tokens or credentials don't grant you enough access rights.",
+    }
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from wlss.shared.types import Id
+
+from api.friendship.dtos import GetMutualFriendsResponse
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_friends_of_friends"})
+async def test_get_mutual_friends_returns_correct_response(f):
+    result = await f.api.friendship.get_mutual_friends(account_id=Id(1), other_id=Id(4), token=f.access_token)
+
+    assert isinstance(result, GetMutualFriendsResponse)
+    assert result.model_dump() == {"account_ids": [2, 3], "count": 2}
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_friends_of_friends"})
+async def test_get_mutual_friends_returns_requested_page(f):
+    result = await f.api.friendship.get_mutual_friends(
+        account_id=Id(1),
+        other_id=Id(4),
+        token=f.access_token,
+        limit=1,
+        offset=1,
+    )
+
+    assert result.model_dump() == {"account_ids": [3], "count": 2}
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_friends_of_friends"})
+async def test_get_mutual_friends_returns_count_for_page_out_of_range(f):
+    result = await f.api.friendship.get_mutual_friends(
+        account_id=Id(1),
+        other_id=Id(4),
+        token=f.access_token,
+        offset=10,
+    )
+
+    assert result.model_dump() == {"account_ids": [], "count": 2}
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_two_friendships"})
+async def test_get_mutual_friends_without_mutual_friends_returns_empty_list(f):
+    result = await f.api.friendship.get_mutual_friends(account_id=Id(1), other_id=Id(2), token=f.access_token)
+
+    assert result.model_dump() == {"account_ids": [], "count": 0}
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_two_friendships"})
+async def test_get_mutual_friends_with_non_existent_account_raises_correct_exception(f):
+    with pytest.raises(httpx.HTTPError) as exc_info:
+        await f.api.friendship.get_mutual_friends(account_id=Id(1), other_id=Id(999), token=f.access_token)
+
+    assert exc_info.value.response.status_code == 404
+    assert exc_info.value.response.json() == {
+        "description": "Requested resource not found.",
+        "details": "Requested resource doesn't exist or has been deleted.",
+        "resource": "Account",
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_two_friendships"})
+async def test_get_mutual_friends_of_non_existent_account_raises_correct_exception(f):
+    with pytest.raises(httpx.HTTPError) as exc_info:
+        await f.api.friendship.get_mutual_friends(account_id=Id(999), other_id=Id(1), token=f.access_token)
+
+    assert exc_info.value.response.status_code == 404
+    assert exc_info.value.response.json() == {
+        "description": "Requested resource not found.",
+        "details": "Requested resource doesn't exist or has been deleted.",
+        "resource": "Account",
+    }
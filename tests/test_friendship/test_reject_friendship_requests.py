@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+from wlss.shared.types import Id
+
+from api.friendship.dtos import FriendshipRequestsBatchResponse
+from api.friendship.enums import BatchResult, FriendshipRequestStatus
+from src.friendship.models import FriendshipRequest
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "access_token": "access_token",
+    "api": "api",
+    "db": "db_with_three_accounts_and_four_friendship_requests",
+})
+async def test_reject_friendship_requests_returns_correct_response(f):
+    result = await f.api.friendship.reject_friendship_requests(
+        request_ids=[Id(1), Id(2), Id(3), Id(999)],
+        token=f.access_token,
+    )
+
+    assert isinstance(result, FriendshipRequestsBatchResponse)
+    assert result.model_dump() == {
+        "results": [
+            {"request_id": 1, "result": BatchResult.DONE},
+            {"request_id": 2, "result": BatchResult.DONE},
+            {"request_id": 3, "result": BatchResult.NOT_ALLOWED},
+            {"request_id": 999, "result": BatchResult.NOT_FOUND},
+        ],
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "access_token": "access_token",
+    "api": "api",
+    "db": "db_with_three_accounts_and_four_friendship_requests",
+})
+async def test_reject_friendship_requests_updates_objects_in_db_correctly(f):
+    result = await f.api.friendship.reject_friendship_requests(  # noqa: F841
+        request_ids=[Id(1), Id(2), Id(3), Id(999)],
+        token=f.access_token,
+    )
+
+    rows = (
+        await f.db.execute(select(FriendshipRequest.id, FriendshipRequest.status).order_by(FriendshipRequest.id))
+    ).all()
+    assert [(row.id.value, row.status) for row in rows] == [
+        (1, FriendshipRequestStatus.REJECTED),
+        (2, FriendshipRequestStatus.REJECTED),
+        (3, FriendshipRequestStatus.PENDING),
+        (4, FriendshipRequestStatus.PENDING),
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_one_friendship_request"})
+async def test_reject_friendship_requests_without_ids_returns_empty_results(f):
+    result = await f.api.friendship.reject_friendship_requests(request_ids=[], token=f.access_token)
+
+    assert result.model_dump() == {"results": []}
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api"})
+async def test_get_metrics_returns_metrics_in_prometheus_format(f):
+    await f.api.health.get_health()
+
+    result = await f.api.health.get_metrics()
+
+    assert "# TYPE http_request_duration_seconds histogram" in result
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in result
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api"})
+async def test_get_metrics_reports_database_pool_and_password_hashing_metrics(f):
+    result = await f.api.health.get_metrics()
+
+    assert "# TYPE db_pool_checkout_duration_seconds histogram" in result
+    assert "# TYPE db_pool_connections_in_use gauge" in result
+    assert "# TYPE bcrypt_queue_depth gauge" in result
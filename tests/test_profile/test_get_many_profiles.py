@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+from wlss.shared.types import Id
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "access_token": "access_token", "db": "db_with_three_profiles"})
+async def test_get_many_profiles_sends_request_per_batch_of_accounts(f):
+    # requests are sent one by one, since all of them share the same test database session
+    result = [
+        response.model_dump()
+        async for response in f.api.profile.get_many_profiles(
+            account_ids=[Id(1), Id(2), Id(3)],
+            token=f.access_token,
+            batch_size=2,
+            concurrency=1,
+        )
+    ]
+
+    assert sorted(result, key=lambda response: len(response["profiles"])) == [
+        {
+            "profiles": [
+                {"account_id": 3, "avatar_id": None, "description": None, "name": "John Bloggs"},
+            ],
+        },
+        {
+            "profiles": [
+                {"account_id": 1, "avatar_id": None, "description": None, "name": "John Doe"},
+                {"account_id": 2, "avatar_id": None, "description": None, "name": "John Smith"},
+            ],
+        },
+    ]
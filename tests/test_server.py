@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+
+from gunicorn.glogging import Logger
+
+from src.app import app
+from src.server import get_default_workers, get_options, Server, Worker
+
+
+def test_get_default_workers_returns_number_of_available_cpus():
+    result = get_default_workers()
+
+    assert result == len(os.sched_getaffinity(0))
+
+
+def test_worker_runs_uvicorn_with_uvloop_and_httptools():
+    server = Server(get_options("127.0.0.1:8000", workers=1, max_requests=1000, graceful_timeout=10))
+    worker = Worker(
+        age=1,
+        ppid=os.getpid(),
+        sockets=[],
+        app=server,
+        timeout=server.cfg.timeout,
+        cfg=server.cfg,
+        log=Logger(server.cfg),
+    )
+
+    result = worker.config
+
+    assert result.loop == "uvloop"
+    assert result.http == "httptools"
+
+
+def test_server_preloads_app_with_given_options():
+    server = Server(get_options("127.0.0.1:8000", workers=3, max_requests=1000, graceful_timeout=10))
+
+    result = server.load()
+
+    assert result is app
+    assert server.cfg.bind == ["127.0.0.1:8000"]
+    assert server.cfg.workers == 3
+    assert server.cfg.max_requests == 1000
+    assert server.cfg.max_requests_jitter == 100
+    assert server.cfg.graceful_timeout == 10
+    assert server.cfg.preload_app is True
+    assert server.cfg.worker_class is Worker
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from src.shared.bloom import BloomFilter
+
+
+def test_bloom_filter_contains_all_added_values():
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom_filter.add(f"value_{index}")
+
+    result = [f"value_{index}" in bloom_filter for index in range(1000)]
+
+    assert all(result)
+
+
+def test_bloom_filter_has_few_false_positives_within_capacity():
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom_filter.add(f"value_{index}")
+
+    result = sum(f"missing_{index}" in bloom_filter for index in range(10000))
+
+    assert result < 300
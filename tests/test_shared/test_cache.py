@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from src.shared.cache import ExpiringLruCache
+
+
+def test_expiring_lru_cache_returns_value_until_it_is_expired():
+    cache = ExpiringLruCache[str, int](max_size=10)
+    cache.set("valid", 1, datetime.now(tz=timezone.utc) + timedelta(minutes=1))
+    cache.set("expired", 2, datetime.now(tz=timezone.utc) - timedelta(minutes=1))
+
+    result = [cache.get("valid"), cache.get("expired"), cache.get("missing")]
+
+    assert result == [1, None, None]
+    assert len(cache) == 1
+
+
+def test_expiring_lru_cache_evicts_least_recently_used_value():
+    expires_at = datetime.now(tz=timezone.utc) + timedelta(minutes=1)
+    cache = ExpiringLruCache[str, int](max_size=2)
+    cache.set("a", 1, expires_at)
+    cache.set("b", 2, expires_at)
+    cache.get("a")
+
+    cache.set("c", 3, expires_at)
+
+    assert [cache.get("a"), cache.get("b"), cache.get("c")] == [1, None, 3]
+
+
+def test_expiring_lru_cache_clear_removes_all_values():
+    cache = ExpiringLruCache[str, int](max_size=2)
+    cache.set("a", 1, datetime.now(tz=timezone.utc) + timedelta(minutes=1))
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_expiring_lru_cache_delete_removes_value():
+    cache = ExpiringLruCache[str, int](max_size=2)
+    cache.set("a", 1, datetime.now(tz=timezone.utc) + timedelta(minutes=1))
+
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
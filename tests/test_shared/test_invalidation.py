@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from wlss.shared.types import Id
+
+from src.auth.models import RevokedSession
+from src.auth.revocation import revoked_sessions
+from src.friendship.cache import friends_cache, invalidate_friends
+from src.shared.database import POSTGRES_CONNECTION_URL
+from src.shared.invalidation import (
+    dispatch_sent_events,
+    Entity,
+    invalidation_bus,
+    InvalidationBus,
+    InvalidationEvent,
+    publish,
+    send_events,
+)
+from tests.utils.invalidation import get_published_events, receive_events
+
+
+def test_dispatch_calls_handlers_of_event_entity_only():
+    bus = InvalidationBus()
+    friendship_keys, wish_keys = [], []
+    bus.subscribe(Entity.FRIENDSHIP, friendship_keys.extend)
+    bus.subscribe(Entity.WISH, wish_keys.extend)
+
+    bus.dispatch(InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["1", "2"]).model_dump_json())
+
+    assert friendship_keys == ["1", "2"]
+    assert wish_keys == []
+
+
+def test_reset_calls_reset_of_each_subscriber():
+    bus = InvalidationBus()
+    resets = []
+    bus.subscribe(Entity.FRIENDSHIP, lambda _: None, reset=lambda: resets.append(Entity.FRIENDSHIP))
+    bus.subscribe(Entity.SESSION, lambda _: None)
+    bus.subscribe(Entity.WISH, lambda _: None, reset=lambda: resets.append(Entity.WISH))
+
+    bus.reset()
+
+    assert resets == [Entity.FRIENDSHIP, Entity.WISH]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty", "max_queries": "max_queries"})
+async def test_send_events_sends_all_published_events_with_single_query(f):
+    publish(f.db, InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["1", "2"]))
+    publish(f.db, InvalidationEvent(entity=Entity.SESSION, keys=["b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"]))
+
+    with f.max_queries(1):
+        await send_events(f.db)
+
+    assert get_published_events(f.db) == []
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty", "max_queries": "max_queries"})
+async def test_send_events_without_published_events_does_nothing(f):
+    with f.max_queries(0):
+        result = await send_events(f.db)  # noqa: F841
+
+
+@pytest.mark.anyio
+async def test_sent_events_are_received_once_transaction_is_committed():
+    engine = create_async_engine(POSTGRES_CONNECTION_URL)
+    committed_event = InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["1", "2"])
+    rolled_back_event = InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["3", "4"])
+
+    async with receive_events() as events:
+        async with AsyncSession(engine) as session:
+            publish(session, committed_event)
+            await send_events(session)
+            await session.commit()
+        async with AsyncSession(engine) as session:
+            publish(session, rolled_back_event)
+            await send_events(session)
+            await session.rollback()
+    await engine.dispose()
+
+    assert events == [committed_event]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_invalidate_friends_publishes_friendship_event(f):
+    invalidate_friends(f.db, Id(1), Id(2))
+
+    result = get_published_events(f.db)
+
+    assert result == [InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["1", "2"])]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_create_many_revoked_sessions_publishes_session_event(f):
+    await RevokedSession.create_many(f.db, [UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec")])
+
+    result = get_published_events(f.db)
+
+    assert result == [InvalidationEvent(entity=Entity.SESSION, keys=["b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"])]
+
+
+def test_friendship_event_invalidates_cached_friends():
+    friends_cache.set(Id(1), frozenset({2}), friends_cache.version)
+    friends_cache.set(Id(3), frozenset({4}), friends_cache.version)
+
+    invalidation_bus.dispatch(InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["1", "2"]).model_dump_json())
+
+    assert friends_cache.get(Id(1)) is None
+    assert friends_cache.get(Id(3)) == frozenset({4})
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_dispatch_sent_events_invalidates_friends_cached_before_commit(f):
+    invalidate_friends(f.db, Id(1), Id(2))
+    friends_cache.set(Id(1), frozenset(), friends_cache.version)  # read by concurrent request before the commit
+    await send_events(f.db)
+
+    dispatch_sent_events(f.db)
+
+    assert friends_cache.get(Id(1)) is None
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_dispatch_sent_events_without_sent_events_does_nothing(f):
+    publish(f.db, InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["1"]))
+
+    dispatch_sent_events(f.db)
+
+    assert get_published_events(f.db) == [InvalidationEvent(entity=Entity.FRIENDSHIP, keys=["1"])]
+
+
+def test_reset_of_invalidation_bus_clears_cached_friends():
+    friends_cache.set(Id(1), frozenset({2}), friends_cache.version)
+
+    invalidation_bus.reset()
+
+    assert friends_cache.get(Id(1)) is None
+
+
+def test_session_event_revokes_session():
+    # session id is not used by other tests, since revoked sessions are kept in memory between tests
+    session_id = UUID("5a0b4a2e-3f4c-4e58-9d8a-0c8a6f1b7e21")
+
+    invalidation_bus.dispatch(InvalidationEvent(entity=Entity.SESSION, keys=[str(session_id)]).model_dump_json())
+
+    assert revoked_sessions.is_revoked(session_id)
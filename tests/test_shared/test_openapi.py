@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.app import app
+from src.shared.openapi import build_openapi, load_openapi
+
+
+def test_build_openapi_writes_openapi_schema_of_the_app(tmp_path):
+    path = tmp_path / "openapi.json"
+
+    build_openapi(app, str(path))
+
+    assert json.loads(path.read_text()) == app.openapi()
+
+
+@pytest.mark.anyio
+async def test_load_openapi_makes_app_serve_prebuilt_schema(tmp_path):
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps({"openapi": "3.1.0", "info": {"title": "Prebuilt", "version": "0.1.0"}, "paths": {}}))
+    other_app = FastAPI()
+
+    load_openapi(other_app, str(path))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=other_app), base_url="http://") as client:
+        result = await client.get("/openapi.json")
+    assert result.json() == {"openapi": "3.1.0", "info": {"title": "Prebuilt", "version": "0.1.0"}, "paths": {}}
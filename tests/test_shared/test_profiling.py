@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from src.shared.profiling import collect_query_statistics, QueryStatisticsMiddleware
+
+
+async def _app_with_repeated_queries(scope, receive, send):
+    with collect_query_statistics() as statistics:
+        statistics.count = 3
+        statistics.duration = 0.5
+        statistics.rows = 6
+        statistics.statements["SELECT * FROM wish WHERE wish.id = $1"] = 3
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+@pytest.mark.anyio
+async def test_query_statistics_middleware_adds_server_timing_header():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    middleware = QueryStatisticsMiddleware(_app_with_repeated_queries)
+
+    await middleware({"type": "http", "method": "GET", "path": "/"}, None, send)
+
+    assert messages[0]["headers"] == [(b"server-timing", b'db;dur=500.00;desc="3 queries, 6 rows"')]
+
+
+@pytest.mark.anyio
+async def test_query_statistics_middleware_warns_about_repeated_statements(caplog):
+    async def send(_):
+        pass
+
+    middleware = QueryStatisticsMiddleware(_app_with_repeated_queries)
+
+    with caplog.at_level(logging.INFO, logger="src.shared.profiling"):
+        await middleware({"type": "http", "method": "GET", "path": "/"}, None, send)
+
+    assert [record.levelname for record in caplog.records] == ["INFO", "WARNING"]
+    assert caplog.records[1].statement == "SELECT * FROM wish WHERE wish.id = $1"
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import types
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.shared.tracing import (
+    FileSpanExporter,
+    instrument_class,
+    instrument_engine,
+    instrument_module,
+    parse_traceparent,
+    start_span,
+    start_trace,
+    traced,
+    TracingMiddleware,
+)
+
+
+def _read_spans(path):
+    spans = []
+    for line in path.read_text().splitlines():
+        for resource_spans in json.loads(line)["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                spans.extend(scope_spans["spans"])
+    return spans
+
+
+def test_parse_traceparent_returns_trace_id_and_parent_span_id():
+    result = parse_traceparent("00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01")
+
+    assert result == ("0af7651916cd43dd8448eb211c80319c", "b7ad6b7169203331")
+
+
+def test_parse_traceparent_ignores_missing_or_invalid_header():
+    result = [
+        parse_traceparent(None),
+        parse_traceparent("garbage"),
+        parse_traceparent("00-00000000000000000000000000000000-b7ad6b7169203331-01"),
+        parse_traceparent("00-0af7651916cd43dd8448eb211c80319c-0000000000000000-01"),
+    ]
+
+    assert result == [None, None, None, None]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"tmp_path": "tmp_path"})
+async def test_tracing_middleware_continues_callers_trace(f):
+    messages = []
+
+    async def app(scope, receive, send):
+        scope["route"] = types.SimpleNamespace(path="/accounts/{account_id}")
+        traced(lambda: None, "sync function")()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        messages.append(message)
+
+    middleware = TracingMiddleware(traced(app, "async function"))
+    headers = [(b"traceparent", b"00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01")]
+
+    with patch("src.shared.tracing.exporter", FileSpanExporter(f.tmp_path / "traces.jsonl")):
+        await middleware({"type": "http", "method": "GET", "path": "/accounts/1", "headers": headers}, None, send)
+
+    spans = _read_spans(f.tmp_path / "traces.jsonl")
+    assert [span["name"] for span in spans] == ["sync function", "async function", "GET /accounts/{account_id}"]
+    assert {span["traceId"] for span in spans} == {"0af7651916cd43dd8448eb211c80319c"}
+    assert spans[0]["parentSpanId"] == spans[1]["spanId"]
+    assert spans[1]["parentSpanId"] == spans[2]["spanId"]
+    assert spans[2]["parentSpanId"] == "b7ad6b7169203331"
+    assert {"key": "http.response.status_code", "value": {"intValue": "200"}} in spans[2]["attributes"]
+    traceresponse = f"00-0af7651916cd43dd8448eb211c80319c-{spans[2]['spanId']}-01".encode()
+    assert messages[0]["headers"] == [(b"traceresponse", traceresponse)]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"tmp_path": "tmp_path"})
+async def test_tracing_middleware_starts_new_trace_and_records_exceptions(f):
+    async def app(scope, receive, send):
+        raise RuntimeError("something went wrong")
+
+    middleware = TracingMiddleware(app)
+
+    with (
+        patch("src.shared.tracing.exporter", FileSpanExporter(f.tmp_path / "traces.jsonl")),
+        pytest.raises(RuntimeError),
+    ):
+        await middleware({"type": "http", "method": "GET", "path": "/unknown", "headers": []}, None, None)
+
+    spans = _read_spans(f.tmp_path / "traces.jsonl")
+    assert len(spans) == 1
+    assert spans[0]["name"] == "GET /unknown"
+    assert "parentSpanId" not in spans[0]
+    assert spans[0]["status"] == {"code": 2, "message": "RuntimeError: something went wrong"}
+
+
+def test_start_trace_drops_finished_spans_if_exporter_is_not_configured():
+    with start_trace("root") as result:
+        pass
+
+    assert result.end_time is not None
+    assert result.trace.finished_spans == [result]
+
+
+def test_start_span_does_nothing_outside_of_trace():
+    with start_span("span") as result:
+        pass
+
+    assert result is None
+
+
+@pytest.mark.fixtures({"tmp_path": "tmp_path"})
+def test_instrument_class_traces_methods_and_keeps_other_attributes(f):
+    class Model:
+        limit = 10
+
+        def __init__(self, value):
+            self.value = value
+
+        def method(self):
+            return self.value
+
+        @staticmethod
+        def static_method():
+            return "static"
+
+        @classmethod
+        def class_method(cls):
+            return cls.limit
+
+        @property
+        def double_value(self):
+            return self.value * 2
+
+    instrument_class(Model, "model")
+
+    with patch("src.shared.tracing.exporter", FileSpanExporter(f.tmp_path / "traces.jsonl")), start_trace("root"):
+        result = [Model(1).method(), Model.static_method(), Model.class_method(), Model(1).double_value]
+
+    assert result == [1, "static", 10, 2]
+    spans = _read_spans(f.tmp_path / "traces.jsonl")
+    assert [span["name"] for span in spans] == ["Model.method", "Model.static_method", "Model.class_method", "root"]
+    assert spans[0]["attributes"] == [{"key": "wlss.layer", "value": {"stringValue": "model"}}]
+
+
+@pytest.mark.fixtures({"tmp_path": "tmp_path"})
+def test_instrument_module_traces_only_functions_defined_in_module(f):
+    module = types.ModuleType("controllers")
+    module.create = lambda: "created"
+    module.create.__module__ = "controllers"
+    module.imported = json.dumps
+    module.constant = 1.5
+
+    instrument_module(module, "controller")
+
+    with patch("src.shared.tracing.exporter", FileSpanExporter(f.tmp_path / "traces.jsonl")):
+        with start_trace("root", debug=True, ratio=0.5):
+            result = [module.create(), module.imported([]), module.constant]
+
+    assert result == ["created", "[]", 1.5]
+    spans = _read_spans(f.tmp_path / "traces.jsonl")
+    assert [span["name"] for span in spans] == ["controllers.create", "root"]
+    assert spans[1]["attributes"] == [
+        {"key": "debug", "value": {"boolValue": True}},
+        {"key": "ratio", "value": {"doubleValue": 0.5}},
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty", "tmp_path": "tmp_path"})
+async def test_instrument_engine_traces_sql_statements_inside_of_trace(f):
+    connection = await f.db.connection()
+    instrument_engine(connection.sync_engine)
+    await f.db.execute(text("SELECT 1"))
+
+    with patch("src.shared.tracing.exporter", FileSpanExporter(f.tmp_path / "traces.jsonl")), start_trace("root"):
+        await f.db.execute(text("SELECT 2"))
+
+    spans = _read_spans(f.tmp_path / "traces.jsonl")
+    assert [span["name"] for span in spans] == ["SELECT", "root"]
+    assert spans[0]["kind"] == 3
+    assert {"key": "db.statement", "value": {"stringValue": "SELECT 2"}} in spans[0]["attributes"]
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty", "tmp_path": "tmp_path"})
+async def test_instrument_engine_traces_failed_sql_statements(f):
+    connection = await f.db.connection()
+    instrument_engine(connection.sync_engine)
+
+    with (
+        patch("src.shared.tracing.exporter", FileSpanExporter(f.tmp_path / "traces.jsonl")),
+        pytest.raises(DBAPIError),
+        start_trace("root"),
+    ):
+        await f.db.execute(text("SELECT 1 / 0"))
+
+    spans = _read_spans(f.tmp_path / "traces.jsonl")
+    assert [span["name"] for span in spans] == ["SELECT", "root"]
+    assert spans[0]["status"]["code"] == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"db": "db_empty"})
+async def test_instrument_engine_ignores_failed_sql_statements_outside_of_trace(f):
+    connection = await f.db.connection()
+    instrument_engine(connection.sync_engine)
+
+    with pytest.raises(DBAPIError):
+        await f.db.execute(text("SELECT 1 / 0"))
+
+    assert "tracing_span" not in connection.sync_connection.info
@@ -16,7 +16,7 @@ from api.shared.datetime import DATETIME_FORMAT
 from src.account.models import Account, PasswordHash
 from src.auth.models import Session
 from src.config import CONFIG
-from src.file.models import File
+from src.file.models import Blob, File
 from src.friendship.models import Friendship
 from src.profile.models import Profile
 from src.wish.models import Wish, WishBooking
@@ -132,6 +132,53 @@ async def db_with_two_files_and_one_wish(db_with_one_wish):  # pylint: disable=r
     return session
 
 
+@pytest.fixture
+async def db_with_one_wish_and_two_files_with_same_content(db_empty):
+    session = db_empty
+
+    hash_value = bcrypt_cached.hashpw(b"qwerty123", salt=b"$2b$12$K4wmY3GEMQFoMvpuFK.GMu")
+    session.add_all([
+        Account(id=Id(1), email=AccountEmail("john.doe@mail.com"), login=AccountLogin("john_doe")),
+        PasswordHash(account_id=Id(1), value=hash_value),
+        Session(id=UUID("b9dd3a32-aee8-4a6b-a519-def9ca30c9ec"), account_id=Id(1)),
+        Blob(
+            digest="da412fa678f3fe990582c4ec8de250ac360c5dcc994908f0ad98d58f47a63652",
+            reference_count=2,
+            size=FileSize(17),
+        ),
+        File(
+            id=UUID("0b928aaa-521f-47ec-8be5-396650e2a187"),
+            blob_digest="da412fa678f3fe990582c4ec8de250ac360c5dcc994908f0ad98d58f47a63652",
+            extension=Extension.PNG,
+            mime_type=MimeType.IMAGE_PNG,
+            name=FileName("image.png"),
+            size=FileSize(17),
+        ),
+        File(
+            id=UUID("4b94605b-f5e1-40b1-b9fc-c635c9529e3e"),
+            blob_digest="da412fa678f3fe990582c4ec8de250ac360c5dcc994908f0ad98d58f47a63652",
+            extension=Extension.PNG,
+            mime_type=MimeType.IMAGE_PNG,
+            name=FileName("new_image.png"),
+            size=FileSize(17),
+        ),
+    ])
+    await session.flush()
+
+    wish = Wish(
+        id=Id(1),
+        account_id=Id(1),
+        avatar_id=UUID("0b928aaa-521f-47ec-8be5-396650e2a187"),
+        description=WishDescription("I'm gonna take my horse to the old town road."),
+        title=WishTitle("Horse"),
+    )
+    session.add(wish)
+    await session.flush()
+
+    await session.commit()
+    return session
+
+
 @pytest.fixture
 async def db_with_one_wish_and_one_file_already_in_use(db_empty):
     session = db_empty
@@ -95,3 +95,22 @@ async def test_create_wish_booking_for_non_friend_account_returns_403_with_corre
         "description": "Requested action not allowed.",
         "details": "Provided tokens or credentials don't grant you enough access rights.",
     }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "access_token": "access_token",
+    "api": "api",
+    "db": "db_with_two_friend_accounts_and_one_wish",
+    "max_queries": "max_queries",
+})
+async def test_create_wish_booking_executes_limited_number_of_queries(f):
+    with f.max_queries(7):
+        result = await f.api.wish.create_wish_booking(
+            account_id=Id(2),
+            wish_id=Id(1),
+            token=f.access_token,
+            request_data=CreateWishBookingRequest.model_validate({"account_id": 1, "wish_id": 1}),
+        )
+
+    assert isinstance(result, CreateWishBookingResponse)
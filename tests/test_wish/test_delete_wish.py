@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 import httpx
 import pytest
 from sqlalchemy import select
 from wlss.shared.types import Id
 
-from src.file.models import File
+from src.file.models import Blob, File
 from src.wish.models import Wish
 
 
@@ -28,6 +30,21 @@ async def test_delete_wish_deletes_objects_from_db_correctly(f):
     assert files == []
 
 
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "api": "api",
+    "access_token": "access_token",
+    "db": "db_with_one_wish_and_two_files_with_same_content",
+})
+async def test_delete_wish_releases_content_of_avatar(f):
+    result = await f.api.wish.delete_wish(account_id=Id(1), wish_id=Id(1), token=f.access_token)  # noqa: F841
+
+    file_ids = (await f.db.execute(select(File.id))).scalars().all()
+    assert file_ids == [UUID("4b94605b-f5e1-40b1-b9fc-c635c9529e3e")]
+    blob = (await f.db.execute(select(Blob))).scalar_one()
+    assert blob.reference_count == 1
+
+
 @pytest.mark.anyio
 @pytest.mark.fixtures({"access_token": "access_token", "api": "api", "db": "db_with_two_accounts_and_one_wish"})
 async def test_delete_wish_with_another_account_raises_correct_exception(f):
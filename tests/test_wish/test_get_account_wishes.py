@@ -48,3 +48,17 @@ async def test_get_account_wishes_from_not_friend_account_raises_correct_excepti
         "description": "Requested action not allowed.",
         "details": "Provided tokens or credentials don't grant you enough access rights.",
     }
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({
+    "access_token": "access_token",
+    "api": "api",
+    "db": "db_with_two_accounts_and_two_wishes",
+    "max_queries": "max_queries",
+})
+async def test_get_account_wishes_executes_limited_number_of_queries(f):
+    with f.max_queries(4):
+        result = await f.api.wish.get_account_wishes(account_id=Id(1), token=f.access_token)
+
+    assert isinstance(result, GetAccountWishesResponse)
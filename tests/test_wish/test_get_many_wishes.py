@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+from wlss.shared.types import Id
+
+from tests.utils.dirty_equals import IsUtcDatetimeSerialized
+
+
+@pytest.mark.anyio
+@pytest.mark.fixtures({"api": "api", "access_token": "access_token", "db": "db_with_two_friend_accounts_and_one_wish"})
+async def test_get_many_wishes_returns_wishes_of_each_account(f):
+    # requests are sent one by one, since all of them share the same test database session
+    result = [
+        (account_id.value, response.model_dump())
+        async for account_id, response in f.api.wish.get_many_wishes(
+            account_ids=[Id(1), Id(2)],
+            token=f.access_token,
+            concurrency=1,
+        )
+    ]
+
+    assert sorted(result) == [
+        (1, {"wishes": []}),
+        (
+            2,
+            {
+                "wishes": [
+                    {
+                        "id": 1,
+                        "account_id": 2,
+                        "avatar_id": "0b928aaa-521f-47ec-8be5-396650e2a187",
+                        "created_at": IsUtcDatetimeSerialized,
+                        "description": "I'm gonna take my horse to the old town road.",
+                        "title": "Horse",
+                    },
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING
+
+import asyncpg
+
+from src.shared.database import POSTGRES_CONNECTION_DSN
+from src.shared.invalidation import CHANNEL, InvalidationEvent
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def get_published_events(session: AsyncSession) -> list[InvalidationEvent]:
+    """Get events which are published in the session, but not sent yet."""
+    return list(session.info.get("invalidation_events", []))
+
+
+@contextlib.asynccontextmanager
+async def receive_events() -> AsyncIterator[list[InvalidationEvent]]:
+    """Collect events which are received by a separate listener connection while the block is executed.
+
+    Events are delivered only when transaction is committed, so sessions of `db_*` fixtures can't be used here.
+    """
+    events: list[InvalidationEvent] = []
+    connection = await asyncpg.connect(POSTGRES_CONNECTION_DSN)
+    await connection.add_listener(
+        CHANNEL,
+        lambda *args: events.append(InvalidationEvent.model_validate_json(args[-1])),
+    )
+    try:
+        yield events
+        await connection.execute("SELECT 1;")  # round trip, so all events sent before are already received
+    finally:
+        await connection.close()